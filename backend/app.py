@@ -1,14 +1,35 @@
-from flask import Flask, request, jsonify, send_from_directory, send_file, make_response
+"""
+Small Business Support API for RegulaEase
+Compliance checklists, skills resources, the compliance chatbot and PDF report exports.
+"""
+
+import time
+
+# Startup timings in /stats are measured from here, before the imports below
+STARTUP_STARTED = time.perf_counter()
+
+from flask import Flask, Response, request, jsonify, send_from_directory, send_file, make_response, stream_with_context
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+import hashlib
 import json
 import os
+import threading
+from contextvars import ContextVar
 from dotenv import load_dotenv
-from bot import ask_compliance_bot
-from pdf_generator import generate_pdf_report  # Restored for local testing
 
-# Load environment variables
+# Load environment variables, before the modules below read their settings from them
 load_dotenv()
 
+from bot import ask_compliance_bot, stream_compliance_bot
+from chat_cache import chat_cache
+from data_store import data_store
+from pdf_batch import BATCH_THREADS, BatchRequestError, parse_batch, stream_batch_zip
+from pdf_cache import make_report_key, pdf_cache
+from pdf_jobs import JobQueueFull, pdf_jobs
+from prerender import PrerenderedBody
+from render_engine import RenderQueueFull, RenderTimeout, render_engine
+
 # Check if we're in production (static files available)
 static_folder = 'static' if os.path.exists('static') else None
 
@@ -21,16 +42,104 @@ else:
     
 CORS(app)  # Enable CORS for frontend integration
 
-# Helper function to load JSON data
-def load_json_file(filename):
-    """Load JSON data from the data directory."""
-    try:
-        with open(f'data/{filename}', 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except FileNotFoundError:
-        return None
-    except json.JSONDecodeError:
-        return None
+# Largest request body accepted (413 beyond it). A report's progress data is a few KB, and render
+# time grows with it, so an oversized body could otherwise hold a PDF worker until it times out
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_REQUEST_BYTES', 1024 * 1024))
+
+# Set by the async (ASGI) serving mode, which talks to Groq before handing /chatbot to Flask
+prefetched_chatbot_reply = ContextVar('prefetched_chatbot_reply', default=None)
+chatbot_stream_deferred = ContextVar('chatbot_stream_deferred', default=False)
+
+CHATBOT_STREAM_ERROR = {
+    'error': 'Chatbot error',
+    'message': 'Sorry, I couldn\'t process your request right now.'
+}
+
+# Browser/edge caching for the data endpoints (seconds)
+DATA_CACHE_MAX_AGE = int(os.environ.get('DATA_CACHE_MAX_AGE', 300))
+DATA_CACHE_STALE_WHILE_REVALIDATE = int(os.environ.get('DATA_CACHE_STALE_WHILE_REVALIDATE', 86400))
+
+def build_cache_control(max_age, stale_while_revalidate):
+    """Build the Cache-Control header sent with checklist and skills responses."""
+    if max_age <= 0:
+        return 'no-cache'  # Always revalidate, but 304s still save the body
+    directives = ['public', f'max-age={max_age}']
+    if stale_while_revalidate > 0:
+        directives.append(f'stale-while-revalidate={stale_while_revalidate}')
+    return ', '.join(directives)
+
+DATA_CACHE_CONTROL = build_cache_control(DATA_CACHE_MAX_AGE, DATA_CACHE_STALE_WHILE_REVALIDATE)
+
+# Reports are rendered by render_engine's worker processes (or in the request thread when
+# PDF_RENDER_WORKERS=0). Either way the PDF stack (fpdf, charts, translations) is loaded on
+# first use, so a cold start woken by /health or /checklist doesn't wait for it;
+# PDF_PREWARM starts the workers (or imports the stack) in the background instead
+PDF_PREWARM = os.environ.get('PDF_PREWARM', 'true').lower() == 'true'
+
+# Startup timings in seconds, reported by /stats so cold starts can be tracked between releases
+startup_metrics = {
+    'app_import': None,     # Importing this module
+    'first_request': None,  # From import until the first request arrived
+    'pdf_prewarm': None     # Background start of the render workers / import of the PDF stack
+}
+_pdf_prewarm_thread = None
+
+def start_pdf_prewarm():
+    """Start the PDF render workers on a background thread once the server is accepting requests."""
+    global _pdf_prewarm_thread
+    if not PDF_PREWARM or _pdf_prewarm_thread is not None:
+        return _pdf_prewarm_thread
+
+    def prewarm():
+        started = time.perf_counter()
+        try:
+            render_engine.start()
+        except Exception as e:
+            print(f"PDF prewarm failed: {e}")
+            return
+        startup_metrics['pdf_prewarm'] = round(time.perf_counter() - started, 4)
+
+    _pdf_prewarm_thread = threading.Thread(target=prewarm, name='pdf-prewarm', daemon=True)
+    _pdf_prewarm_thread.start()
+    return _pdf_prewarm_thread
+
+@app.before_request
+def record_first_request():
+    if startup_metrics['first_request'] is None:
+        startup_metrics['first_request'] = round(time.perf_counter() - STARTUP_STARTED, 4)
+
+# Helper functions for the pre-rendered data responses
+def render_json_body(payload):
+    """Serialize a payload exactly as jsonify would."""
+    return app.json.response(payload).get_data()
+
+def prerender_responses(entry, key_name, items_name):
+    """Render the response body for every key in a dataset, once per dataset version."""
+    return {
+        key: PrerenderedBody(
+            render_json_body({key_name: key, items_name: items}),
+            etag=hashlib.sha1(f'{entry.version}:{key}'.encode('utf-8')).hexdigest()
+        )
+        for key, items in entry.data.items()
+    }
+
+def prerendered_response(body):
+    """Serve a pre-rendered body using the best encoding the client accepts."""
+    encoding, data, etag = body.select(request.accept_encodings)
+    response = make_response(data)
+    response.mimetype = body.mimetype
+    response.vary.add('Accept-Encoding')
+    if encoding != 'identity':
+        response.content_encoding = encoding
+    response.set_etag(etag)
+    return cacheable_response(response)
+
+def cacheable_response(response):
+    """Add caching headers and turn the response into a 304 if the client's copy is current."""
+    if not response.get_etag()[0]:
+        response.add_etag()
+    response.headers['Cache-Control'] = DATA_CACHE_CONTROL
+    return response.make_conditional(request)
 
 @app.route('/checklist', methods=['GET'])
 def get_checklist():
@@ -47,15 +156,16 @@ def get_checklist():
         }), 400
     
     # Load checklist data
-    checklist_data = load_json_file('checklist.json')
+    dataset = data_store.get_entry('checklist.json')
     
-    if checklist_data is None:
+    if dataset is None:
         return jsonify({
             'error': 'Server error',
             'message': 'Could not load checklist data'
         }), 500
     
     # Check if the business type exists
+    checklist_data = dataset.data
     if business_type.lower() not in checklist_data:
         available_types = list(checklist_data.keys())
         return jsonify({
@@ -64,10 +174,18 @@ def get_checklist():
             'available_types': available_types
         }), 400
     
-    return jsonify({
+    # The response echoes the requested type, so only the canonical spelling is pre-rendered
+    if business_type == business_type.lower():
+        responses = data_store.derive(
+            dataset, 'responses',
+            lambda entry: prerender_responses(entry, 'business_type', 'checklist')
+        )
+        return prerendered_response(responses[business_type])
+    
+    return cacheable_response(jsonify({
         'business_type': business_type,
         'checklist': checklist_data[business_type.lower()]
-    })
+    }))
 
 @app.route('/skills', methods=['GET'])
 def get_skills():
@@ -84,15 +202,16 @@ def get_skills():
         }), 400
     
     # Load skills data
-    skills_data = load_json_file('skills.json')
+    dataset = data_store.get_entry('skills.json')
     
-    if skills_data is None:
+    if dataset is None:
         return jsonify({
             'error': 'Server error',
             'message': 'Could not load skills data'
         }), 500
     
     # Check if the category exists
+    skills_data = dataset.data
     if category.lower() not in skills_data:
         available_categories = list(skills_data.keys())
         return jsonify({
@@ -101,10 +220,18 @@ def get_skills():
             'available_categories': available_categories
         }), 400
     
-    return jsonify({
+    # The response echoes the requested category, so only the canonical spelling is pre-rendered
+    if category == category.lower():
+        responses = data_store.derive(
+            dataset, 'responses',
+            lambda entry: prerender_responses(entry, 'category', 'resources')
+        )
+        return prerendered_response(responses[category])
+    
+    return cacheable_response(jsonify({
         'category': category,
         'resources': skills_data[category.lower()]
-    })
+    }))
 
 @app.route('/chatbot', methods=['POST'])
 def chatbot():
@@ -118,8 +245,13 @@ def chatbot():
         "conversation_history": [...],  // Optional: Previous conversation messages
         "tone": "professional|casual|friendly",  // Optional: Conversation tone
         "business_type": "retail|services|...",  // Optional: Business type for context
-        "user_preferences": {...}  // Optional: User preferences for personalization
+        "user_preferences": {...},  // Optional: User preferences for personalization
+        "stream": true,  // Optional: Stream the reply as server-sent events (or use ?stream=1)
+        "cache": false  // Optional: Skip the response cache for this message
     }
+    
+    When streaming, each piece of the reply is sent as a `data: {"token": "..."}` event,
+    followed by a final `event: done` carrying the same fields as the JSON response.
     """
     if not request.is_json:
         return jsonify({
@@ -127,20 +259,60 @@ def chatbot():
             'message': 'Request must be JSON'
         }), 400
     
-    data = request.get_json()
+    options, error = parse_chatbot_request(request.get_json(), request.args)
+    if error:
+        return jsonify(error), 400
+    
+    if options['stream']:
+        # In async mode the ASGI layer relays the tokens itself; Flask only supplies the headers
+        events = iter(()) if chatbot_stream_deferred.get() else chatbot_event_stream(options)
+        return Response(
+            events,
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    
+    # Call the enhanced compliance bot, unless the async layer already has the reply
+    try:
+        response = prefetched_chatbot_reply.get()
+        if response is None:
+            response = ask_compliance_bot(
+                options['message'],
+                conversation_history=options['conversation_history'],
+                tone=options['tone'],
+                business_type=options['business_type'],
+                user_preferences=options['user_preferences'],
+                use_cache=options['use_cache']
+            )
+        
+        return jsonify(chatbot_response_body(options, response))
+    except Exception as e:
+        print(f"Chatbot error: {e}")
+        return jsonify({
+            'error': 'Chatbot error',
+            'message': 'Sorry, I couldn\'t process your request right now.'
+        }), 500
+
+def parse_chatbot_request(data, args):
+    """
+    Validate a chatbot request body and fill in defaults for the optional parameters.
+    
+    Returns:
+        tuple: (options, None) for a valid request, or (None, error body) for a 400
+    """
     message = data.get('message')
     
     if not message:
-        return jsonify({
+        return None, {
             'error': 'Message is required',
             'message': 'Please provide a message in the request body'
-        }), 400
+        }
     
     if not isinstance(message, str) or not message.strip():
-        return jsonify({
+        return None, {
             'error': 'Invalid message',
             'message': 'Message must be a non-empty string'
-        }), 400
+        }
     
     # Extract optional parameters
     conversation_history = data.get('conversation_history', [])
@@ -157,31 +329,53 @@ def chatbot():
     if conversation_history and not isinstance(conversation_history, list):
         conversation_history = []
     
-    # Call the enhanced compliance bot
+    return {
+        'message': message.strip(),
+        'conversation_history': conversation_history,
+        'tone': tone,
+        'business_type': business_type,
+        'user_preferences': user_preferences,
+        'use_cache': data.get('cache') is not False,
+        'stream': data.get('stream') is True or args.get('stream') == '1'
+    }, None
+
+def chatbot_response_body(options, reply):
+    """The JSON body of a chatbot reply (also sent as the final event when streaming)."""
+    return {
+        'user_message': options['message'],
+        'bot_response': reply,
+        'context': {
+            'tone': options['tone'],
+            'business_type': options['business_type'],
+            'conversation_length': len(options['conversation_history'])
+        }
+    }
+
+def format_sse(data, event=None):
+    """Format a payload as a server-sent event."""
+    frame = f'event: {event}\n' if event else ''
+    return f'{frame}data: {json.dumps(data)}\n\n'
+
+def chatbot_event_stream(options):
+    """Relay the chatbot reply as server-sent events, ending with the response metadata."""
+    reply = []
     try:
-        response = ask_compliance_bot(
-            message.strip(),
-            conversation_history=conversation_history,
-            tone=tone,
-            business_type=business_type,
-            user_preferences=user_preferences
-        )
-        
-        return jsonify({
-            'user_message': message.strip(),
-            'bot_response': response,
-            'context': {
-                'tone': tone,
-                'business_type': business_type,
-                'conversation_length': len(conversation_history)
-            }
-        })
+        for token in stream_compliance_bot(
+            options['message'],
+            conversation_history=options['conversation_history'],
+            tone=options['tone'],
+            business_type=options['business_type'],
+            user_preferences=options['user_preferences'],
+            use_cache=options['use_cache']
+        ):
+            reply.append(token)
+            yield format_sse({'token': token})
     except Exception as e:
-        print(f"Chatbot error: {e}")
-        return jsonify({
-            'error': 'Chatbot error',
-            'message': 'Sorry, I couldn\'t process your request right now.'
-        }), 500
+        print(f"Chatbot streaming error: {e}")
+        yield format_sse(CHATBOT_STREAM_ERROR, event='error')
+        return
+    
+    yield format_sse(chatbot_response_body(options, ''.join(reply)), event='done')
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -191,6 +385,18 @@ def health_check():
         'message': 'Small Business Support API is running'
     })
 
+@app.route('/stats', methods=['GET'])
+def stats():
+    """Cache counters and startup timings for confirming the server is healthy in production."""
+    return jsonify({
+        'data_store': data_store.stats(),
+        'chatbot_cache': chat_cache.stats(),
+        'pdf_render': render_engine.stats(),
+        'pdf_cache': pdf_cache.stats(),
+        'pdf_jobs': pdf_jobs.stats(),
+        'startup': startup_metrics
+    })
+
 @app.route('/', methods=['GET'])
 def home():
     """Root endpoint - serves React app in production, API info in development."""
@@ -206,7 +412,8 @@ def home():
             'GET /checklist': 'Get compliance checklist by business type',
             'GET /skills': 'Get learning resources by category',
             'POST /chatbot': 'Chat with compliance assistant',
-            'GET /health': 'Health check'
+            'GET /health': 'Health check',
+            'GET /stats': 'Cache statistics'
         }
     })
 
@@ -245,6 +452,7 @@ def catch_all(path):
 def export_pdf():
     """
     Generate PDF report with progress charts and analytics in multiple languages
+    With ?async=1 the report is rendered in the background and a job is returned to poll
     """
     try:
         data = request.json
@@ -252,24 +460,149 @@ def export_pdf():
         progress_data = data.get('progressData', {})
         business_type = data.get('businessType', 'general')
         language = data.get('language', 'en')  # Get language from request (en, af, zu, xh)
+        chart_profile = data.get('chartProfile')  # screen, print or archive (defaults to PDF_CHART_PROFILE)
+        chart_backend = data.get('chartBackend')  # native, png or svg (defaults to PDF_CHART_BACKEND)
+        filename = f'regula-ease-report-{report_type}-{language}.pdf'
+        render_args = (report_type, progress_data, business_type, language, chart_profile, chart_backend)
+        
+        if request.args.get('async') == '1':
+            try:
+                job = pdf_jobs.submit(filename, render_report_for_job, *render_args)
+            except JobQueueFull:
+                return pdf_export_busy_response()
+            body = pdf_job_body(job)
+            return jsonify(body), 202, {'Location': body['status_url']}
         
         # Generate PDF report with specified language
-        pdf_buffer = generate_pdf_report(report_type, progress_data, business_type, language)
+        try:
+            pdf_content = render_report(*render_args)
+        except RenderQueueFull:
+            return pdf_export_busy_response()
+        except RenderTimeout:
+            return jsonify({'error': 'PDF generation timed out'}), 504
         
-        if pdf_buffer:
-            # Create response with PDF
-            response = make_response(pdf_buffer.getvalue())
-            response.headers['Content-Type'] = 'application/pdf'
-            response.headers['Content-Disposition'] = f'attachment; filename=regula-ease-report-{report_type}-{language}.pdf'
-            return response
+        if pdf_content:
+            # Send the rendered bytes as they are (no re-buffering); Content-Length is taken from them
+            return Response(pdf_content, mimetype='application/pdf',
+                            headers={'Content-Disposition': f'attachment; filename={filename}'})
         else:
             return jsonify({'error': 'Failed to generate PDF report'}), 500
             
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         print(f"Error generating PDF: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/export-pdf/batch', methods=['POST'])
+def export_pdf_batch():
+    """
+    Generate several PDF reports in one call, returned as a ZIP with a manifest.json
+    Body: {"reports": [{type, progressData, businessType, language}, ...], "chartProfile", "chartBackend"}
+    """
+    try:
+        try:
+            batch = parse_batch(request.get_json(silent=True))
+        except BatchRequestError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Up to PDF_BATCH_THREADS reports at a time, waiting for free render workers rather than failing.
+        # The ZIP is streamed as reports finish, so failures are reported in its manifest.json
+        return Response(
+            stream_with_context(stream_batch_zip(batch, render_report_for_job, threads=BATCH_THREADS)),
+            mimetype='application/zip',
+            headers={'Content-Disposition': 'attachment; filename=regula-ease-reports.zip'}
+        )
+    
+    except RequestEntityTooLarge:
+        raise
+    except Exception as e:
+        print(f"Error generating PDF batch: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/export-pdf/jobs/<job_id>', methods=['GET'])
+def pdf_job_status(job_id):
+    """Status of a background PDF export"""
+    job, error_response = find_pdf_job(job_id)
+    if error_response:
+        return error_response
+    return jsonify(pdf_job_body(job))
+
+@app.route('/export-pdf/jobs/<job_id>/download', methods=['GET'])
+def pdf_job_download(job_id):
+    """Download the PDF produced by a finished background export"""
+    job, error_response = find_pdf_job(job_id)
+    if error_response:
+        return error_response
+    if job['status'] != 'done':
+        return jsonify({'error': 'PDF not ready', **pdf_job_body(job)}), 409
+    try:
+        return send_file(pdf_jobs.store.result_path(job_id), mimetype='application/pdf',
+                         as_attachment=True, download_name=job['filename'])
+    except FileNotFoundError:
+        return jsonify({'error': 'PDF export not found or expired'}), 404
+
+# Helper functions for PDF export
+def render_report(*render_args, wait=0):
+    """Serve a report from the PDF cache, or render it on the render workers and cache it"""
+    key = make_report_key(*render_args)
+    pdf_content = pdf_cache.get(key)
+    if pdf_content is None:
+        pdf_content = render_engine.render(*render_args, wait=wait)
+        pdf_cache.put(key, pdf_content)
+    return pdf_content
+
+def render_report_for_job(*render_args):
+    """
+    Render a report for a background job or batch, waiting up to the render timeout for room
+    on the render workers. Raises RenderQueueFull if none frees up, which fails the job or batch entry.
+    """
+    return render_report(*render_args, wait=render_engine.timeout)
+
+def pdf_export_busy_response():
+    return jsonify({
+        'error': 'PDF export busy',
+        'message': 'Too many reports are being generated right now. Please try again shortly.'
+    }), 503, {'Retry-After': str(render_engine.retry_after)}
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    return jsonify({'error': 'Request too large', 'max_bytes': app.config['MAX_CONTENT_LENGTH']}), 413
+
+def find_pdf_job(job_id):
+    """Look up a job, returning (job, None) or (None, error response)"""
+    if not pdf_jobs.store.valid_id(job_id):
+        # Checked first, so a made-up id can't pick the instance the proxy replays to
+        return None, (jsonify({'error': 'PDF export not found or expired'}), 404)
+    owner = pdf_jobs.store.owner(job_id)
+    if owner:
+        # The job ran on another Fly machine; ask the proxy to replay the request there
+        return None, (jsonify({'status': 'replaying'}), 409, {'fly-replay': f'instance={owner}'})
+    job = pdf_jobs.store.get(job_id)
+    if job is None:
+        return None, (jsonify({'error': 'PDF export not found or expired'}), 404)
+    return job, None
+
+def pdf_job_body(job):
+    status_url = f"/export-pdf/jobs/{job['job_id']}"
+    body = {
+        'job_id': job['job_id'],
+        'status': job['status'],
+        'status_url': status_url
+    }
+    if job['status'] == 'done':
+        body['download_url'] = f'{status_url}/download'
+        body['size'] = job['size']
+    if job['status'] == 'failed':
+        body['error'] = job['error']
+    return body
+
+# Reported in /stats and by startup_profiler.py
+startup_metrics['app_import'] = round(time.perf_counter() - STARTUP_STARTED, 4)
+
 if __name__ == '__main__':
+    start_pdf_prewarm()
+    
     # Get port from environment variable or use default
     port = int(os.environ.get('PORT', 8080))
     debug = os.environ.get('NODE_ENV') != 'production'
@@ -0,0 +1,268 @@
+"""
+Async (ASGI) entry point for RegulaEase
+Chatbot requests wait on Groq as non-blocking awaitables, so a burst of chat
+users no longer holds worker threads that /checklist, /health and static files
+need. Flask still validates every request and builds every response, and all
+other routes are passed straight to the Flask app on a thread pool.
+
+Run with: uvicorn asgi:application --host 0.0.0.0 --port 8080
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from urllib.parse import parse_qsl
+
+from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+from app import (
+    CHATBOT_STREAM_ERROR,
+    app,
+    chatbot_response_body,
+    chatbot_stream_deferred,
+    format_sse,
+    parse_chatbot_request,
+    prefetched_chatbot_reply,
+    start_pdf_prewarm,
+)
+from bot import ask_compliance_bot_async, stream_compliance_bot_async
+from groq_client import close_async_groq_client
+from render_engine import render_engine
+
+# Chatbot requests waiting on Groq at once; further requests queue for a slot
+CHATBOT_MAX_CONCURRENCY = int(os.environ.get('CHATBOT_MAX_CONCURRENCY', 64))
+# Threads running the synchronous Flask routes
+ASGI_THREADS = int(os.environ.get('ASGI_THREADS', 16))
+
+
+class ThreadPoolWsgiInstance(WsgiToAsgiInstance):
+    """
+    asgiref's per-request WSGI adapter, running the WSGI app on the event loop's thread pool.
+
+    asgiref runs every WSGI call on one shared thread, so a slow route would hold up the rest.
+    Only its environ and start_response handling are reused; the request is read and the app
+    is run here.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            raise ValueError("WSGI wrapper received a non-HTTP scope")
+        self.scope = scope
+        with SpooledTemporaryFile(max_size=65536) as body:
+            while True:
+                message = await receive()
+                if message['type'] != 'http.request':
+                    raise ValueError("WSGI wrapper received a non-HTTP-request message")
+                body.write(message.get('body', b''))
+                if not message.get('more_body'):
+                    break
+            body.seek(0)
+            self.sync_send = async_to_sync(send)
+            await sync_to_async(self.run_wsgi_app_in_thread, thread_sensitive=False)(body)
+
+    def run_wsgi_app_in_thread(self, body):
+        """Run the WSGI app and relay its response (called on a pool thread)"""
+        try:
+            environ = self.build_environ(self.scope, body)
+        except ValueError:
+            # Too many duplicate headers
+            self.sync_send({'type': 'http.response.start', 'status': 400,
+                            'headers': [(b'content-type', b'text/plain')]})
+            self.sync_send({'type': 'http.response.body', 'body': b'Bad Request: Too many duplicate headers'})
+            return
+
+        response = self.wsgi_application(environ, self.start_response)
+        try:
+            bytes_sent = 0
+            for output in response:
+                if not self.response_started:
+                    self.response_started = True
+                    self.sync_send(self.response_start)
+                # Never send more than the Content-Length the app declared
+                if self.response_content_length is not None:
+                    output = output[:self.response_content_length - bytes_sent]
+                self.sync_send({'type': 'http.response.body', 'body': output, 'more_body': True})
+                bytes_sent += len(output)
+                if bytes_sent == self.response_content_length:
+                    break
+        finally:
+            # WSGI requires close(); Flask runs teardown and streamed responses clean up here
+            if hasattr(response, 'close'):
+                response.close()
+        if not self.response_started:
+            self.response_started = True
+            self.sync_send(self.response_start)
+        self.sync_send({'type': 'http.response.body'})
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    async def __call__(self, scope, receive, send):
+        await ThreadPoolWsgiInstance(self.wsgi_application, self.duplicate_header_limit)(
+            scope, receive, send
+        )
+
+
+class RegulaEaseASGI:
+    def __init__(self, wsgi_app, max_concurrency=CHATBOT_MAX_CONCURRENCY, threads=ASGI_THREADS):
+        self.wsgi = ThreadPoolWsgiToAsgi(wsgi_app)
+        self.max_concurrency = max_concurrency
+        self.threads = threads
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        elif scope['type'] == 'http' and scope['method'] == 'POST' and scope['path'] == '/chatbot':
+            await self.chatbot(scope, receive, send)
+        else:
+            await self.wsgi(scope, receive, send)
+
+    @property
+    def semaphore(self):
+        """Concurrency limit for upstream chatbot calls, bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                asyncio.get_running_loop().set_default_executor(
+                    ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='flask')
+                )
+                start_pdf_prewarm()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await close_async_groq_client()
+                await asyncio.get_running_loop().run_in_executor(None, render_engine.shutdown)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def chatbot(self, scope, receive, send):
+        """Answer POST /chatbot, awaiting Groq before Flask renders the response"""
+        body = await read_body(receive)
+        replay = replay_receive(body, receive)
+
+        options = chatbot_options(scope, body)
+        if options is None:
+            # Let Flask produce its usual error response
+            await self.wsgi(scope, replay, send)
+            return
+
+        if options['stream']:
+            await self.stream_chatbot(scope, replay, send, options)
+            return
+
+        async with self.semaphore:
+            reply = await ask_compliance_bot_async(
+                options['message'],
+                conversation_history=options['conversation_history'],
+                tone=options['tone'],
+                business_type=options['business_type'],
+                user_preferences=options['user_preferences'],
+                use_cache=options['use_cache']
+            )
+
+        token = prefetched_chatbot_reply.set(reply)
+        try:
+            await self.wsgi(scope, replay, send)
+        finally:
+            prefetched_chatbot_reply.reset(token)
+
+    async def stream_chatbot(self, scope, receive, send, options):
+        """Relay streamed tokens as server-sent events, using the headers Flask sets for the stream"""
+        messages = []
+
+        async def capture(message):
+            messages.append(message)
+
+        token = chatbot_stream_deferred.set(True)
+        try:
+            await self.wsgi(scope, receive, capture)
+        finally:
+            chatbot_stream_deferred.reset(token)
+
+        start = messages[0]
+        if start['status'] != 200:
+            for message in messages:
+                await send(message)
+            return
+
+        await send(start)
+        async with self.semaphore:
+            reply = []
+            try:
+                async for piece in stream_compliance_bot_async(
+                    options['message'],
+                    conversation_history=options['conversation_history'],
+                    tone=options['tone'],
+                    business_type=options['business_type'],
+                    user_preferences=options['user_preferences'],
+                    use_cache=options['use_cache']
+                ):
+                    reply.append(piece)
+                    await send_body(send, format_sse({'token': piece}), more_body=True)
+                final = format_sse(chatbot_response_body(options, ''.join(reply)), event='done')
+            except Exception as e:
+                print(f"Chatbot streaming error: {e}")
+                final = format_sse(CHATBOT_STREAM_ERROR, event='error')
+        await send_body(send, final, more_body=False)
+
+
+def chatbot_options(scope, body):
+    """Parse a chatbot request the way the Flask route does, returning None if Flask would reject it"""
+    headers = dict(scope['headers'])
+    mimetype = headers.get(b'content-type', b'').split(b';')[0].strip().decode('latin-1').lower()
+    if not (mimetype == 'application/json' or (mimetype.startswith('application/') and mimetype.endswith('+json'))):
+        return None
+
+    try:
+        data = json.loads(body)
+        args = {}
+        for name, value in parse_qsl(scope.get('query_string', b'').decode('latin-1')):
+            args.setdefault(name, value)
+        options, error = parse_chatbot_request(data, args)
+    except Exception:
+        return None
+    return options
+
+
+async def read_body(receive):
+    """Read the full request body"""
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] != 'http.request':
+            break
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            break
+    return b''.join(chunks)
+
+
+def replay_receive(body, receive):
+    """Return a receive callable that delivers an already-read body again"""
+    delivered = False
+
+    async def replay():
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        return await receive()
+
+    return replay
+
+
+async def send_body(send, text, more_body):
+    await send({'type': 'http.response.body', 'body': text.encode('utf-8'), 'more_body': more_body})
+
+
+application = RegulaEaseASGI(app)
@@ -0,0 +1,34 @@
+"""
+Atomic file writes
+The PDF job store, the PDF report cache and the compiled translations are
+shared by every web worker and render process on the machine, so their files
+are written to a temporary file in the same directory and renamed into place.
+Readers see either the old file or the new one, never a partial write.
+"""
+
+import os
+import tempfile
+
+
+def atomic_write(path, data):
+    """
+    Write bytes to a file, replacing it in one step.
+
+    Args:
+        path (str): File to write; its directory must exist
+        data (bytes): New content of the file
+
+    Raises:
+        OSError: If the file can't be written (the temporary file is removed)
+    """
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
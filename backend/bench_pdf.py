@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark for PDF report generation
+Renders the sample report repeatedly and prints the median time and size for
+each chart backend and render profile, then for each report type.
+
+Usage:
+    python bench_pdf.py                  # All backends and profiles, 5 runs each
+    python bench_pdf.py --runs 10 --profile screen --backend svg
+    python bench_pdf.py --chart-cache    # Reuse cached chart images after the first run
+    python bench_pdf.py --report-types   # Only the report type table
+"""
+
+import argparse
+import statistics
+import time
+
+from chart_cache import chart_cache
+from pdf_generator import (
+    CHART_BACKENDS,
+    CHART_PROFILES,
+    MATPLOTLIB_CHART_BACKENDS,
+    REPORT_PLANS,
+    RegulaEasePDFGenerator,
+    generate_pdf_report,
+)
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+
+def measure(function, runs):
+    """Call function `runs` times, returning the median seconds and the last result"""
+    timings = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), result
+
+
+def bench_charts(backends, profiles, runs):
+    print(f"{'backend':<9}{'profile':<10}{'chart ms':>10}{'chart KB':>10}{'report ms':>11}{'report KB':>11}")
+    for backend in backends:
+        # Native charts are drawn into the page, so profiles don't apply and there's no chart file
+        for profile in (profiles if backend in MATPLOTLIB_CHART_BACKENDS else profiles[:1]):
+            chart_columns = f"{'-':>10}{'-':>10}"
+            if backend in MATPLOTLIB_CHART_BACKENDS:
+                generator = RegulaEasePDFGenerator(chart_profile=profile, chart_backend=backend)
+                chart_time, chart = measure(lambda: generator.create_progress_chart(SAMPLE_PROGRESS_DATA), runs)
+                chart_columns = f"{chart_time * 1000:>10.0f}{len(chart.getvalue()) / 1024:>10.0f}"
+            report_time, report = measure(
+                lambda: generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail',
+                                            chart_profile=profile, chart_backend=backend),
+                runs
+            )
+            print(f"{backend:<9}{profile if backend in MATPLOTLIB_CHART_BACKENDS else '-':<10}{chart_columns}"
+                  f"{report_time * 1000:>11.0f}{len(report.getvalue()) / 1024:>11.0f}")
+
+
+def bench_report_types(backends, runs):
+    """Time each report type against the comprehensive report it used to fall back to"""
+    print(f"{'backend':<9}{'report':<15}{'report ms':>11}{'report KB':>11}{'vs full ms':>12}{'vs full KB':>12}")
+    for backend in backends:
+        results = {}
+        for report_type in REPORT_PLANS:
+            results[report_type] = measure(
+                lambda: generate_pdf_report(report_type, SAMPLE_PROGRESS_DATA, 'retail', chart_backend=backend),
+                runs
+            )
+        full_time, full_report = results['comprehensive']
+        full_size = len(full_report.getvalue())
+        for report_type, (report_time, report) in results.items():
+            size = len(report.getvalue())
+            print(f"{backend:<9}{report_type:<15}{report_time * 1000:>11.0f}{size / 1024:>11.0f}"
+                  f"{(report_time / full_time - 1) * 100:>11.0f}%{(size / full_size - 1) * 100:>11.0f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF report generation")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--profile', choices=list(CHART_PROFILES), action='append',
+                        help="Profile to measure (repeatable, default: all)")
+    parser.add_argument('--backend', choices=list(CHART_BACKENDS), action='append',
+                        help="Chart backend to measure (repeatable, default: all)")
+    parser.add_argument('--chart-cache', action='store_true',
+                        help="Keep the chart image cache on (default: off, so every run renders its charts)")
+    parser.add_argument('--report-types', action='store_true',
+                        help="Only measure each report type (checklist, skills, quiz) against the comprehensive one")
+    args = parser.parse_args(argv)
+
+    chart_cache.enabled = args.chart_cache
+
+    # Warm up matplotlib and fonts so the first backend isn't penalised
+    for backend in CHART_BACKENDS:
+        generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend=backend)
+    if not args.report_types:
+        bench_charts(args.backend or list(CHART_BACKENDS), args.profile or list(CHART_PROFILES), args.runs)
+        print()
+    bench_report_types(args.backend or list(CHART_BACKENDS), args.runs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for PDF translation lookups
+Compares walking the nested catalogs on every call (how get_translation used to
+work) with the compiled flat tables used now, for the keys one report looks up.
+
+Usage:
+    python bench_translations.py
+    python bench_translations.py --number 200000
+"""
+
+import argparse
+import timeit
+
+from pdf_generator import RegulaEasePDFGenerator
+from pdf_translations import get_translation, load_catalog
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+
+NESTED_CATALOGS = {language: load_catalog(language) for language in ('en', 'zu')}
+
+
+def nested_lookup(language, key, default=None):
+    """The previous lookup: split dotted keys and walk the nested dicts"""
+    translations = NESTED_CATALOGS.get(language, NESTED_CATALOGS['en'])
+    if '.' in key:
+        value = translations
+        for k in key.split('.'):
+            if isinstance(value, dict) and k in value:
+                value = value[k]
+            else:
+                return default or key
+        return value
+    return translations.get(key, default or key)
+
+
+def report_keys():
+    """The keys a comprehensive report looks up, recorded from a real render"""
+    keys = []
+
+    class RecordingGenerator(RegulaEasePDFGenerator):
+        def t(self, key, default=None):
+            keys.append(key)
+            return super().t(key, default)
+
+    RecordingGenerator(language='zu').generate_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail')
+    return keys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark PDF translation lookups")
+    parser.add_argument('--number', type=int, default=100000, help="Lookups per measurement")
+    args = parser.parse_args(argv)
+
+    keys = report_keys()
+    dotted = [key for key in keys if '.' in key]
+    translations = RegulaEasePDFGenerator(language='zu').translations
+    print(f"A report looks up {len(keys)} keys ({len(dotted)} dotted)")
+
+    cases = [
+        ('plain key', 'report_title'),
+        ('dotted key', 'chart_titles.progress_by_category'),
+    ]
+    # 'table' is the flat dict access t() makes; get_translation adds the catalog lookup
+    print(f"{'lookup':<14}{'nested ns':>11}{'get_translation ns':>20}{'table ns':>10}")
+    for name, key in cases:
+        nested = timeit.timeit(lambda: nested_lookup('zu', key), number=args.number)
+        compiled = timeit.timeit(lambda: get_translation('zu', key), number=args.number)
+        direct = timeit.timeit(lambda: translations.get(key, key), number=args.number)
+        print(f"{name:<14}{nested / args.number * 1e9:>11.0f}{compiled / args.number * 1e9:>20.0f}"
+              f"{direct / args.number * 1e9:>10.0f}")
+
+    runs = max(1, args.number // len(keys))
+    nested = timeit.timeit(lambda: [nested_lookup('zu', key) for key in keys], number=runs)
+    direct = timeit.timeit(lambda: [translations.get(key, key) for key in keys], number=runs)
+    print(f"{'per report':<14}{nested / runs * 1e6:>9.1f}us{'':>20}{direct / runs * 1e6:>8.1f}us")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,19 @@ import requests
 import json
 from datetime import datetime
 from dotenv import load_dotenv
+from chat_cache import chat_cache, make_cache_key
+from groq_client import get_async_groq_client, get_groq_client
 
 # Load environment variables
 load_dotenv()
 
-def ask_compliance_bot(user_question, conversation_history=None, tone="professional", business_type=None, user_preferences=None):
+MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
+FALLBACK_REPLY = "Sorry, I couldn't get a response right now."
+
+class StreamInterrupted(Exception):
+    """The streamed reply failed after part of it had been yielded"""
+
+def ask_compliance_bot(user_question, conversation_history=None, tone="professional", business_type=None, user_preferences=None, client=None, use_cache=True):
     """
     Send a user question to the Groq API with enhanced context and return the assistant's response.
     
@@ -17,64 +25,39 @@ def ask_compliance_bot(user_question, conversation_history=None, tone="professio
         tone (str): Conversation tone - "professional", "casual", or "friendly"
         business_type (str): Type of business for industry-specific responses
         user_preferences (dict): User preferences for personalization
+        client (GroqClient): Client to send the request with (defaults to the shared pooled client)
+        use_cache (bool): Serve and store the reply in the chatbot response cache
         
     Returns:
         str: The assistant's response or an error message
     """
-    # API configuration
-    api_url = "https://api.groq.com/openai/v1/chat/completions"
-    model = "meta-llama/llama-4-scout-17b-16e-instruct"
-    
-    # Enhanced system prompt with South African context
-    system_prompt = _build_system_prompt(tone, business_type, user_preferences)
+    client = client or get_groq_client()
     
     # Get API key from environment variable
-    api_key = os.getenv('GROQ_API_KEY')
+    api_key = _get_api_key()
     if not api_key:
-        print("ERROR: GROQ_API_KEY not found in environment variables")
-        return "Sorry, I couldn't get a response right now."
+        return FALLBACK_REPLY
     
-    # Prepare headers
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+    payload = _build_payload(user_question, conversation_history, tone, business_type, user_preferences)
     
-    # Build conversation messages with context
-    messages = _build_conversation_messages(system_prompt, conversation_history, user_question)
-    
-    # Prepare the request payload with enhanced parameters
-    payload = {
-        "model": model,
-        "messages": messages,
-        "temperature": _get_temperature_by_tone(tone),
-        "max_tokens": 1024,
-        "top_p": 0.9,
-        "frequency_penalty": 0.1,
-        "presence_penalty": 0.1
-    }
+    # Repeated questions are answered from the cache
+    cache_key, cached_reply = _cached_reply(payload, user_question, use_cache)
+    if cached_reply is not None:
+        return cached_reply
     
     try:
         # Debug: Print request info (without API key)
-        print(f"DEBUG: Making request to {api_url}")
-        print(f"DEBUG: Model: {model}")
+        print(f"DEBUG: Making request to {client.chat_completions_url}")
+        print(f"DEBUG: Model: {payload['model']}")
         print(f"DEBUG: Tone: {tone}, Business Type: {business_type}")
-        print(f"DEBUG: Context messages: {len(messages)}")
+        print(f"DEBUG: Context messages: {len(payload['messages'])}")
         
-        # Make the API request
-        response = requests.post(api_url, headers=headers, json=payload, timeout=30)
+        # Make the API request over the pooled keep-alive connection
+        response = client.chat_completions(payload, api_key)
         
         # Check if the request was successful
         if response.status_code == 200:
-            response_data = response.json()
-            # Extract the assistant's message from the response
-            if 'choices' in response_data and len(response_data['choices']) > 0:
-                assistant_reply = response_data['choices'][0]['message']['content']
-                return assistant_reply.strip()
-            else:
-                print("ERROR: No choices in API response")
-                print(f"Response data: {response_data}")
-                return "Sorry, I couldn't get a response right now."
+            return _reply_from_completion(response.json(), cache_key)
         else:
             # Enhanced error debugging
             print(f"Groq API error - Status code: {response.status_code}")
@@ -84,20 +67,284 @@ def ask_compliance_bot(user_question, conversation_history=None, tone="professio
                 print(f"Error response: {error_data}")
             except:
                 print(f"Raw response text: {response.text}")
-            return "Sorry, I couldn't get a response right now."
+            return FALLBACK_REPLY
             
     except requests.exceptions.RequestException as e:
         # Handle network errors, timeouts, etc.
         print(f"Request error: {e}")
-        return "Sorry, I couldn't get a response right now."
+        return FALLBACK_REPLY
     except json.JSONDecodeError as e:
         # Handle JSON parsing errors
         print(f"JSON decode error: {e}")
-        return "Sorry, I couldn't get a response right now."
+        return FALLBACK_REPLY
     except Exception as e:
         # Handle any other unexpected errors
         print(f"Unexpected error: {e}")
-        return "Sorry, I couldn't get a response right now."
+        return FALLBACK_REPLY
+
+
+def stream_compliance_bot(user_question, conversation_history=None, tone="professional", business_type=None, user_preferences=None, client=None, use_cache=True):
+    """
+    Stream the assistant's response to a user question as it is generated.
+    
+    Takes the same arguments as ask_compliance_bot, but requests a streamed completion
+    and yields text fragments as soon as Groq sends them. A cached reply is yielded whole.
+    
+    Yields:
+        str: Pieces of the assistant's response (the error message if nothing could be streamed)
+    
+    Raises:
+        StreamInterrupted: The stream failed after part of the response was yielded
+    """
+    client = client or get_groq_client()
+    
+    api_key = _get_api_key()
+    if not api_key:
+        yield FALLBACK_REPLY
+        return
+    
+    payload = _build_payload(user_question, conversation_history, tone, business_type, user_preferences)
+    
+    cache_key, cached_reply = _cached_reply(payload, user_question, use_cache)
+    if cached_reply is not None:
+        yield cached_reply
+        return
+    
+    payload["stream"] = True
+    
+    reply = _StreamedReply(cache_key)
+    try:
+        print(f"DEBUG: Streaming request to {client.chat_completions_url}")
+        
+        with client.chat_completions(payload, api_key, stream=True) as response:
+            if response.status_code != 200:
+                print(f"Groq API error - Status code: {response.status_code}")
+                print(f"Raw response text: {response.text}")
+                yield FALLBACK_REPLY
+                return
+            
+            for line in response.iter_lines(chunk_size=None):
+                content = reply.feed(line)
+                if reply.done:
+                    break
+                if content:
+                    yield content
+            else:
+                raise requests.exceptions.ChunkedEncodingError("Stream ended before [DONE]")
+                
+    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+        print(f"Streaming error: {e}")
+        if reply.started:
+            # Part of the reply is out; the caller must not pass it off as complete
+            raise StreamInterrupted(str(e)) from e
+        yield FALLBACK_REPLY
+
+
+async def ask_compliance_bot_async(user_question, conversation_history=None, tone="professional", business_type=None, user_preferences=None, client=None, use_cache=True):
+    """
+    Non-blocking version of ask_compliance_bot for the async (ASGI) serving mode.
+    
+    Takes the same arguments, with client defaulting to the shared AsyncGroqClient.
+    
+    Returns:
+        str: The assistant's response or an error message
+    """
+    client = client or get_async_groq_client()
+    
+    api_key = _get_api_key()
+    if not api_key:
+        return FALLBACK_REPLY
+    
+    payload = _build_payload(user_question, conversation_history, tone, business_type, user_preferences)
+    
+    cache_key, cached_reply = _cached_reply(payload, user_question, use_cache)
+    if cached_reply is not None:
+        return cached_reply
+    
+    try:
+        response = await client.chat_completions(payload, api_key)
+        if response.status_code != 200:
+            print(f"Groq API error - Status code: {response.status_code}")
+            print(f"Raw response text: {response.text}")
+            return FALLBACK_REPLY
+        return _reply_from_completion(response.json(), cache_key)
+    
+    except Exception as e:
+        # Network errors, timeouts and malformed responses
+        print(f"Request error: {e}")
+        return FALLBACK_REPLY
+
+
+async def stream_compliance_bot_async(user_question, conversation_history=None, tone="professional", business_type=None, user_preferences=None, client=None, use_cache=True):
+    """
+    Non-blocking version of stream_compliance_bot for the async (ASGI) serving mode.
+    
+    Yields:
+        str: Pieces of the assistant's response (the error message if nothing could be streamed)
+    
+    Raises:
+        StreamInterrupted: The stream failed after part of the response was yielded
+    """
+    client = client or get_async_groq_client()
+    
+    api_key = _get_api_key()
+    if not api_key:
+        yield FALLBACK_REPLY
+        return
+    
+    payload = _build_payload(user_question, conversation_history, tone, business_type, user_preferences)
+    
+    cache_key, cached_reply = _cached_reply(payload, user_question, use_cache)
+    if cached_reply is not None:
+        yield cached_reply
+        return
+    
+    payload["stream"] = True
+    
+    reply = _StreamedReply(cache_key)
+    try:
+        async with client.stream_chat_completions(payload, api_key) as response:
+            if response.status_code != 200:
+                print(f"Groq API error - Status code: {response.status_code}")
+                yield FALLBACK_REPLY
+                return
+            
+            async for line in response.aiter_lines():
+                content = reply.feed(line)
+                if reply.done:
+                    break
+                if content:
+                    yield content
+            else:
+                raise ValueError("Stream ended before [DONE]")
+    
+    except Exception as e:
+        print(f"Streaming error: {e}")
+        if reply.started:
+            raise StreamInterrupted(str(e)) from e
+        yield FALLBACK_REPLY
+
+
+def _get_api_key():
+    """The Groq API key from the environment, or None (logged) if it isn't set"""
+    api_key = os.getenv('GROQ_API_KEY')
+    if not api_key:
+        print("ERROR: GROQ_API_KEY not found in environment variables")
+    return api_key
+
+
+def _cached_reply(payload, user_question, use_cache):
+    """
+    Look a request up in the chatbot response cache.
+    
+    Returns:
+        tuple: (cache_key, cached_reply); cache_key is None with caching off, cached_reply None on a miss
+    """
+    if not use_cache:
+        return None, None
+    cache_key = make_cache_key(payload, user_question)
+    return cache_key, chat_cache.get(cache_key)
+
+
+def _reply_from_completion(response_data, cache_key):
+    """
+    Extract the assistant's reply from a (non-streamed) completion and cache it.
+    
+    Returns:
+        str: The reply, or FALLBACK_REPLY if the response has none
+    """
+    if not response_data.get('choices'):
+        print("ERROR: No choices in API response")
+        print(f"Response data: {response_data}")
+        return FALLBACK_REPLY
+    
+    assistant_reply = response_data['choices'][0]['message']['content'].strip()
+    if cache_key:
+        chat_cache.put(cache_key, assistant_reply)
+    return assistant_reply
+
+
+class _StreamedReply:
+    """Collects a streamed completion line by line (shared by the sync and async streams)"""
+    
+    def __init__(self, cache_key):
+        self.cache_key = cache_key
+        self.parts = []
+        self.done = False
+    
+    @property
+    def started(self):
+        """Whether any text has been handed out"""
+        return bool(self.parts)
+    
+    def feed(self, line):
+        """
+        Take one line of the stream.
+        
+        Returns:
+            str: Text to pass on, or None; at "data: [DONE]" done is set and the complete reply cached
+        """
+        done, content = _parse_stream_line(line)
+        if done:
+            self.done = True
+            # Only complete replies are cached
+            if self.cache_key and self.parts:
+                chat_cache.put(self.cache_key, ''.join(self.parts).rstrip())
+            return None
+        if not content:
+            return None
+        if not self.parts:
+            # Match the stripped replies of ask_compliance_bot
+            content = content.lstrip()
+            if not content:
+                return None
+        self.parts.append(content)
+        return content
+
+
+def _parse_stream_line(line):
+    """
+    Parse one line of a streamed completion.
+    
+    Server-sent events carry one "data: {json}" line per chunk and end with "data: [DONE]".
+    
+    Returns:
+        tuple: (done, content) where content is the text delta, if any
+    """
+    if isinstance(line, bytes):
+        line = line.decode('utf-8')
+    if not line.startswith('data:'):
+        return False, None
+    
+    data = line[5:].strip()
+    if data == '[DONE]':
+        return True, None
+    
+    chunk = json.loads(data)
+    choices = chunk.get('choices') or [{}]
+    return False, choices[0].get('delta', {}).get('content')
+
+
+def _build_payload(user_question, conversation_history, tone, business_type, user_preferences):
+    """
+    Build the chat completions request payload for a user question.
+    """
+    # Enhanced system prompt with South African context
+    system_prompt = _build_system_prompt(tone, business_type, user_preferences)
+    
+    # Build conversation messages with context
+    messages = _build_conversation_messages(system_prompt, conversation_history, user_question)
+    
+    # Prepare the request payload with enhanced parameters
+    return {
+        "model": MODEL,
+        "messages": messages,
+        "temperature": _get_temperature_by_tone(tone),
+        "max_tokens": 1024,
+        "top_p": 0.9,
+        "frequency_penalty": 0.1,
+        "presence_penalty": 0.1
+    }
 
 
 def _build_system_prompt(tone, business_type, user_preferences):
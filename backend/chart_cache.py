@@ -0,0 +1,101 @@
+"""
+Cache of rendered report chart images
+Many reports share identical charts (the same priority split or checklist
+counts for a business type), so matplotlib chart images are kept in memory,
+keyed on what the chart shows: the panel specs with their translated labels,
+the render profile and the image format. A report that differs only in its
+text sections reuses the image instead of drawing it again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def make_chart_key(chart_backend, chart_profile, title, panels):
+    """
+    Build the cache key for a chart image.
+
+    Args:
+        chart_backend (str): Image format ('png' or 'svg')
+        chart_profile (str): Render profile name
+        title (str): Translated dashboard title
+        panels (list): Panel specs from progress_chart_panels(), labels already translated
+
+    Returns:
+        str: Hex digest of the canonical JSON of the arguments
+    """
+    key_parts = [chart_backend, chart_profile, title, panels]
+    canonical = json.dumps(key_parts, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ChartImageCache:
+    def __init__(self, max_bytes=16 * 1024 * 1024, enabled=True):
+        """
+        Args:
+            max_bytes (int): Memory budget for cached images
+            enabled (bool): When False, get() always misses and put() stores nothing
+        """
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._entries = OrderedDict()  # key -> encoded image bytes
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    def get(self, key):
+        """Return the cached image bytes for a key, or None"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return image
+
+    def put(self, key, image):
+        """Store an image, evicting least recently used images to stay within the budget"""
+        if not self.enabled or len(image) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key))
+            self._entries[key] = image
+            self._bytes += len(image)
+            self._stats['stores'] += 1
+
+            while self._bytes > self.max_bytes:
+                _, oldest = self._entries.popitem(last=False)
+                self._bytes -= len(oldest)
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Return the cache counters and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self._bytes
+            })
+        return stats
+
+
+# Shared cache used by the PDF generator (one per render worker process)
+chart_cache = ChartImageCache(
+    max_bytes=int(os.environ.get('PDF_CHART_CACHE_MAX_BYTES', 16 * 1024 * 1024)),
+    enabled=os.environ.get('PDF_CHART_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+)
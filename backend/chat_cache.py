@@ -0,0 +1,139 @@
+"""
+Response cache for repeated chatbot questions
+Replies are keyed on the normalized question, the system prompt and the
+conversation history sent to Groq, so the sample questions from the frontend
+are only sent upstream once per TTL.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_question(question):
+    """Normalize a question so trivial differences in case, spacing and end punctuation share a key"""
+    question = re.sub(r'\s+', ' ', question).strip().lower()
+    return question.rstrip('?!. ')
+
+
+def make_cache_key(payload, question):
+    """
+    Build the cache key for a chat completions payload.
+
+    Args:
+        payload (dict): The request payload (its last message is the current question)
+        question (str): The user's question
+
+    Returns:
+        str: Hex digest covering the model settings, system prompt, history and question
+    """
+    messages = payload['messages']
+    history = messages[1:-1]  # The trimmed history actually sent upstream
+    history_hash = hashlib.sha256(
+        json.dumps(history, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+    key_parts = [
+        payload['model'],
+        payload['temperature'],
+        payload['max_tokens'],
+        messages[0]['content'],  # System prompt built from tone, business type and preferences
+        history_hash,
+        normalize_question(question)
+    ]
+    return hashlib.sha256(json.dumps(key_parts, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class ChatResponseCache:
+    def __init__(self, max_entries=1000, max_bytes=4 * 1024 * 1024, ttl=3600, enabled=True):
+        """
+        Args:
+            max_entries (int): Most replies kept before the least recently used is evicted
+            max_bytes (int): Memory budget for cached replies and keys
+            ttl (float): Seconds a reply stays valid
+            enabled (bool): When False, get() always misses and put() stores nothing
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries = OrderedDict()  # key -> (expires_at, reply, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'expirations': 0}
+
+    def get(self, key):
+        """Return the cached reply for a key, or None"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            expires_at, reply, size = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return reply
+
+    def put(self, key, reply):
+        """Store a reply, evicting least recently used replies to stay within the limits"""
+        if not self.enabled:
+            return
+
+        size = sys.getsizeof(key) + sys.getsizeof(reply)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, reply, size)
+            self._bytes += size
+            self._stats['stores'] += 1
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Return the cache counters and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self._bytes
+            })
+        return stats
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+
+# Shared cache used by the chatbot
+chat_cache = ChatResponseCache(
+    max_entries=int(os.environ.get('CHATBOT_CACHE_MAX_ENTRIES', 1000)),
+    max_bytes=int(os.environ.get('CHATBOT_CACHE_MAX_BYTES', 4 * 1024 * 1024)),
+    ttl=float(os.environ.get('CHATBOT_CACHE_TTL', 3600)),
+    enabled=os.environ.get('CHATBOT_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Check the PDF translation catalogs against the keys the report code uses
+The PDF generator source is parsed (not imported) to find every key passed to
+t() or get_translation(), and each catalog in locales/ is compared with them:
+
+  missing       used by the code but not in the language, so the report
+                silently shows English (or the raw key if English lacks it too)
+  unused        in the catalog but never used by the code
+  placeholders  {fields} that differ from the English text, which would make
+                str.format() fail or drop a value in that language
+
+Any of these exits with status 1, so the check can fail the build. It only
+reads source and JSON files, so it runs in well under a second.
+
+Usage:
+    python check_translations.py                  # Check every language in locales/
+    python check_translations.py --allow-unused   # Report unused keys without failing
+"""
+
+import argparse
+import ast
+import os
+import re
+import string
+import sys
+
+from pdf_translations import FALLBACK_LANGUAGE, find_languages, flatten_catalog, load_catalog
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that render report text
+GENERATOR_SOURCES = ('pdf_generator.py', 'pdf_charts.py')
+
+# Translation functions, with the position of their key argument
+TRANSLATION_CALLS = {'t': 0, 'get_translation': 1}
+
+# Keys read without a translation call (get_language_name() reads language_name)
+IMPLICIT_KEYS = ('language_name',)
+
+
+def find_key_usage(source, filename='<source>'):
+    """
+    Find the translation keys used in a module's source.
+
+    Returns:
+        dict: 'keys' maps each literal key to the places using it ('file:line'),
+              'patterns' holds regexes for keys built with f-strings and
+              'dynamic' lists the calls whose key can't be read from the source
+    """
+    usage = {'keys': {}, 'patterns': [], 'dynamic': []}
+    for node in ast.walk(ast.parse(source, filename)):
+        if not isinstance(node, ast.Call):
+            continue
+        if isinstance(node.func, ast.Attribute):
+            name = node.func.attr
+        elif isinstance(node.func, ast.Name):
+            name = node.func.id
+        else:
+            continue
+        if name not in TRANSLATION_CALLS:
+            continue
+
+        position = TRANSLATION_CALLS[name]
+        if len(node.args) > position:
+            key = node.args[position]
+        else:
+            key = next((keyword.value for keyword in node.keywords if keyword.arg == 'key'), None)
+            if key is None:
+                continue
+
+        place = f"{filename}:{node.lineno}"
+        if isinstance(key, ast.Constant) and isinstance(key.value, str):
+            usage['keys'].setdefault(key.value, []).append(place)
+        elif isinstance(key, ast.JoinedStr):
+            # f"chart_titles.{name}" uses every key matching chart_titles.*
+            usage['patterns'].append(re.compile(''.join(
+                re.escape(part.value) if isinstance(part, ast.Constant) else '.+' for part in key.values)))
+        else:
+            usage['dynamic'].append(f"{place}: {ast.get_source_segment(source, node)}")
+    return usage
+
+
+def collect_usage(sources=GENERATOR_SOURCES):
+    """Merge the key usage of the report modules"""
+    usage = {'keys': {}, 'patterns': [], 'dynamic': []}
+    for name in sources:
+        with open(os.path.join(BACKEND_DIR, name), 'r', encoding='utf-8') as f:
+            module_usage = find_key_usage(f.read(), name)
+        for key, places in module_usage['keys'].items():
+            usage['keys'].setdefault(key, []).extend(places)
+        usage['patterns'].extend(module_usage['patterns'])
+        usage['dynamic'].extend(module_usage['dynamic'])
+    return usage
+
+
+def format_fields(text):
+    """Names of the str.format() fields in a translation"""
+    try:
+        return {field for _, field, _, _ in string.Formatter().parse(text) if field is not None}
+    except ValueError:
+        return {'<unbalanced braces>'}
+
+
+def check_catalogs(usage, catalogs):
+    """
+    Compare the key usage with each language's catalog.
+
+    Args:
+        usage (dict): Result of find_key_usage() or collect_usage()
+        catalogs (dict): Language code -> flat catalog, including English
+
+    Returns:
+        dict: Language code -> {'missing': [...], 'unused': [...], 'placeholders': [...]}
+    """
+    used = set(usage['keys']) | set(IMPLICIT_KEYS)
+    english = catalogs[FALLBACK_LANGUAGE]
+    report = {}
+    for language, catalog in catalogs.items():
+        report[language] = {
+            'missing': sorted(used - set(catalog)),
+            'unused': sorted(key for key in catalog
+                             if key not in used and not any(pattern.fullmatch(key) for pattern in usage['patterns'])),
+            'placeholders': sorted(key for key, text in catalog.items()
+                                   if key in english and format_fields(text) != format_fields(english[key]))
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the PDF translation catalogs against the report code")
+    parser.add_argument('--allow-unused', action='store_true', help="Report unused keys without failing")
+    args = parser.parse_args(argv)
+
+    usage = collect_usage()
+    languages = find_languages()
+    report = check_catalogs(usage, {language: flatten_catalog(load_catalog(language)) for language in languages})
+
+    failed = False
+    for language, problems in report.items():
+        for key in problems['missing']:
+            places = ', '.join(usage['keys'].get(key, ['get_language_name()']))
+            print(f"❌ {language}: missing '{key}' (used at {places})", file=sys.stderr)
+        for key in problems['placeholders']:
+            print(f"❌ {language}: '{key}' has different {{fields}} than English", file=sys.stderr)
+        for key in problems['unused']:
+            print(f"{'⚠️ ' if args.allow_unused else '❌'} {language}: unused '{key}'", file=sys.stderr)
+        if problems['missing'] or problems['placeholders'] or (problems['unused'] and not args.allow_unused):
+            failed = True
+
+    for place in usage['dynamic']:
+        print(f"⚠️  Key not checked (not a string literal): {place}", file=sys.stderr)
+
+    if failed:
+        print("Fix the `pdf` namespace in frontend/src/locales, then run python sync_locales.py", file=sys.stderr)
+        return 1
+    print(f"✅ {len(set(usage['keys']) | set(IMPLICIT_KEYS))} PDF translation keys present in "
+          f"{', '.join(languages)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
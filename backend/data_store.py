@@ -0,0 +1,123 @@
+"""
+In-memory store for the JSON datasets in the data directory
+Each file is parsed once and kept in memory. It is only re-read when its
+modification time or size changes, so files on the Fly volume can still be
+edited in place without restarting the app.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+
+class DatasetEntry:
+    """A parsed dataset together with the file signature it was loaded from"""
+
+    def __init__(self, data, signature, version):
+        self.data = data
+        self.signature = signature  # (mtime_ns, size) of the file when loaded
+        self.version = version      # Content digest, changes whenever the data changes
+        self.derived = {}           # Values computed from this version of the data
+
+
+class DataStore:
+    def __init__(self, data_dir='data'):
+        self.data_dir = data_dir
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'reloads': 0, 'errors': 0}
+
+    def get(self, filename):
+        """Return the parsed contents of a data file, or None if it can't be loaded"""
+        entry = self.get_entry(filename)
+        return entry.data if entry else None
+
+    def get_entry(self, filename):
+        """
+        Return the DatasetEntry for a data file, reloading it if the file changed on disk.
+
+        Returns:
+            DatasetEntry or None if the file is missing or is not valid JSON
+        """
+        path = os.path.join(self.data_dir, filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._entries.pop(filename, None)
+                self._stats['errors'] += 1
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(filename)
+        if entry is not None and entry.signature == signature:
+            with self._lock:
+                self._stats['hits'] += 1
+            return entry
+
+        with self._lock:
+            # Another thread may have reloaded the file while we waited for the lock
+            entry = self._entries.get(filename)
+            if entry is not None and entry.signature == signature:
+                self._stats['hits'] += 1
+                return entry
+
+            self._stats['reloads' if entry is not None else 'misses'] += 1
+            new_entry = self._load(path)
+            if new_entry is None:
+                self._entries.pop(filename, None)
+                self._stats['errors'] += 1
+                return None
+
+            self._entries[filename] = new_entry
+            return new_entry
+
+    def derive(self, entry, name, builder):
+        """
+        Return a value computed from a dataset, building it once per dataset version.
+
+        Args:
+            entry (DatasetEntry): Dataset the value is computed from
+            name (str): Name of the derived value
+            builder (callable): Called with the DatasetEntry when the value needs building
+
+        Returns:
+            The derived value
+        """
+        value = entry.derived.get(name)
+        if value is None:
+            with self._lock:
+                value = entry.derived.get(name)
+                if value is None:
+                    value = builder(entry)
+                    entry.derived[name] = value
+        return value
+
+    def stats(self):
+        """Return the hit/miss/reload counters and the datasets currently loaded"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['datasets'] = {
+                filename: entry.version for filename, entry in self._entries.items()
+            }
+        return stats
+
+    def _load(self, path):
+        """Read and parse a data file, returning None on failure"""
+        try:
+            # Take the signature from the open file so it matches the bytes we read
+            with open(path, 'rb') as file:
+                stat = os.fstat(file.fileno())
+                raw = file.read()
+            data = json.loads(raw.decode('utf-8'))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            print(f"Error loading {path}: {e}")
+            return None
+
+        version = hashlib.sha1(raw).hexdigest()
+        return DatasetEntry(data, (stat.st_mtime_ns, stat.st_size), version)
+
+
+# Shared store used by the API routes
+data_store = DataStore(os.environ.get('DATA_DIR', 'data'))
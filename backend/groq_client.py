@@ -0,0 +1,139 @@
+"""
+Pooled HTTP client for the Groq chat completions API
+A single long-lived session keeps connections to Groq alive between chat
+messages, so only the first request pays for the TCP and TLS handshakes.
+"""
+
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BASE_URL = "https://api.groq.com/openai/v1"
+
+
+class _GroqClientConfig:
+    def __init__(self, base_url=None, pool_size=None, connect_timeout=None, read_timeout=None):
+        """
+        Args:
+            base_url (str): API root, e.g. a local stand-in server for tests (GROQ_BASE_URL)
+            pool_size (int): Connections kept open to the API (GROQ_POOL_SIZE)
+            connect_timeout (float): Seconds to wait for a connection (GROQ_CONNECT_TIMEOUT)
+            read_timeout (float): Seconds to wait between bytes of the response (GROQ_READ_TIMEOUT)
+        """
+        self.base_url = (base_url or os.getenv('GROQ_BASE_URL', DEFAULT_BASE_URL)).rstrip('/')
+        self.pool_size = int(pool_size or os.getenv('GROQ_POOL_SIZE', 10))
+        self.timeout = (
+            float(connect_timeout or os.getenv('GROQ_CONNECT_TIMEOUT', 5)),
+            float(read_timeout or os.getenv('GROQ_READ_TIMEOUT', 30))
+        )
+
+    @property
+    def chat_completions_url(self):
+        return f"{self.base_url}/chat/completions"
+
+    def _headers(self, api_key):
+        return {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+
+class GroqClient(_GroqClientConfig):
+    def __init__(self, base_url=None, pool_size=None, connect_timeout=None, read_timeout=None):
+        super().__init__(base_url, pool_size, connect_timeout, read_timeout)
+        self.session = self._create_session()
+
+    def _create_session(self):
+        """Create the shared session with a connection pool sized for the request threads"""
+        session = requests.Session()
+        # The session is shared by every request thread, so keep it stateless
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def chat_completions(self, payload, api_key, stream=False):
+        """
+        POST a chat completions request.
+
+        Returns:
+            requests.Response: The raw response; with stream=True the body is read lazily
+        """
+        return self.session.post(
+            self.chat_completions_url,
+            headers=self._headers(api_key),
+            json=payload,
+            timeout=self.timeout,
+            stream=stream
+        )
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncGroqClient(_GroqClientConfig):
+    """Non-blocking counterpart of GroqClient for the async (ASGI) serving mode"""
+
+    def __init__(self, base_url=None, pool_size=None, connect_timeout=None, read_timeout=None):
+        try:
+            import httpx  # Imported here, so the default (WSGI) mode doesn't load it at startup
+        except ImportError:
+            raise RuntimeError("httpx is required for the async Groq client") from None
+        super().__init__(base_url, pool_size, connect_timeout, read_timeout)
+        connect, read = self.timeout
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+            timeout=httpx.Timeout(read, connect=connect)
+        )
+
+    async def chat_completions(self, payload, api_key):
+        """POST a chat completions request and return the httpx.Response"""
+        return await self.client.post(self.chat_completions_url, headers=self._headers(api_key), json=payload)
+
+    def stream_chat_completions(self, payload, api_key):
+        """Return an async context manager yielding a streamed httpx.Response"""
+        return self.client.stream('POST', self.chat_completions_url, headers=self._headers(api_key), json=payload)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+_client = None
+_client_lock = threading.Lock()
+_async_client = None
+
+
+def get_groq_client():
+    """Return the process-wide Groq client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = GroqClient()
+    return _client
+
+
+def get_async_groq_client():
+    """
+    Return the process-wide async Groq client, creating it on first use.
+
+    Its connections belong to the event loop that first uses them, so it must only be used from
+    one loop (an ASGI worker process runs one) and closed with close_async_groq_client() when that
+    loop shuts down.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncGroqClient()
+    return _async_client
+
+
+async def close_async_groq_client():
+    """Close the async Groq client when the event loop shuts down"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
@@ -0,0 +1,185 @@
+"""
+Batch PDF export
+`POST /export-pdf/batch` renders a list of report specs in one call and
+returns the PDFs in a ZIP. Reports are spread over the render workers, and
+specs that would produce the same report are rendered once. The workers keep
+the PDF stack, translations and chart image cache loaded between reports, and
+the PDF cache serves reports any earlier export already produced.
+
+The ZIP is streamed: each PDF is sent as soon as it and the reports before it
+are done, and is released once sent, so a large batch is never held in memory
+as a whole.
+"""
+
+import io
+import json
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from pdf_cache import make_report_key
+
+MAX_BATCH_REPORTS = int(os.environ.get('PDF_BATCH_MAX_REPORTS', 50))
+# Reports of one batch in flight at once. Renders beyond PDF_RENDER_WORKERS wait in the render
+# queue, and cached reports are served meanwhile, so this can be higher than the worker count
+BATCH_THREADS = int(os.environ.get('PDF_BATCH_THREADS', 4))
+
+
+class BatchRequestError(ValueError):
+    """The batch request body is malformed"""
+
+
+def parse_batch(data, max_reports=None):
+    """
+    Turn a batch request body into render arguments, one tuple per report.
+
+    The body holds `reports`, a list of {type, progressData, businessType, language}
+    specs; `chartProfile` and `chartBackend` apply to every report unless a spec sets its own.
+
+    Raises:
+        BatchRequestError: The body isn't a valid batch
+    """
+    max_reports = max_reports if max_reports is not None else MAX_BATCH_REPORTS
+    if not isinstance(data, dict) or not isinstance(data.get('reports'), list) or not data['reports']:
+        raise BatchRequestError("'reports' must be a non-empty list of report specs")
+    if len(data['reports']) > max_reports:
+        raise BatchRequestError(f"A batch can hold at most {max_reports} reports")
+
+    batch = []
+    for spec in data['reports']:
+        if not isinstance(spec, dict):
+            raise BatchRequestError("Each report spec must be an object")
+        batch.append((
+            spec.get('type', 'comprehensive'),
+            spec.get('progressData', {}),
+            spec.get('businessType', 'general'),
+            spec.get('language', 'en'),
+            spec.get('chartProfile', data.get('chartProfile')),
+            spec.get('chartBackend', data.get('chartBackend'))
+        ))
+    return batch
+
+
+def report_filename(index, render_args):
+    """Numbered file name inside the ZIP, e.g. 001-retail-checklist-zu.pdf"""
+    report_type, _, business_type, language = render_args[:4]
+    parts = [re.sub(r'[^A-Za-z0-9_-]+', '-', str(part)).strip('-') or 'report'
+             for part in (business_type, report_type, language)]
+    return f"{index + 1:03d}-{'-'.join(parts)}.pdf"
+
+
+class ChunkWriter(io.RawIOBase):
+    """Unseekable file object collecting what zipfile writes, so it can be sent as it is produced"""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(data if isinstance(data, bytes) else bytes(data))
+        return len(data)
+
+    def drain(self):
+        chunks, self.chunks = self.chunks, []
+        return chunks
+
+
+def iter_render_batch(batch, render, threads=1):
+    """
+    Render every report in a batch, at most `threads` at a time.
+
+    Args:
+        batch (list): Render arguments from parse_batch()
+        render (callable): render(*render_args) -> PDF bytes or None
+        threads (int): Reports rendered at once (PDF_BATCH_THREADS)
+
+    Yields:
+        tuple: (pdf_content, error) per report, in batch order, as soon as each is ready
+    """
+    # Identical specs share one render, kept until its last spec has been yielded
+    keys = [make_report_key(*render_args) for render_args in batch]
+    unique = {}
+    uses = {}
+    for key, render_args in zip(keys, batch):
+        unique.setdefault(key, render_args)
+        uses[key] = uses.get(key, 0) + 1
+
+    def render_one(render_args):
+        try:
+            pdf_content = render(*render_args)
+        except Exception as e:
+            print(f"Batch report failed: {e}")
+            return None, type(e).__name__
+        if not pdf_content:
+            return None, 'Failed to generate PDF report'
+        return pdf_content, None
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(threads, len(unique))))
+    try:
+        futures = {key: executor.submit(render_one, render_args) for key, render_args in unique.items()}
+        for key in keys:
+            yield futures[key].result()
+            uses[key] -= 1
+            if not uses[key]:
+                del futures[key]
+    finally:
+        # Stop rendering if the client went away mid-batch
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def render_batch(batch, render, threads=1):
+    """Render every report in a batch, returning (pdf_content, error) per report in batch order"""
+    return list(iter_render_batch(batch, render, threads))
+
+
+def iter_batch_zip(batch, results):
+    """
+    Yield the batch ZIP in chunks: each PDF as its result arrives, then a manifest.json describing each report.
+
+    PDFs are stored without recompression; their streams are already deflated.
+    """
+    writer = ChunkWriter()
+    manifest = []
+    with zipfile.ZipFile(writer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for index, (render_args, (pdf_content, error)) in enumerate(zip(batch, results)):
+            entry = {
+                'index': index,
+                'type': render_args[0],
+                'businessType': render_args[2],
+                'language': render_args[3],
+                'status': 'done' if error is None else 'failed'
+            }
+            if error is None:
+                entry['filename'] = report_filename(index, render_args)
+                entry['size'] = len(pdf_content)
+                archive.writestr(entry['filename'], pdf_content)
+            else:
+                entry['error'] = error
+            manifest.append(entry)
+            yield from writer.drain()
+        archive.writestr('manifest.json', json.dumps(manifest, indent=2, ensure_ascii=False))
+    # Closing the archive writes its central directory
+    yield from writer.drain()
+
+
+def stream_batch_zip(batch, render, threads=1):
+    """
+    Render a batch and yield its ZIP in chunks (iter_render_batch() feeding iter_batch_zip()).
+
+    Closing the stream, as the server does when the client disconnects, closes the renders
+    straight away, so reports that haven't started are cancelled.
+    """
+    results = iter_render_batch(batch, render, threads)
+    try:
+        yield from iter_batch_zip(batch, results)
+    finally:
+        results.close()
+
+
+def build_batch_zip(batch, results):
+    """Return the batch ZIP as bytes"""
+    return b''.join(iter_batch_zip(batch, results))
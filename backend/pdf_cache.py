@@ -0,0 +1,243 @@
+"""
+Cache of generated PDF reports
+Reports are keyed on a hash of everything that shapes them: the request
+inputs, the chart settings and the report code itself. A repeat export is
+served from memory, or from a directory on the Fly volume that all web workers
+share and that survives restarts, instead of being rendered again.
+
+The "Generated" timestamp in the report header isn't part of the key. A cached
+report keeps the time it was first generated, and PDF_CACHE_MAX_AGE bounds how
+old that time can be.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from atomic_file import atomic_write
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Source files that decide what a report looks like; editing one (or a locales/ catalog) invalidates cached reports
+RENDERER_SOURCES = ('pdf_generator.py', 'pdf_charts.py', 'pdf_translations.py')
+
+
+def renderer_version():
+    """Hash of the report code and translations, so a deploy that changes them doesn't serve old PDFs from disk"""
+    locales = sorted(os.path.join('locales', name) for name in os.listdir(os.path.join(BACKEND_DIR, 'locales'))
+                     if name.endswith('.json'))
+    digest = hashlib.sha256()
+    for name in list(RENDERER_SOURCES) + locales:
+        try:
+            with open(os.path.join(BACKEND_DIR, name), 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(name.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+RENDERER_VERSION = renderer_version()
+
+
+def make_report_key(report_type, progress_data, business_type, language='en', chart_profile=None,
+                    chart_backend=None):
+    """
+    Build the cache key for a report.
+
+    Returns:
+        str: Hex digest of the canonical JSON of the inputs, the chart defaults and the renderer version
+    """
+    key_parts = [
+        RENDERER_VERSION,
+        report_type,
+        progress_data,
+        business_type,
+        language,
+        # Requests without chart settings use the environment defaults
+        chart_profile or os.environ.get('PDF_CHART_PROFILE', 'screen'),
+        chart_backend or os.environ.get('PDF_CHART_BACKEND', 'native')
+    ]
+    canonical = json.dumps(key_parts, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class PDFReportCache:
+    def __init__(self, directory=None, max_memory_bytes=8 * 1024 * 1024, max_disk_bytes=100 * 1024 * 1024,
+                 max_age=3600, enabled=True):
+        """
+        Args:
+            directory (str): Directory for the disk tier, None keeps reports in memory only
+            max_memory_bytes (int): Memory budget for cached reports
+            max_disk_bytes (int): Disk budget for cached reports
+            max_age (float): Seconds a report is served from the cache after it was generated
+            enabled (bool): When False, get() always misses and put() stores nothing
+        """
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+        self.enabled = enabled
+        self._entries = OrderedDict()  # key -> (generated_at, pdf_content)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0,
+                       'expirations': 0, 'errors': 0}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def get(self, key):
+        """Return the cached PDF bytes for a key, or None"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generated_at, pdf_content = entry
+                if now - generated_at <= self.max_age:
+                    self._entries.move_to_end(key)
+                    self._stats['memory_hits'] += 1
+                    return pdf_content
+                self._remove(key)
+                self._stats['expirations'] += 1
+
+        pdf_content, generated_at = self._read_disk(key, now)
+        with self._lock:
+            if pdf_content is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['disk_hits'] += 1
+            self._store_memory(key, generated_at, pdf_content)
+        return pdf_content
+
+    def put(self, key, pdf_content):
+        """Store a freshly generated report in both tiers"""
+        if not self.enabled or not pdf_content:
+            return
+
+        with self._lock:
+            self._store_memory(key, time.time(), pdf_content)
+            self._stats['stores'] += 1
+        self._write_disk(key, pdf_content)
+
+    def _store_memory(self, key, generated_at, pdf_content):
+        if len(pdf_content) > self.max_memory_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (generated_at, pdf_content)
+        self._bytes += len(pdf_content)
+        while self._bytes > self.max_memory_bytes:
+            self._remove(next(iter(self._entries)))
+            self._stats['evictions'] += 1
+
+    def _remove(self, key):
+        _, pdf_content = self._entries.pop(key)
+        self._bytes -= len(pdf_content)
+
+    def _read_disk(self, key, now):
+        """Return (pdf_content, generated_at) from the disk tier, or (None, None)"""
+        if not self.directory:
+            return None, None
+        path = self._path(key)
+        try:
+            generated_at = os.stat(path).st_mtime
+            if now - generated_at > self.max_age:
+                os.remove(path)
+                with self._lock:
+                    self._stats['expirations'] += 1
+                return None, None
+            with open(path, 'rb') as f:
+                pdf_content = f.read()
+            # Access time drives eviction (mtime keeps the generation time)
+            os.utime(path, (now, generated_at))
+        except FileNotFoundError:
+            return None, None
+        except OSError as e:
+            print(f"PDF cache read failed: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return None, None
+        return pdf_content, generated_at
+
+    def _write_disk(self, key, pdf_content):
+        if not self.directory or len(pdf_content) > self.max_disk_bytes:
+            return
+        try:
+            atomic_write(self._path(key), pdf_content)
+            self._evict_disk()
+        except OSError as e:
+            print(f"PDF cache write failed: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+
+    def _disk_files(self):
+        """(path, size, last_used) for every cached report on disk"""
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pdf'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue  # Evicted by another web worker meanwhile
+                files.append((path, stat.st_size, stat.st_atime))
+        return files
+
+    def _evict_disk(self):
+        """Remove the least recently used reports until the disk tier is within budget"""
+        files = sorted(self._disk_files(), key=lambda file: file[2])
+        total_bytes = sum(size for _, size, _ in files)
+        while files and total_bytes > self.max_disk_bytes:
+            path, size, _ = files.pop(0)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            with self._lock:
+                self._stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.directory:
+            for path, _, _ in self._disk_files():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def stats(self):
+        """Return the cache counters, hit rate and current size of each tier"""
+        disk_files = self._disk_files() if self.enabled and self.directory else []
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+            stats.update({
+                'enabled': self.enabled,
+                'hit_rate': round((stats['memory_hits'] + stats['disk_hits']) / lookups, 3) if lookups else None,
+                'memory_entries': len(self._entries),
+                'memory_bytes': self._bytes,
+                'disk_entries': len(disk_files),
+                'disk_bytes': sum(size for _, size, _ in disk_files)
+            })
+        return stats
+
+
+# Shared cache used by /export-pdf
+pdf_cache = PDFReportCache(
+    directory=os.environ.get('PDF_CACHE_DIR') or None,
+    max_memory_bytes=int(os.environ.get('PDF_CACHE_MAX_MEMORY_BYTES', 8 * 1024 * 1024)),
+    max_disk_bytes=int(os.environ.get('PDF_CACHE_MAX_DISK_BYTES', 100 * 1024 * 1024)),
+    max_age=float(os.environ.get('PDF_CACHE_MAX_AGE', 3600)),
+    enabled=os.environ.get('PDF_CACHE_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+)
@@ -0,0 +1,198 @@
+"""
+Progress charts drawn with FPDF's own shape API
+Pie and bar charts are drawn straight into the report as vector shapes and
+text, so PDF export doesn't need matplotlib at all. Layout follows the
+matplotlib dashboard: a title over a 2x2 grid of panels.
+"""
+
+import math
+
+PANEL_GAP = 6           # mm between panels
+TITLE_HEIGHT = 10       # mm for the dashboard title
+PANEL_TITLE_HEIGHT = 7  # mm for each panel title
+PANEL_HEIGHT = 52       # mm for each row of panels
+AXIS_COLOR = (60, 60, 60)
+TEXT_COLOR = (0, 0, 0)
+
+
+def hex_to_rgb(color):
+    """Convert '#4CAF50' to (76, 175, 80)"""
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def nice_ticks(maximum, max_ticks=6):
+    """Evenly spaced round tick values from 0 up to at least maximum"""
+    if maximum <= 0:
+        return [0, 1]
+    raw_step = maximum / (max_ticks - 1)
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    for factor in (1, 2, 2.5, 5, 10):
+        step = factor * magnitude
+        if step >= raw_step:
+            break
+    return [i * step for i in range(math.ceil(maximum / step - 1e-9) + 1)]
+
+
+def format_tick(value):
+    return f"{value:g}"
+
+
+class ChartDrawer:
+    def __init__(self, pdf):
+        self.pdf = pdf
+
+    def dashboard(self, title, panels, x, y, width, height):
+        """
+        Draw a titled grid of chart panels, two per row.
+
+        Args:
+            title (str): Dashboard title
+            panels (list): Panel specs (see pie and bar), None leaves a slot empty
+            x, y, width, height (float): Area of the page to draw in, in mm
+        """
+        pdf = self.pdf
+        rows = dashboard_rows(panels)
+        with pdf.local_context(text_color=TEXT_COLOR):
+            pdf.set_font('Helvetica', 'B', 13)
+            self.centered_text(x + width / 2, y + 6, title)
+
+            panel_width = (width - PANEL_GAP) / 2
+            panel_height = (height - TITLE_HEIGHT - PANEL_GAP * (rows - 1)) / rows
+            for index, panel in enumerate(panels):
+                if not panel:
+                    continue
+                panel_x = x + (index % 2) * (panel_width + PANEL_GAP)
+                panel_y = y + TITLE_HEIGHT + (index // 2) * (panel_height + PANEL_GAP)
+                draw = self.pie if panel['kind'] == 'pie' else self.bar
+                draw(panel, panel_x, panel_y, panel_width, panel_height)
+
+    def centered_text(self, center_x, baseline_y, text):
+        self.pdf.text(center_x - self.pdf.get_string_width(text) / 2, baseline_y, text)
+
+    def panel_title(self, title, x, y, width):
+        self.pdf.set_font('Helvetica', '', 9)
+        self.centered_text(x + width / 2, y + 4, title)
+
+    def pie(self, panel, x, y, width, height):
+        """
+        Pie chart with outside labels and percentages inside the wedges.
+
+        Panel keys: title, labels, values, colors
+        """
+        pdf = self.pdf
+        self.panel_title(panel['title'], x, y, width)
+
+        values = [max(value, 0) for value in panel['values']]
+        total = sum(values)
+        if total <= 0:
+            return
+
+        # Leave room around the pie for the wedge labels
+        radius = min(width * 0.5 - 14, height - PANEL_TITLE_HEIGHT - 8) / 2
+        center_x = x + width / 2
+        center_y = y + PANEL_TITLE_HEIGHT + (height - PANEL_TITLE_HEIGHT) / 2
+
+        colors = panel['colors']
+        start = 0.0
+        wedges = []
+        for index, value in enumerate(values):
+            sweep = 360.0 * value / total
+            if sweep > 0:
+                pdf.set_fill_color(*hex_to_rgb(colors[index % len(colors)]))
+                # FPDF's y axis points down, so negate the angles to run counter-clockwise on the page
+                pdf.solid_arc(center_x - radius, center_y - radius, radius * 2, -(start + sweep), -start,
+                              style='F')
+            wedges.append((start + sweep / 2, value / total))
+            start += sweep
+
+        pdf.set_font('Helvetica', '', 7)
+        for label, (angle, share) in zip(panel['labels'], wedges):
+            cos_a, sin_a = math.cos(math.radians(angle)), -math.sin(math.radians(angle))
+            # Percentage inside the wedge, label just outside it
+            self.centered_text(center_x + 0.6 * radius * cos_a, center_y + 0.6 * radius * sin_a + 1,
+                               f"{share * 100:.1f}%")
+            label_x = center_x + 1.12 * radius * cos_a
+            label_y = center_y + 1.12 * radius * sin_a + 1
+            if cos_a < 0:
+                label_x -= pdf.get_string_width(label)
+            pdf.text(label_x, label_y, label)
+
+    def bar(self, panel, x, y, width, height):
+        """
+        Bar chart with a labelled value axis.
+
+        Panel keys: title, labels, values, colors, ylabel (optional),
+        rotate_labels (optional, slants long category names)
+        """
+        pdf = self.pdf
+        self.panel_title(panel['title'], x, y, width)
+
+        labels = [str(label) for label in panel['labels']]
+        values = panel['values']
+        if not values:
+            return
+        colors = panel['colors']
+        ticks = nice_ticks(max(values))
+
+        pdf.set_font('Helvetica', '', 7)
+        label_space = 4
+        if panel.get('rotate_labels'):
+            label_space += max(pdf.get_string_width(label) for label in labels) * math.sin(math.radians(45))
+        left = x + 14
+        top = y + PANEL_TITLE_HEIGHT + 2
+        bottom = y + height - label_space
+        right = x + width - 2
+        plot_height = bottom - top
+
+        # Value axis with ticks
+        pdf.set_draw_color(*AXIS_COLOR)
+        pdf.set_line_width(0.2)
+        pdf.line(left, top, left, bottom)
+        pdf.line(left, bottom, right, bottom)
+        for tick in ticks:
+            tick_y = bottom - plot_height * tick / ticks[-1]
+            pdf.line(left - 1, tick_y, left, tick_y)
+            text = format_tick(tick)
+            pdf.text(left - 1.5 - pdf.get_string_width(text), tick_y + 1, text)
+
+        if panel.get('ylabel'):
+            with pdf.rotation(90, x + 3, top + plot_height / 2):
+                self.centered_text(x + 3, top + plot_height / 2, panel['ylabel'])
+
+        # Bars take 80% of their slot, like matplotlib's default width
+        slot = (right - left) / len(values)
+        for index, (label, value) in enumerate(zip(labels, values)):
+            bar_height = plot_height * max(value, 0) / ticks[-1]
+            bar_x = left + slot * index + slot * 0.1
+            pdf.set_fill_color(*hex_to_rgb(colors[index % len(colors)]))
+            pdf.rect(bar_x, bottom - bar_height, slot * 0.8, bar_height, style='F')
+
+            center_x = left + slot * (index + 0.5)
+            if panel.get('rotate_labels'):
+                with pdf.rotation(45, center_x, bottom + 3):
+                    pdf.text(center_x - pdf.get_string_width(label), bottom + 3, label)
+            else:
+                self.centered_text(center_x, bottom + 3.5, label)
+
+
+def dashboard_rows(panels):
+    return max(1, math.ceil(len(panels) / 2))
+
+
+def draw_progress_dashboard(pdf, title, panels, width=180, height=None):
+    """
+    Draw the progress dashboard at the current position, starting a new page if it doesn't fit.
+
+    Returns:
+        float: The y position below the dashboard
+    """
+    if height is None:
+        rows = dashboard_rows(panels)
+        height = TITLE_HEIGHT + rows * PANEL_HEIGHT + (rows - 1) * PANEL_GAP
+    if pdf.will_page_break(height):
+        pdf.add_page()
+    x, y = pdf.l_margin, pdf.get_y()
+    ChartDrawer(pdf).dashboard(title, panels, x, y, width, height)
+    pdf.set_y(y + height)
+    return pdf.get_y()
@@ -1,67 +1,169 @@
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from fpdf import FPDF
 import io
-import base64
 import os
-import tempfile
+import base64
 from datetime import datetime
 import json
-from pdf_translations import get_translation, get_language_name, get_supported_languages
+from importlib.util import find_spec
+from chart_cache import chart_cache, make_chart_key
+from pdf_charts import draw_progress_dashboard
+from pdf_translations import get_catalog, get_language_name, get_supported_languages
+
+Figure = None  # matplotlib.figure.Figure, imported on first use by load_matplotlib()
+FigureCanvasAgg = None
+MATPLOTLIB_AVAILABLE = find_spec('matplotlib') is not None
+
+# Chart render profiles: figure size in inches, raster resolution and PNG zlib level.
+# FPDF re-compresses embedded images itself, so the PNG level only trades encode
+# time against the size of the intermediate PNG; the PDF size follows the pixel count.
+CHART_PROFILES = {
+    'screen': {'figsize': (10, 6.67), 'dpi': 100, 'compress_level': 1},
+    'print': {'figsize': (12, 8), 'dpi': 200, 'compress_level': 1},
+    'archive': {'figsize': (12, 8), 'dpi': 300, 'compress_level': 6}
+}
+DEFAULT_CHART_PROFILE = os.environ.get('PDF_CHART_PROFILE', 'screen')
+
+# Chart backends: 'native' draws the charts with FPDF shapes (see pdf_charts.py);
+# 'png' and 'svg' render them with matplotlib, as a raster image or as vector paths
+# that stay sharp when zoomed (the profile's figure size still applies)
+CHART_BACKENDS = ('native', 'png', 'svg')
+MATPLOTLIB_CHART_BACKENDS = ('png', 'svg')
+DEFAULT_CHART_BACKEND = os.environ.get('PDF_CHART_BACKEND', 'native')
+
+# The dashboard charts, in the order progress_chart_panels() returns them
+PROGRESS_CHARTS = ('progress_by_category', 'compliance_tasks', 'skills_by_category', 'priority_distribution')
+
+# What each report type contains. A focused report only reads its own part of the
+# progress data and only draws its own charts, so a skills export never renders the
+# compliance charts; unknown types get the comprehensive report.
+#   focus: translation key of the subtitle under the report title
+#   data: progress data sections the report reads
+#   sections: report sections, in order
+#   charts: dashboard charts drawn by the progress_charts section
+REPORT_PLANS = {
+    'comprehensive': {
+        'focus': None,
+        'data': ('checklist', 'skills', 'quiz'),
+        'sections': ('executive_summary', 'progress_charts', 'compliance', 'skills', 'quiz', 'action_items'),
+        'charts': PROGRESS_CHARTS
+    },
+    'checklist': {
+        'focus': 'compliance_status',
+        'data': ('checklist',),
+        'sections': ('progress_charts', 'compliance', 'action_items'),
+        'charts': ('compliance_tasks', 'priority_distribution')
+    },
+    'skills': {
+        'focus': 'skills_development',
+        'data': ('skills',),
+        'sections': ('progress_charts', 'skills', 'action_items'),
+        'charts': ('skills_by_category',)
+    },
+    'quiz': {
+        'focus': 'knowledge_assessment',
+        'data': ('quiz',),
+        'sections': ('quiz', 'action_items'),
+        'charts': ()
+    }
+}
+
+def load_matplotlib():
+    """Import matplotlib on first use; only the png and svg chart backends need it.
+
+    Charts are built on standalone Figure objects rather than pyplot, whose global
+    current-figure state isn't safe when several request threads render at once.
+    """
+    global Figure, FigureCanvasAgg
+    if Figure is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as canvas_class
+        from matplotlib.figure import Figure as figure_class
+        FigureCanvasAgg = canvas_class
+        Figure = figure_class
+    return Figure, FigureCanvasAgg
+
+def warm_up():
+    """Load what the default chart backend needs on top of this module (fpdf and the native drawer)"""
+    if DEFAULT_CHART_BACKEND in MATPLOTLIB_CHART_BACKENDS and MATPLOTLIB_AVAILABLE:
+        load_matplotlib()
 
 class RegulaEasePDFGenerator:
-    def __init__(self, language='en'):
+    def __init__(self, language='en', chart_profile=None, chart_backend=None):
         self.pdf = FPDF()
         self.pdf.set_auto_page_break(auto=True, margin=15)
         self.language = language if language in get_supported_languages() else 'en'
+        self.translations = get_catalog(self.language)
+        if chart_profile not in CHART_PROFILES:
+            chart_profile = DEFAULT_CHART_PROFILE if DEFAULT_CHART_PROFILE in CHART_PROFILES else 'screen'
+        self.chart_profile = chart_profile
+        if chart_backend not in CHART_BACKENDS:
+            chart_backend = DEFAULT_CHART_BACKEND if DEFAULT_CHART_BACKEND in CHART_BACKENDS else 'native'
+        if chart_backend in MATPLOTLIB_CHART_BACKENDS and not MATPLOTLIB_AVAILABLE:
+            chart_backend = 'native'
+        self.chart_backend = chart_backend
         
     def t(self, key, default=None):
         """Get translation for current language"""
-        return get_translation(self.language, key, default)
-        
-    def generate_comprehensive_report(self, progress_data, business_type):
-        """Generate a comprehensive business progress report"""
+        return self.translations.get(key, default or key)
+        
+    def generate_report(self, report_type, progress_data, business_type):
+        """Generate the report described by a report type's plan (see REPORT_PLANS)"""
+        plan = REPORT_PLANS.get(report_type, REPORT_PLANS['comprehensive'])
+        if not isinstance(progress_data, dict):
+            progress_data = {}  # Anything else has no sections to show, as before the plans
+        progress_data = {key: value for key, value in progress_data.items() if key in plan['data']}
+        sections = plan['sections']
         self.pdf.add_page()
         
         # Header
-        self.add_header(self.t('report_title'), business_type)
+        self.add_header(self.t('report_title'), business_type, self.t(plan['focus']) if plan['focus'] else None)
         
         # Executive Summary
-        self.add_section_title(self.t('executive_summary'))
-        self.add_executive_summary(progress_data)
+        if 'executive_summary' in sections:
+            self.add_section_title(self.t('executive_summary'))
+            self.add_executive_summary(progress_data)
         
         # Progress Charts
-        self.add_section_title(self.t('progress_overview'))
-        self.add_progress_charts(progress_data)
+        if 'progress_charts' in sections:
+            panels = self.progress_chart_panels(progress_data, plan['charts'])
+            if any(panels):
+                self.add_section_title(self.t('progress_overview'))
+                self.add_progress_charts(progress_data, panels)
         
         # Compliance Status
-        if 'checklist' in progress_data:
+        if 'compliance' in sections and 'checklist' in progress_data:
             self.add_section_title(self.t('compliance_status'))
             self.add_compliance_analysis(progress_data['checklist'])
         
         # Skills Development
-        if 'skills' in progress_data:
+        if 'skills' in sections and 'skills' in progress_data:
             self.add_section_title(self.t('skills_development'))
             self.add_skills_analysis(progress_data['skills'])
         
         # Quiz Performance
-        if 'quiz' in progress_data:
+        if 'quiz' in sections and 'quiz' in progress_data:
             self.add_section_title(self.t('knowledge_assessment'))
             self.add_quiz_analysis(progress_data['quiz'])
         
         # Action Items
-        self.add_section_title(self.t('recommended_next_steps'))
-        self.add_action_items(progress_data)
+        if 'action_items' in sections:
+            self.add_section_title(self.t('recommended_next_steps'))
+            self.add_action_items(progress_data)
         
         return self.pdf.output()
     
-    def add_header(self, title, business_type):
+    def generate_comprehensive_report(self, progress_data, business_type):
+        """Generate a comprehensive business progress report"""
+        return self.generate_report('comprehensive', progress_data, business_type)
+    
+    def add_header(self, title, business_type, subtitle=None):
         """Add report header with logo and title"""
         self.pdf.set_font('Helvetica', 'B', 20)
         self.pdf.cell(0, 15, title, align='C')
         self.pdf.ln(15)
+        if subtitle:
+            self.pdf.set_font('Helvetica', 'B', 14)
+            self.pdf.cell(0, 10, subtitle, align='C')
+            self.pdf.ln(10)
         
         self.pdf.set_font('Helvetica', '', 12)
         self.pdf.cell(0, 10, f"{self.t('business_type')}: {business_type.title()}", align='C')
@@ -122,101 +224,158 @@ class RegulaEasePDFGenerator:
         self.pdf.multi_cell(0, 6, summary_text.strip())
         self.pdf.ln(10)
     
-    def add_progress_charts(self, progress_data):
-        """Add progress visualization charts"""
-        # Create progress chart
-        chart_path = self.create_progress_chart(progress_data)
-        if chart_path and os.path.exists(chart_path):
-            self.pdf.image(chart_path, x=10, y=None, w=180)
+    def add_progress_charts(self, progress_data, panels=None):
+        """Add progress visualization charts (all four unless the panels to draw are given)"""
+        if panels is None:
+            panels = self.progress_chart_panels(progress_data)
+        if self.chart_backend == 'native':
+            try:
+                draw_progress_dashboard(self.pdf, self.t('progress_overview'), panels)
+                self.pdf.ln(10)
+                return
+            except Exception as e:
+                print(f"Error drawing progress charts: {e}")
+                chart_image = None
+        else:
+            # Create progress chart
+            chart_image = self.create_progress_chart(progress_data, panels)
+        if chart_image:
+            self.pdf.image(chart_image, x=10, y=None, w=180)
             self.pdf.ln(10)
-            # Clean up temp file
-            os.remove(chart_path)
         else:
             # Fallback if chart generation fails
             self.pdf.set_font('Helvetica', '', 11)
             self.pdf.multi_cell(0, 6, self.t('progress_charts_failed'))
             self.pdf.ln(10)
     
-    def create_progress_chart(self, progress_data):
-        """Create a progress overview chart"""
-        try:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-            fig.suptitle(self.t('progress_overview'), fontsize=16, fontweight='bold')
-            
-            # 1. Overall Progress Pie Chart
-            categories = []
-            values = []
-            colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0']
-            
-            if 'checklist' in progress_data:
-                checklist_data = progress_data['checklist']
-                categories.append(self.t('chart_labels.compliance'))
-                values.append(checklist_data.get('percentage', 0))
-            
-            if 'skills' in progress_data:
-                skills_data = progress_data['skills']
-                total_resources = skills_data.get('totalResources', 1)
-                bookmark_rate = (skills_data.get('bookmarked', 0) / total_resources) * 100
-                categories.append(self.t('chart_labels.skills'))
-                values.append(bookmark_rate)
-            
-            if 'quiz' in progress_data:
-                quiz_data = progress_data['quiz']
-                total_questions = quiz_data.get('totalQuestions', 1)
-                quiz_score = (quiz_data.get('score', 0) / total_questions) * 100
-                categories.append(self.t('chart_labels.knowledge'))
-                values.append(quiz_score)
+    def progress_chart_panels(self, progress_data, charts=PROGRESS_CHARTS):
+        """
+        Describe the dashboard charts; every chart backend draws from these specs.
+        
+        With all four charts, missing ones stay as None so the 2x2 layout is kept;
+        a subset (see REPORT_PLANS) only returns the charts that have data.
+        """
+        if tuple(charts) != PROGRESS_CHARTS:
+            all_panels = dict(zip(PROGRESS_CHARTS, self.progress_chart_panels(progress_data)))
+            return [all_panels[name] for name in charts if all_panels[name]]
+        
+        panels = [None, None, None, None]
+        
+        # 1. Overall Progress Pie Chart
+        categories = []
+        values = []
+        colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0']
+        
+        if 'checklist' in progress_data:
+            checklist_data = progress_data['checklist']
+            categories.append(self.t('chart_labels.compliance'))
+            values.append(checklist_data.get('percentage', 0))
+        
+        if 'skills' in progress_data:
+            skills_data = progress_data['skills']
+            total_resources = skills_data.get('totalResources', 1)
+            bookmark_rate = (skills_data.get('bookmarked', 0) / total_resources) * 100
+            categories.append(self.t('chart_labels.skills'))
+            values.append(bookmark_rate)
+        
+        if 'quiz' in progress_data:
+            quiz_data = progress_data['quiz']
+            total_questions = quiz_data.get('totalQuestions', 1)
+            quiz_score = (quiz_data.get('score', 0) / total_questions) * 100
+            categories.append(self.t('chart_labels.knowledge'))
+            values.append(quiz_score)
+        
+        if categories:
+            panels[0] = {'kind': 'pie', 'title': self.t('chart_titles.progress_by_category'),
+                         'labels': categories, 'values': values, 'colors': colors[:len(categories)]}
+        
+        # 2. Compliance Status Bar Chart
+        if 'checklist' in progress_data:
+            checklist_data = progress_data['checklist']
+            completed = checklist_data.get('completed', 0)
+            remaining = checklist_data.get('total', 0) - completed
             
-            if categories:
-                ax1.pie(values, labels=categories, autopct='%1.1f%%', colors=colors[:len(categories)])
-                ax1.set_title(self.t('chart_titles.progress_by_category'))
+            panels[1] = {'kind': 'bar', 'title': self.t('chart_titles.compliance_tasks'),
+                         'labels': [self.t('chart_labels.completed'), self.t('chart_labels.remaining')],
+                         'values': [completed, remaining], 'colors': ['#4CAF50', '#FFC107'],
+                         'ylabel': self.t('chart_labels.number_of_tasks')}
+        
+        # 3. Skills Development Progress
+        if 'skills' in progress_data:
+            skills_data = progress_data['skills']
+            categories = skills_data.get('categories', [])
+            bookmarks = skills_data.get('categoryBookmarks', [])
             
-            # 2. Compliance Status Bar Chart
-            if 'checklist' in progress_data:
-                checklist_data = progress_data['checklist']
-                completed = checklist_data.get('completed', 0)
-                remaining = checklist_data.get('total', 0) - completed
-                
-                ax2.bar([self.t('chart_labels.completed'), self.t('chart_labels.remaining')], 
-                       [completed, remaining], color=['#4CAF50', '#FFC107'])
-                ax2.set_title(self.t('chart_titles.compliance_tasks'))
-                ax2.set_ylabel('Number of Tasks')
+            if categories and bookmarks:
+                panels[2] = {'kind': 'bar', 'title': self.t('chart_titles.skills_by_category'),
+                             'labels': categories, 'values': bookmarks, 'colors': ['#2196F3'],
+                             'ylabel': self.t('chart_labels.bookmarked_resources'), 'rotate_labels': True}
+        
+        # 4. Priority Distribution
+        if 'checklist' in progress_data:
+            checklist_data = progress_data['checklist']
+            priorities = checklist_data.get('priorityDistribution', {})
             
-            # 3. Skills Development Progress
-            if 'skills' in progress_data:
-                skills_data = progress_data['skills']
-                categories = skills_data.get('categories', [])
-                bookmarks = skills_data.get('categoryBookmarks', [])
-                
-                if categories and bookmarks:
-                    ax3.bar(categories, bookmarks, color='#2196F3')
-                    ax3.set_title(self.t('chart_titles.skills_by_category'))
-                    ax3.set_ylabel(self.t('chart_labels.bookmarked_resources'))
-                    plt.setp(ax3.get_xticklabels(), rotation=45, ha='right')
+            if priorities:
+                priority_names = list(priorities.keys())
+                colors_priority = ['#F44336', '#FF9800', '#4CAF50']
+                panels[3] = {'kind': 'pie', 'title': self.t('chart_titles.priority_distribution'),
+                             'labels': priority_names, 'values': list(priorities.values()),
+                             'colors': colors_priority}
+        
+        return panels
+    
+    def create_progress_chart(self, progress_data, panels=None):
+        """Create a progress overview chart with matplotlib, returned as an in-memory PNG or SVG"""
+        title = self.t('progress_overview')
+        if panels is None:
+            panels = self.progress_chart_panels(progress_data)
+        
+        # Identical charts are shared between reports; reuse the encoded image when there is one
+        cache_key = make_chart_key(self.chart_backend, self.chart_profile, title, panels)
+        cached_image = chart_cache.get(cache_key)
+        if cached_image is not None:
+            return io.BytesIO(cached_image)
+        
+        figure_class, canvas_class = load_matplotlib()
+        try:
+            profile = CHART_PROFILES[self.chart_profile]
+            # The profile's figure size fits two rows of charts; a single row gets half the height
+            rows = max(1, (len(panels) + 1) // 2)
+            width, height = profile['figsize']
+            fig = figure_class(figsize=(width, height * rows / 2))
+            canvas_class(fig)
+            axes = fig.subplots(rows, 2, squeeze=False)
+            fig.suptitle(title, fontsize=16, fontweight='bold')
             
-            # 4. Priority Distribution
-            if 'checklist' in progress_data:
-                checklist_data = progress_data['checklist']
-                priorities = checklist_data.get('priorityDistribution', {})
-                
-                if priorities:
-                    priority_names = list(priorities.keys())
-                    priority_values = list(priorities.values())
-                    colors_priority = ['#F44336', '#FF9800', '#4CAF50']
-                    
-                    ax4.pie(priority_values, labels=priority_names, autopct='%1.1f%%', 
-                           colors=colors_priority[:len(priority_names)])
-                    ax4.set_title(self.t('chart_titles.priority_distribution'))
+            for ax, panel in zip(axes.flat, list(panels) + [None] * (rows * 2 - len(panels))):
+                if not panel:
+                    ax.set_axis_off()
+                    continue
+                if panel['kind'] == 'pie':
+                    ax.pie(panel['values'], labels=panel['labels'], autopct='%1.1f%%', colors=panel['colors'])
+                else:
+                    ax.bar(panel['labels'], panel['values'], color=panel['colors'])
+                    ax.set_ylabel(panel['ylabel'])
+                    if panel.get('rotate_labels'):
+                        for label in ax.get_xticklabels():
+                            label.set_rotation(45)
+                            label.set_horizontalalignment('right')
+                ax.set_title(panel['title'])
             
-            plt.tight_layout()
+            fig.tight_layout()
             
-            # Save chart to temporary file (cross-platform)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-                chart_path = tmp_file.name
-            plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            # Render straight into memory; FPDF embeds the buffer without touching disk
+            chart_image = io.BytesIO()
+            if self.chart_backend == 'svg':
+                fig.savefig(chart_image, format='svg', bbox_inches='tight')
+            else:
+                fig.savefig(chart_image, format='png', dpi=profile['dpi'], bbox_inches='tight',
+                            pil_kwargs={'compress_level': profile['compress_level']})
+            chart_cache.put(cache_key, chart_image.getvalue())
+            chart_image.seek(0)
             
-            return chart_path
+            return chart_image
             
         except Exception as e:
             print(f"Error creating progress chart: {e}")
@@ -229,21 +388,29 @@ class RegulaEasePDFGenerator:
         total = checklist_data.get('total', 0)
         completed = checklist_data.get('completed', 0)
         percentage = checklist_data.get('percentage', 0)
+        priorities = checklist_data.get('priorityDistribution', {})
+        
+        if percentage >= 80:
+            trend = self.t('compliance_analysis.excellent_progress')
+        elif percentage >= 60:
+            trend = self.t('compliance_analysis.good_progress')
+        else:
+            trend = self.t('compliance_analysis.needs_attention')
         
         analysis_text = f"""
-Compliance Status Analysis:
+{self.t('compliance_analysis.title')}:
 
-* Total Tasks: {total}
-* Completed Tasks: {completed}
-* Completion Rate: {percentage}%
-* Remaining Tasks: {total - completed}
+* {self.t('compliance_analysis.total_tasks')}: {total}
+* {self.t('compliance_analysis.completed_tasks')}: {completed}
+* {self.t('compliance_analysis.progress_percentage')}: {percentage}%
+* {self.t('chart_labels.remaining')}: {total - completed}
 
-Priority Breakdown:
-* High Priority: {checklist_data.get('priorityDistribution', {}).get('high', 0)} tasks
-* Medium Priority: {checklist_data.get('priorityDistribution', {}).get('medium', 0)} tasks
-* Low Priority: {checklist_data.get('priorityDistribution', {}).get('low', 0)} tasks
+{self.t('compliance_analysis.priority_breakdown')}:
+* {self.t('compliance_analysis.high_priority')}: {priorities.get('high', 0)}
+* {self.t('compliance_analysis.medium_priority')}: {priorities.get('medium', 0)}
+* {self.t('compliance_analysis.low_priority')}: {priorities.get('low', 0)}
 
-Progress Trend: {'Excellent' if percentage >= 80 else 'Good' if percentage >= 60 else 'Needs Improvement'}
+{trend}
         """
         
         self.pdf.multi_cell(0, 6, analysis_text.strip())
@@ -258,25 +425,28 @@ Progress Trend: {'Excellent' if percentage >= 80 else 'Good' if percentage >= 60
         engagement_rate = (bookmarked / total_resources * 100) if total_resources > 0 else 0
         
         analysis_text = f"""
-Skills Development Analysis:
+{self.t('skills_analysis.title')}:
 
-* Total Resources Available: {total_resources}
-* Bookmarked Resources: {bookmarked}
-* Engagement Rate: {engagement_rate:.1f}%
+* {self.t('skills_analysis.total_resources')}: {total_resources}
+* {self.t('skills_analysis.bookmarked')}: {bookmarked}
+* {self.t('skills_analysis.engagement_rate')}: {engagement_rate:.1f}%
 
-Top Categories:
-        """
+{self.t('skills_analysis.category_distribution')}:
+"""
         
         categories = skills_data.get('categories', [])
         category_bookmarks = skills_data.get('categoryBookmarks', [])
         
         for i, category in enumerate(categories):
             if i < len(category_bookmarks):
-                analysis_text += f"* {category}: {category_bookmarks[i]} bookmarks\n"
+                analysis_text += f"* {category}: {category_bookmarks[i]}\n"
         
-        analysis_text += f"""
-Learning Engagement: {'High' if engagement_rate >= 25 else 'Moderate' if engagement_rate >= 10 else 'Low'}
-        """
+        if engagement_rate >= 25:
+            analysis_text += f"\n{self.t('skills_analysis.well_rounded')}"
+        elif engagement_rate >= 10:
+            analysis_text += f"\n{self.t('skills_analysis.focus_areas')}"
+        else:
+            analysis_text += f"\n{self.t('skills_analysis.bookmark_more')}"
         
         self.pdf.multi_cell(0, 6, analysis_text.strip())
         self.pdf.ln(10)
@@ -289,25 +459,34 @@ Learning Engagement: {'High' if engagement_rate >= 25 else 'Moderate' if engagem
         total_questions = quiz_data.get('totalQuestions', 0)
         percentage = (score / total_questions * 100) if total_questions > 0 else 0
         
+        if percentage >= 80:
+            performance = self.t('quiz_analysis.excellent_knowledge')
+        elif percentage >= 60:
+            performance = self.t('quiz_analysis.good_understanding')
+        else:
+            performance = self.t('quiz_analysis.needs_improvement')
+        
         analysis_text = f"""
-Knowledge Assessment Results:
+{self.t('quiz_analysis.title')}:
 
-* Score: {score}/{total_questions} ({percentage:.1f}%)
-* Category: {quiz_data.get('category', 'Mixed')}
-* Completed: {quiz_data.get('completedAt', 'N/A')}
+* {self.t('quiz_analysis.score')}: {score}
+* {self.t('quiz_analysis.total_questions')}: {total_questions}
+* {self.t('quiz_analysis.percentage')}: {percentage:.1f}%
+* {self.t('quiz_analysis.category')}: {quiz_data.get('category') or self.t('quiz_analysis.mixed')}
+* {self.t('quiz_analysis.completed_at')}: {quiz_data.get('completedAt') or self.t('not_available')}
 
-Performance Level: {'Excellent' if percentage >= 80 else 'Good' if percentage >= 60 else 'Needs Improvement'}
+{performance}
 
-Areas for Improvement:
-        """
+{self.t('quiz_analysis.areas_for_improvement')}:
+"""
         
         # Add incorrect answers analysis
         incorrect_count = total_questions - score
         if incorrect_count > 0:
-            analysis_text += f"* Review {incorrect_count} topics where questions were answered incorrectly\n"
-            analysis_text += "* Focus on practical application of business compliance concepts\n"
+            analysis_text += f"* {self.t('quiz_analysis.review_incorrect').format(count=incorrect_count)}\n"
+            analysis_text += f"* {self.t('quiz_analysis.practical_application')}\n"
         
-        analysis_text += "* Consider taking additional quizzes to reinforce learning\n"
+        analysis_text += f"* {self.t('quiz_analysis.more_quizzes')}\n"
         
         self.pdf.multi_cell(0, 6, analysis_text.strip())
         self.pdf.ln(10)
@@ -323,15 +502,16 @@ Areas for Improvement:
             checklist_data = progress_data['checklist']
             percentage = checklist_data.get('percentage', 0)
             if percentage < 100:
-                action_items.append(f"Complete remaining {checklist_data.get('total', 0) - checklist_data.get('completed', 0)} compliance tasks")
+                remaining = checklist_data.get('total', 0) - checklist_data.get('completed', 0)
+                action_items.append(self.t('action_items.continue_compliance').format(count=remaining))
             if checklist_data.get('priorityDistribution', {}).get('high', 0) > 0:
-                action_items.append("Prioritize high-priority compliance tasks")
+                action_items.append(self.t('action_items.prioritize_high'))
         
         # Skills actions
         if 'skills' in progress_data:
             skills_data = progress_data['skills']
             if skills_data.get('bookmarked', 0) == 0:
-                action_items.append("Explore and bookmark relevant skills development resources")
+                action_items.append(self.t('action_items.explore_skills'))
         
         # Quiz actions
         if 'quiz' in progress_data:
@@ -339,44 +519,51 @@ Areas for Improvement:
             score = quiz_data.get('score', 0)
             total = quiz_data.get('totalQuestions', 0)
             if score < total:
-                action_items.append("Review quiz topics and take additional assessments")
+                action_items.append(self.t('action_items.review_quiz'))
+        
+        # Nothing left to catch up on
+        if not action_items:
+            action_items.append(self.t('action_items.maintain_momentum'))
         
         # General actions
         action_items.extend([
-            "Schedule weekly progress reviews",
-            "Set up automated compliance reminders",
-            "Connect with local business development resources"
+            self.t('action_items.review_progress'),
+            self.t('action_items.compliance_reminders'),
+            self.t('action_items.local_resources')
         ])
         
-        actions_text = "Recommended Next Steps:\n\n"
+        actions_text = f"{self.t('action_items.title')}:\n\n"
         for i, action in enumerate(action_items[:8], 1):  # Limit to 8 items
             actions_text += f"{i}. {action}\n"
         
-        actions_text += "\nFor personalized guidance, chat with our AI assistant at any time."
+        actions_text += f"\n{self.t('action_items.chat_assistant')}"
         
         self.pdf.multi_cell(0, 6, actions_text)
 
-def generate_pdf_report(report_type, progress_data, business_type, language='en'):
-    """Main function to generate PDF report"""
+def render_pdf_report(report_type, progress_data, business_type, language='en', chart_profile=None,
+                      chart_backend=None):
+    """
+    Generate a PDF report and return it as bytes, or None if it failed.
+    
+    FPDF builds the document in a bytearray; it is converted to bytes once here
+    (WSGI servers only send bytes) and no further copies are made on the way out.
+    """
     try:
-        generator = RegulaEasePDFGenerator(language=language)
-        
-        if report_type == 'comprehensive':
-            pdf_content = generator.generate_comprehensive_report(progress_data, business_type)
-        else:
-            # For specific report types, use comprehensive as base
-            pdf_content = generator.generate_comprehensive_report(progress_data, business_type)
-        
-        # Return PDF as BytesIO buffer
-        pdf_buffer = io.BytesIO()
-        pdf_buffer.write(pdf_content)
-        pdf_buffer.seek(0)
-        
-        return pdf_buffer
+        generator = RegulaEasePDFGenerator(language=language, chart_profile=chart_profile,
+                                           chart_backend=chart_backend)
+        return bytes(generator.generate_report(report_type, progress_data, business_type))
         
     except Exception as e:
         print(f"Error in generate_pdf_report: {e}")
         import traceback
     
         traceback.print_exc()
-        return None 
\ No newline at end of file
+        return None
+
+def generate_pdf_report(report_type, progress_data, business_type, language='en', chart_profile=None,
+                        chart_backend=None):
+    """Main function to generate PDF report, returned as a BytesIO buffer"""
+    pdf_content = render_pdf_report(report_type, progress_data, business_type, language, chart_profile,
+                                    chart_backend)
+    # A BytesIO created from bytes shares their memory until it is written to
+    return io.BytesIO(pdf_content) if pdf_content is not None else None
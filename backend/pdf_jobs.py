@@ -0,0 +1,255 @@
+"""
+Background PDF export jobs
+`POST /export-pdf?async=1` returns a job id straight away, and the report is
+rendered in the background. Clients poll the job and download the PDF when it
+is done, so slow reports don't hold an HTTP connection open behind the proxy.
+
+Job state and finished PDFs are kept in a directory rather than in memory, so
+any web worker on the machine can answer a poll for a job another worker ran.
+Results expire after a TTL, and the oldest are evicted beyond a count and size
+budget.
+"""
+
+import json
+import os
+import re
+import secrets
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from atomic_file import atomic_write
+
+JOB_STATUSES = ('queued', 'running', 'done', 'failed')
+
+# secrets.token_urlsafe(16), after the id of the machine that ran the job on Fly.io (lowercase hex)
+JOB_ID_PATTERN = re.compile(r'(?:(?P<instance>[0-9a-z]{1,32})-)?[A-Za-z0-9_-]{22}')
+
+
+def _setting(value, name, default):
+    """An explicit argument, else the environment variable, else the default"""
+    return value if value is not None else os.environ.get(name, default)
+
+
+class JobQueueFull(Exception):
+    """Too many jobs are waiting to run; retry later"""
+
+
+class PDFJobStore:
+    def __init__(self, directory=None, ttl=None, max_results=None, max_bytes=None, instance=None):
+        """
+        Args:
+            directory (str): Where job state and PDFs are kept (PDF_JOB_DIR)
+            ttl (float): Seconds a job and its PDF are kept after submission (PDF_JOB_TTL)
+            max_results (int): Finished jobs kept before the oldest are evicted (PDF_JOB_MAX_RESULTS)
+            max_bytes (int): Total size of kept PDFs before the oldest are evicted (PDF_JOB_MAX_BYTES)
+            instance (str): Machine running the jobs, prefixed to job ids (FLY_MACHINE_ID on Fly.io)
+        """
+        self.directory = directory or os.environ.get(
+            'PDF_JOB_DIR', os.path.join(tempfile.gettempdir(), 'regulaease-pdf-jobs')
+        )
+        self.ttl = float(_setting(ttl, 'PDF_JOB_TTL', 900))
+        self.max_results = int(_setting(max_results, 'PDF_JOB_MAX_RESULTS', 50))
+        self.max_bytes = int(_setting(max_bytes, 'PDF_JOB_MAX_BYTES', 50 * 1024 * 1024))
+        self.instance = _setting(instance, 'FLY_MACHINE_ID', None)
+        self.evictions = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, job_id, extension):
+        return os.path.join(self.directory, f"{job_id}.{extension}")
+
+    def _write_state(self, job):
+        atomic_write(self._path(job['job_id'], 'json'), json.dumps(job).encode('utf-8'))
+
+    def create(self, filename):
+        """Record a new queued job and return its state"""
+        job_id = secrets.token_urlsafe(16)
+        job = {
+            'job_id': f"{self.instance}-{job_id}" if self.instance else job_id,
+            'status': 'queued',
+            'filename': filename,
+            'created_at': time.time(),
+            'pid': os.getpid(),  # Web worker running the job
+            'finished_at': None,
+            'size': None,
+            'error': None
+        }
+        self._write_state(job)
+        return job
+
+    def valid_id(self, job_id):
+        """Whether a job id has the form create() gives it (anything else can't be a job)"""
+        match = JOB_ID_PATTERN.fullmatch(job_id or '')
+        return bool(match) and (match['instance'] is not None) == bool(self.instance)
+
+    def owner(self, job_id):
+        """The machine a job belongs to, if it isn't this one (so the request can be replayed there)"""
+        if self.instance and self.valid_id(job_id):
+            instance = JOB_ID_PATTERN.fullmatch(job_id)['instance']
+            if instance != self.instance:
+                return instance
+        return None
+
+    def get(self, job_id):
+        """Return a job's state, or None if it is unknown or expired"""
+        if not self.valid_id(job_id):
+            return None
+        try:
+            with open(self._path(job_id, 'json'), 'r', encoding='utf-8') as f:
+                job = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - job['created_at'] > self.ttl:
+            self.remove(job_id)
+            return None
+        if self._abandoned(job):
+            self.update(job, status='failed', finished_at=time.time(), error='PDF job was interrupted')
+        return job
+
+    def _abandoned(self, job):
+        """Whether an unfinished job's web worker has died (it would never finish)"""
+        if job['status'] not in ('queued', 'running') or not job.get('pid'):
+            return False
+        try:
+            os.kill(job['pid'], 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass  # Exists, owned by another user
+        return False
+
+    def update(self, job, **fields):
+        job.update(fields)
+        self._write_state(job)
+        return job
+
+    def save_result(self, job, pdf_content):
+        """Store a finished PDF and mark the job done"""
+        atomic_write(self._path(job['job_id'], 'pdf'), pdf_content)
+        return self.update(job, status='done', finished_at=time.time(), size=len(pdf_content))
+
+    def result_path(self, job_id):
+        return self._path(job_id, 'pdf')
+
+    def remove(self, job_id):
+        for extension in ('pdf', 'json'):
+            try:
+                os.remove(self._path(job_id, extension))
+            except FileNotFoundError:
+                pass
+
+    def jobs(self):
+        """All jobs in the store, oldest first"""
+        jobs = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    with open(os.path.join(self.directory, name), 'r', encoding='utf-8') as f:
+                        jobs.append(json.load(f))
+                except (OSError, ValueError):
+                    continue  # Removed or replaced by another process meanwhile
+        return sorted(jobs, key=lambda job: job['created_at'])
+
+    def sweep(self):
+        """Fail jobs whose web worker died, evict expired jobs, then the oldest finished ones beyond the budget"""
+        now = time.time()
+        finished = []
+        for job in self.jobs():
+            if now - job['created_at'] > self.ttl:
+                self.remove(job['job_id'])
+                self.evictions += 1
+                continue
+            if self._abandoned(job):
+                self.update(job, status='failed', finished_at=now, error='PDF job was interrupted')
+            if job['status'] in ('done', 'failed'):
+                finished.append(job)
+
+        total_bytes = sum(job['size'] or 0 for job in finished)
+        while finished and (len(finished) > self.max_results or total_bytes > self.max_bytes):
+            oldest = finished.pop(0)
+            total_bytes -= oldest['size'] or 0
+            self.remove(oldest['job_id'])
+            self.evictions += 1
+
+    def stats(self):
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        for job in self.jobs():
+            counts[job['status']] = counts.get(job['status'], 0) + 1
+        return {**counts, 'evictions': self.evictions}
+
+
+class PDFJobRunner:
+    def __init__(self, store, threads=None, max_pending=None):
+        """
+        Args:
+            store (PDFJobStore): Where job state and results are kept
+            threads (int): Jobs run at once by this process (PDF_JOB_THREADS)
+            max_pending (int): Jobs this process accepts before refusing new ones (PDF_JOB_MAX_PENDING)
+        """
+        self.store = store
+        self.threads = int(_setting(threads, 'PDF_JOB_THREADS', 1))
+        self.max_pending = int(_setting(max_pending, 'PDF_JOB_MAX_PENDING', 20))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def submit(self, filename, render, *args):
+        """
+        Queue render(*args) as a background job producing PDF bytes.
+
+        Raises:
+            JobQueueFull: This process already has max_pending unfinished jobs
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull()
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='pdf-job')
+
+        job = None
+        try:
+            self.store.sweep()
+            job = self.store.create(filename)
+            self._executor.submit(self._run, job, render, args)
+        except BaseException:
+            # Give the slot back, or enough failures (a full disk) would refuse every later job
+            with self._lock:
+                self._pending -= 1
+            if job is not None:
+                try:
+                    self.store.update(job, status='failed', finished_at=time.time(), error='PDF job could not start')
+                except OSError:
+                    pass
+            raise
+        return job
+
+    def _run(self, job, render, args):
+        try:
+            self.store.update(job, status='running')
+            pdf_content = render(*args)
+            if pdf_content:
+                self.store.save_result(job, pdf_content)
+            else:
+                self.store.update(job, status='failed', finished_at=time.time(), error='Failed to generate PDF report')
+        except Exception as e:
+            print(f"PDF job {job['job_id']} failed: {e}")
+            self.store.update(job, status='failed', finished_at=time.time(), error='PDF generation failed')
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def stats(self):
+        return {**self.store.stats(), 'pending_here': self._pending, 'max_pending': self.max_pending}
+
+    def shutdown(self):
+        """Wait for running jobs to finish; jobs still queued are dropped"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+pdf_job_store = PDFJobStore()
+pdf_jobs = PDFJobRunner(pdf_job_store)
@@ -0,0 +1,52 @@
+"""
+Pre-rendered response bodies for read-only API responses
+A body is serialized once and compressed once per encoding, so serving it only
+means picking the variant that matches the client's Accept-Encoding header.
+"""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Brotli variants are skipped when the package isn't installed
+
+# Preferred encodings, best first
+ENCODINGS = ('br', 'gzip')
+
+
+class PrerenderedBody:
+    def __init__(self, body, etag, mimetype='application/json'):
+        self.etag = etag  # Strong validator for the identity body; encoded variants get a suffix
+        self.mimetype = mimetype
+        self.variants = {'identity': body}
+
+        compressed = {'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed['br'] = brotli.compress(body, quality=11)
+
+        # Only keep compressed variants that are actually smaller
+        for encoding, data in compressed.items():
+            if len(data) < len(body):
+                self.variants[encoding] = data
+
+    def select(self, accept_encodings):
+        """
+        Pick the best variant for a request.
+
+        Args:
+            accept_encodings: The request's parsed Accept-Encoding header (werkzeug Accept)
+
+        Returns:
+            tuple: (encoding, body bytes, etag), where encoding is 'identity' if uncompressed
+        """
+        best = 'identity'
+        best_quality = 0
+        for encoding in ENCODINGS:
+            if encoding not in self.variants:
+                continue
+            quality = accept_encodings[encoding]
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        etag = self.etag if best == 'identity' else f"{self.etag}-{best}"
+        return best, self.variants[best], etag
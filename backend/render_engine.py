@@ -0,0 +1,200 @@
+"""
+Process pool for PDF report rendering
+Report generation is CPU-bound (chart drawing and FPDF assembly). Run inside
+a request thread, it holds the GIL and slows every other endpoint, so
+/export-pdf hands jobs to a small pool of warm worker processes instead. The
+pool limits how many jobs may wait, times jobs out (killing the worker, so a
+runaway report can't hold it), and recycles workers after a number of jobs to
+contain memory growth.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+class RenderQueueFull(Exception):
+    """Every worker is busy and the queue is at its limit; retry later"""
+
+
+class RenderTimeout(Exception):
+    """A job didn't finish within the per-job timeout"""
+
+
+def _init_worker():
+    """Preload the PDF stack, so the first job in a new worker doesn't pay for the imports"""
+    from pdf_generator import warm_up
+    warm_up()
+
+
+def render_report_bytes(report_type, progress_data, business_type, language='en', chart_profile=None,
+                        chart_backend=None):
+    """Render a report and return the PDF bytes, or None if it failed (runs in a worker process, or inline)"""
+    from pdf_generator import render_pdf_report
+    return render_pdf_report(report_type, progress_data, business_type, language, chart_profile, chart_backend)
+
+
+class RenderEngine:
+    def __init__(self, workers=None, max_queue=None, timeout=None, max_jobs_per_worker=None, retry_after=None):
+        """
+        Args:
+            workers (int): Worker processes; 0 renders in the request thread (PDF_RENDER_WORKERS)
+            max_queue (int): Jobs allowed to wait for a free worker (PDF_RENDER_QUEUE)
+            timeout (float): Seconds a request waits for its job (PDF_RENDER_TIMEOUT)
+            max_jobs_per_worker (int): Jobs before a worker is replaced (PDF_RENDER_MAX_JOBS)
+            retry_after (int): Retry-After seconds suggested when the queue is full (PDF_RENDER_RETRY_AFTER)
+        """
+        def setting(value, name, default):
+            return value if value is not None else os.environ.get(name, default)
+
+        self.workers = int(setting(workers, 'PDF_RENDER_WORKERS', 1))
+        self.max_queue = int(setting(max_queue, 'PDF_RENDER_QUEUE', 8))
+        self.timeout = float(setting(timeout, 'PDF_RENDER_TIMEOUT', 60))
+        self.max_jobs_per_worker = int(setting(max_jobs_per_worker, 'PDF_RENDER_MAX_JOBS', 100))
+        self.retry_after = int(setting(retry_after, 'PDF_RENDER_RETRY_AFTER', 5))
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._slot_free = threading.Condition(self._lock)
+        self._pending = 0
+        self._timed_out = set()  # Futures abandoned by run(), so they aren't also counted as failures
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.failures = 0
+
+    @property
+    def max_pending(self):
+        """Jobs running plus jobs waiting"""
+        return self.workers + self.max_queue
+
+    def _get_executor(self):
+        if self._executor is None:
+            # spawn: forking a threaded web worker can copy held locks into the child
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                max_tasks_per_child=self.max_jobs_per_worker or None
+            )
+        return self._executor
+
+    def start(self):
+        """Start the worker processes ahead of the first job"""
+        if self.workers <= 0:
+            _init_worker()
+            return
+        with self._lock:
+            executor = self._get_executor()
+        for future in [executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def run(self, function, *args, wait=0):
+        """
+        Run function(*args) on a worker process and return its result.
+
+        Args:
+            wait (float): Seconds to wait for room in the queue before giving up (0 refuses straight away)
+
+        Raises:
+            RenderQueueFull: Too many jobs are already running or waiting
+            RenderTimeout: The job took longer than the timeout
+        """
+        if self.workers <= 0:
+            try:
+                result = function(*args)
+            except Exception:
+                with self._lock:
+                    self.failures += 1
+                raise
+            with self._lock:
+                self.completed += 1
+            return result
+
+        with self._lock:
+            if wait > 0:
+                self._slot_free.wait_for(lambda: self._pending < self.max_pending, timeout=wait)
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise RenderQueueFull()
+            executor = self._get_executor()
+            try:
+                future = executor.submit(function, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool
+                self._executor = None
+                executor = self._get_executor()
+                future = executor.submit(function, *args)
+            self._pending += 1
+        future.add_done_callback(self._job_finished)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+                self._timed_out.add(future)
+            if not future.cancel():
+                # The job is running, and only stops with its worker
+                self._terminate(executor)
+            raise RenderTimeout()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def _terminate(self, executor):
+        """
+        Kill a pool's workers so a runaway job frees its slot now, not when it ends.
+        Other jobs running in the pool fail with BrokenProcessPool, and the next
+        job starts a fresh pool.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        # ProcessPoolExecutor has no public way to stop a running job (kill_workers() is Python 3.14+)
+        for process in list((executor._processes or {}).values()):
+            process.kill()
+        # Returns once the pool has failed its futures, so their slots are free
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    def _job_finished(self, future):
+        with self._lock:
+            self._pending -= 1
+            self._slot_free.notify()
+            if future in self._timed_out:
+                # Already counted as a timeout
+                self._timed_out.discard(future)
+            elif not future.cancelled() and future.exception() is None:
+                self.completed += 1
+            elif not future.cancelled():
+                self.failures += 1
+
+    def render(self, report_type, progress_data, business_type, language='en', chart_profile=None,
+               chart_backend=None, wait=0):
+        """Render a report on the pool, returning the PDF bytes"""
+        return self.run(render_report_bytes, report_type, progress_data, business_type, language,
+                        chart_profile, chart_backend, wait=wait)
+
+    def stats(self):
+        return {
+            'workers': self.workers,
+            'pending': self._pending,
+            'max_pending': self.max_pending,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'timeouts': self.timeouts,
+            'failures': self.failures
+        }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+render_engine = RenderEngine()
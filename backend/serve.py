@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Production launcher for RegulaEase
+Runs the app under gunicorn with several workers instead of the Werkzeug
+development server used by `python app.py`. Defaults suit the Fly.io
+shared-cpu-1x / 512MB machine; every setting can be overridden with a flag
+or an environment variable.
+
+Usage:
+    python serve.py                      # WSGI (Flask) with threaded workers
+    python serve.py --mode asgi          # Async mode, see asgi.py
+    python serve.py --workers 3 --threads 4
+"""
+
+import argparse
+import os
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Defaults for a shared-cpu-1x VM with 512MB: two processes fit in memory and
+# let one worker keep serving while the other renders a PDF
+DEFAULTS = {
+    'mode': 'wsgi',
+    'workers': 2,
+    'threads': 8,
+    'keepalive': 75,          # Longer than the Fly proxy's idle timeout, so it closes connections first
+    'timeout': 120,           # Slow PDF exports must finish before a worker is considered hung
+    'graceful_timeout': 30,   # Time in-flight requests get to finish on SIGTERM
+    'max_requests': 1000,     # Recycle workers periodically to contain memory growth
+    'max_requests_jitter': 100,
+}
+
+ENV_VARS = {
+    'mode': 'SERVER_MODE',
+    'workers': 'WEB_WORKERS',
+    'threads': 'WEB_THREADS',
+    'keepalive': 'WEB_KEEPALIVE',
+    'timeout': 'WEB_TIMEOUT',
+    'graceful_timeout': 'WEB_GRACEFUL_TIMEOUT',
+    'max_requests': 'WEB_MAX_REQUESTS',
+    'max_requests_jitter': 'WEB_MAX_REQUESTS_JITTER',
+}
+
+
+def parse_args(argv=None):
+    """Parse command line flags, falling back to environment variables and then DEFAULTS"""
+    def default(name):
+        value = os.environ.get(ENV_VARS[name], DEFAULTS[name])
+        return value if name == 'mode' else int(value)
+
+    parser = argparse.ArgumentParser(description="Run the RegulaEase API with gunicorn")
+    parser.add_argument('--mode', choices=['wsgi', 'asgi'], default=default('mode'),
+                        help="wsgi runs the Flask app on threaded workers; asgi runs asgi.application")
+    parser.add_argument('--bind', default=f"0.0.0.0:{os.environ.get('PORT', 8080)}")
+    parser.add_argument('--workers', type=int, default=default('workers'))
+    parser.add_argument('--threads', type=int, default=default('threads'),
+                        help="Threads per worker (in asgi mode, threads for the non-chatbot routes)")
+    parser.add_argument('--keepalive', type=int, default=default('keepalive'),
+                        help="Seconds to hold idle keep-alive connections")
+    parser.add_argument('--timeout', type=int, default=default('timeout'),
+                        help="Seconds before a silent worker is restarted")
+    parser.add_argument('--graceful-timeout', type=int, default=default('graceful_timeout'),
+                        help="Seconds to finish in-flight requests on shutdown")
+    parser.add_argument('--max-requests', type=int, default=default('max_requests'),
+                        help="Requests before a worker is recycled (0 disables)")
+    parser.add_argument('--max-requests-jitter', type=int, default=default('max_requests_jitter'))
+    return parser.parse_args(argv)
+
+
+def build_options(args):
+    """Translate parsed arguments into gunicorn settings"""
+    options = {
+        'bind': args.bind,
+        'workers': args.workers,
+        'keepalive': args.keepalive,
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests_jitter,
+        'accesslog': '-',
+        'errorlog': '-',
+    }
+    if args.mode == 'asgi':
+        options['worker_class'] = asgi_worker_class()
+    else:
+        options['worker_class'] = 'gthread'
+        options['threads'] = args.threads
+    return options
+
+
+def asgi_worker_class():
+    """The gunicorn worker class that runs ASGI apps under uvicorn"""
+    try:
+        import uvicorn_worker  # noqa: F401
+        return 'uvicorn_worker.UvicornWorker'
+    except ImportError:
+        return 'uvicorn.workers.UvicornWorker'
+
+
+def load_application(mode):
+    if mode == 'asgi':
+        from asgi import application
+        return application  # Starts the PDF prewarm from its lifespan startup
+    from app import app, start_pdf_prewarm
+    # The listening socket is already bound, so requests queue while the worker prewarms
+    start_pdf_prewarm()
+    return app
+
+
+def main(argv=None):
+    from gunicorn.app.base import BaseApplication
+
+    class RegulaEaseServer(BaseApplication):
+        def __init__(self, mode, options):
+            self.mode = mode
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return load_application(self.mode)
+
+    args = parse_args(argv)
+    if args.mode == 'asgi':
+        # Threads for the Flask routes served by the ASGI app
+        os.environ['ASGI_THREADS'] = str(args.threads)
+
+    options = build_options(args)
+    print(f"Starting RegulaEase API ({args.mode}) on {args.bind}")
+    print(f"Workers: {args.workers}, threads: {args.threads}, timeout: {args.timeout}s")
+    RegulaEaseServer(args.mode, options).run()
+
+
+if __name__ == '__main__':
+    main()
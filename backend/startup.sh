@@ -11,5 +11,5 @@ if [ ! -f "/app/data/checklist.json" ]; then
     fi
 fi
 
-# Start the Python application
-python app.py 
\ No newline at end of file
+# Start the Python application under gunicorn (see serve.py for tuning options)
+exec python serve.py 
\ No newline at end of file
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Startup profiler for the RegulaEase backend
+Starts the app in fresh interpreters with `python -X importtime`, and reports
+per-module import times plus how long a cold process takes to answer its
+first request, as JSON. With a budget file it exits with status 1 when
+startup has regressed past the budget, so it can gate a build.
+
+Usage:
+    python startup_profiler.py                              # JSON report on stdout
+    python startup_profiler.py --runs 5 --output startup.json
+    python startup_profiler.py --budget startup_budget.json # Fails if over budget
+    STARTUP_BUDGET=startup_budget.json python startup_profiler.py
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+READY_MARKER = 'STARTUP_READY'
+
+# First-party modules reported individually; everything else is grouped by top-level package
+FIRST_PARTY_MODULES = sorted(
+    name[:-3] for name in os.listdir(BACKEND_DIR)
+    if name.endswith('.py') and not name.startswith(('test_', 'bench_')) and name != 'startup_profiler.py'
+)
+
+# Runs in the child interpreter: import the app, answer one request, then load the PDF stack
+CHILD_SCRIPT = f"""
+import json, sys, time
+started = time.perf_counter()
+from app import app, startup_metrics
+response = app.test_client().get('/health')
+ready = time.perf_counter()
+print({READY_MARKER!r}, flush=True)
+import pdf_generator
+pdf_loaded = time.perf_counter()
+print(json.dumps({{
+    'status': response.status_code,
+    'app_import_ms': startup_metrics['app_import'] * 1000,
+    'first_request_ms': (ready - started) * 1000,
+    'pdf_stack_import_ms': (pdf_loaded - ready) * 1000
+}}), flush=True)
+"""
+
+
+def parse_importtime(output):
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        dict: Module name -> {'self_us': int, 'cumulative_us': int}
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        modules[name.strip()] = {'self_us': int(self_us), 'cumulative_us': int(cumulative_us)}
+    return modules
+
+
+def profile_once():
+    """Start one cold interpreter and time its startup"""
+    env = {**os.environ, 'PDF_PREWARM': 'false', 'PYTHONDONTWRITEBYTECODE': '1'}
+    started = time.perf_counter()
+    child = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c', CHILD_SCRIPT],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    process_ready_ms = None
+    result = None
+    for line in child.stdout:
+        if line.strip() == READY_MARKER:
+            process_ready_ms = (time.perf_counter() - started) * 1000
+        elif line.startswith('{'):
+            result = json.loads(line)
+    stderr = child.stderr.read()
+    if child.wait() != 0 or result is None or process_ready_ms is None:
+        raise RuntimeError(f"Startup profile run failed:\n{stderr}")
+
+    result['process_ready_ms'] = process_ready_ms
+    result['imports'] = parse_importtime(stderr)
+    return result
+
+
+def summarize(runs):
+    """Combine several profile runs into a report of medians (milliseconds)"""
+    def median_ms(values):
+        return round(statistics.median(values), 1)
+
+    report = {
+        'python': platform.python_version(),
+        'runs': len(runs),
+        # Interpreter start until the first request has been answered
+        'process_ready_ms': median_ms([run['process_ready_ms'] for run in runs]),
+        'app_import_ms': median_ms([run['app_import_ms'] for run in runs]),
+        'first_request_ms': median_ms([run['first_request_ms'] for run in runs]),
+        # Loaded on the first /export-pdf request (or by the background prewarm)
+        'pdf_stack_import_ms': median_ms([run['pdf_stack_import_ms'] for run in runs]),
+        'modules': {},
+        'packages': {}
+    }
+
+    for name in FIRST_PARTY_MODULES:
+        samples = [run['imports'][name] for run in runs if name in run['imports']]
+        if samples:
+            report['modules'][name] = {
+                'self_ms': median_ms([sample['self_us'] / 1000 for sample in samples]),
+                'cumulative_ms': median_ms([sample['cumulative_us'] / 1000 for sample in samples])
+            }
+
+    # Third-party top-level packages, heaviest first
+    packages = {}
+    for run in runs:
+        for name, timing in run['imports'].items():
+            if '.' not in name and name not in FIRST_PARTY_MODULES:
+                packages.setdefault(name, []).append(timing['cumulative_us'] / 1000)
+    heaviest = sorted(packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)[:15]
+    report['packages'] = {name: median_ms(samples) for name, samples in heaviest}
+    return report
+
+
+def check_budget(report, budget):
+    """
+    Compare a report against a budget.
+
+    Budget keys match the report's top-level timings, plus `modules`
+    mapping module names to a cumulative import budget.
+
+    Returns:
+        list: Descriptions of every value over budget (empty if within budget)
+    """
+    failures = []
+    for key, limit in budget.items():
+        if key == 'modules':
+            continue
+        if key in report and report[key] > limit:
+            failures.append(f"{key}: {report[key]}ms > {limit}ms")
+    for name, limit in budget.get('modules', {}).items():
+        timing = report['modules'].get(name)
+        if timing and timing['cumulative_ms'] > limit:
+            failures.append(f"import {name}: {timing['cumulative_ms']}ms > {limit}ms")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile backend startup time")
+    parser.add_argument('--runs', type=int, default=3, help="Cold starts to measure (the report holds medians)")
+    parser.add_argument('--output', help="Write the JSON report to this file instead of stdout")
+    parser.add_argument('--budget', default=os.environ.get('STARTUP_BUDGET'),
+                        help="JSON budget file; exit with status 1 when over budget (STARTUP_BUDGET)")
+    args = parser.parse_args(argv)
+
+    report = summarize([profile_once() for _ in range(args.runs)])
+
+    if args.budget:
+        with open(args.budget, 'r', encoding='utf-8') as f:
+            failures = check_budget(report, json.load(f))
+        report['budget'] = {'file': args.budget, 'passed': not failures, 'failures': failures}
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.budget:
+        for failure in report['budget']['failures']:
+            print(f"❌ Over startup budget: {failure}", file=sys.stderr)
+        if report['budget']['failures']:
+            return 1
+        print("✅ Startup within budget", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Sync the PDF translation catalogs from the frontend locales
+The frontend's src/locales/<language>.json files are the one source for every
+translation. This copies their `pdf` namespace to locales/<language>.json, which
+the backend image ships and pdf_translations.py loads, then compiles each
+language to the pickled lookup table used at runtime.
+
+Usage:
+    python sync_locales.py             # Extract from the frontend, then compile
+    python sync_locales.py --check     # Exit with status 1 if locales/ is out of date
+    python sync_locales.py --compile   # Only compile locales/ (no frontend needed, e.g. in the Docker build)
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import pdf_translations
+from pdf_translations import LOCALES_DIR, catalog_path, compile_catalog
+
+FRONTEND_LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'frontend', 'src', 'locales')
+NAMESPACE = 'pdf'
+
+
+def extract_catalogs(frontend_dir=FRONTEND_LOCALES_DIR):
+    """
+    Read the `pdf` namespace of every frontend locale.
+
+    Returns:
+        dict: Language code -> nested catalog
+    """
+    catalogs = {}
+    for name in sorted(os.listdir(frontend_dir)):
+        if not name.endswith('.json'):
+            continue
+        with open(os.path.join(frontend_dir, name), 'r', encoding='utf-8') as f:
+            locale = json.load(f)
+        if NAMESPACE in locale:
+            catalogs[name[:-5]] = locale[NAMESPACE]
+    return catalogs
+
+
+def render_catalog(catalog):
+    return json.dumps(catalog, indent=2, ensure_ascii=False) + '\n'
+
+
+def out_of_date(catalogs, locales_dir=LOCALES_DIR):
+    """Languages whose file in locales/ doesn't match the frontend, plus files with no frontend source"""
+    stale = []
+    for language, catalog in catalogs.items():
+        path = os.path.join(locales_dir, f"{language}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if f.read() == render_catalog(catalog):
+                    continue
+        except FileNotFoundError:
+            pass
+        stale.append(language)
+    stale.extend(name[:-5] for name in sorted(os.listdir(locales_dir))
+                 if name.endswith('.json') and name[:-5] not in catalogs)
+    return stale
+
+
+def write_catalogs(catalogs, locales_dir=LOCALES_DIR):
+    """Write each catalog to locales/, removing languages the frontend no longer has"""
+    os.makedirs(locales_dir, exist_ok=True)
+    for language in out_of_date(catalogs, locales_dir):
+        path = os.path.join(locales_dir, f"{language}.json")
+        if language in catalogs:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(render_catalog(catalogs[language]))
+            print(f"Updated {os.path.relpath(path)}")
+        else:
+            os.remove(path)
+            print(f"Removed {os.path.relpath(path)}")
+
+
+def compile_all():
+    """Compile every language in locales/ to its pickled lookup table"""
+    languages = pdf_translations.find_languages()
+    for language in languages:
+        compile_catalog(language)
+    print(f"Compiled {len(languages)} PDF catalogs: {', '.join(languages)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync PDF translation catalogs from the frontend locales")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--check', action='store_true', help="Exit with status 1 if locales/ is out of date")
+    mode.add_argument('--compile', action='store_true', help="Only compile the catalogs already in locales/")
+    parser.add_argument('--frontend-dir', default=FRONTEND_LOCALES_DIR, help="Frontend src/locales directory")
+    args = parser.parse_args(argv)
+
+    if not args.compile:
+        catalogs = extract_catalogs(args.frontend_dir)
+        if 'en' not in catalogs:
+            print(f"❌ No '{NAMESPACE}' namespace in {args.frontend_dir}/en.json", file=sys.stderr)
+            return 1
+        if args.check:
+            stale = out_of_date(catalogs)
+            for language in stale:
+                print(f"❌ {catalog_path(language)} is out of date; run python sync_locales.py", file=sys.stderr)
+            if stale:
+                return 1
+            print("✅ PDF catalogs match the frontend locales", file=sys.stderr)
+            return 0
+        write_catalogs(catalogs)
+
+    compile_all()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test script for the async (ASGI) serving mode
+Checks that routes behave exactly like the Flask app and that slow chatbot
+calls don't hold up other requests. Uses a local stand-in for the Groq API.
+"""
+
+import asyncio
+import json
+import time
+
+from asgiref.wsgi import WsgiToAsgiInstance
+import httpx
+
+import groq_client
+from app import app
+from asgi import RegulaEaseASGI, application
+from groq_client import AsyncGroqClient
+from test_groq_client import start_stand_in_server, with_api_key
+
+
+def run_with_stand_in(server, coroutine_function, asgi_app=application):
+    """Run a test coroutine with an httpx client for the ASGI app, Groq pointed at the stand-in"""
+    async def runner():
+        groq_client._async_client = AsyncGroqClient(base_url=server.base_url)
+        transport = httpx.ASGITransport(app=asgi_app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                return await coroutine_function(client)
+        finally:
+            await groq_client.close_async_groq_client()
+
+    try:
+        return asyncio.run(runner())
+    finally:
+        server.shutdown()
+
+
+def test_routes_match_flask():
+    """Responses from the ASGI app match the Flask app"""
+    flask_client = app.test_client()
+    requests_to_compare = [
+        ('GET', '/health', {}),
+        ('GET', '/checklist?type=retail', {}),
+        ('GET', '/skills', {}),
+        ('POST', '/chatbot', {'json': {'message': ''}}),
+        ('POST', '/chatbot', {'json': {'message': 5}}),
+        ('POST', '/chatbot', {'content': 'not json'}),
+    ]
+
+    async def compare(client):
+        for method, path, kwargs in requests_to_compare:
+            headers = {'Origin': 'http://localhost:3000'}
+            asgi_response = await client.request(method, path, headers=headers, **kwargs)
+            flask_kwargs = {'json': kwargs['json']} if 'json' in kwargs else {'data': kwargs.get('content')}
+            flask_response = flask_client.open(path, method=method, headers=headers, **flask_kwargs)
+
+            assert asgi_response.status_code == flask_response.status_code, path
+            assert asgi_response.content == flask_response.get_data(), path
+            assert asgi_response.headers.get('Access-Control-Allow-Origin') == \
+                flask_response.headers.get('Access-Control-Allow-Origin'), path
+
+    run_with_stand_in(start_stand_in_server(), compare)
+    print("✅ ASGI responses match Flask")
+
+
+@with_api_key
+def test_chatbot_does_not_block_other_routes():
+    """Slow Groq calls don't delay /health"""
+    async def burst(client):
+        chats = [
+            asyncio.create_task(client.post('/chatbot', json={'message': f'Question {i}', 'cache': False}))
+            for i in range(8)
+        ]
+        await asyncio.sleep(0.05)
+
+        started = time.monotonic()
+        health = await client.get('/health')
+        health_time = time.monotonic() - started
+
+        replies = await asyncio.gather(*chats)
+        return health, health_time, replies
+
+    health, health_time, replies = run_with_stand_in(start_stand_in_server(delay=0.5), burst)
+    assert health.status_code == 200
+    assert health_time < 0.3
+    for i, reply in enumerate(replies):
+        assert reply.status_code == 200
+        assert reply.json() == {
+            'user_message': f'Question {i}',
+            'bot_response': f'Answer to: Question {i}',
+            'context': {'tone': 'professional', 'business_type': None, 'conversation_length': 0}
+        }
+    print(f"✅ /health answered in {health_time * 1000:.0f}ms during a chatbot burst")
+
+
+def test_wsgi_routes_run_in_parallel():
+    """Flask routes run on the thread pool side by side, and each response is closed"""
+    # The adapter reuses these from asgiref; an asgiref release without them must fail here, not in production
+    assert callable(getattr(WsgiToAsgiInstance, 'build_environ', None))
+    assert callable(getattr(WsgiToAsgiInstance, 'start_response', None))
+
+    closed = []
+
+    class SlowBody:
+        def __iter__(self):
+            time.sleep(0.3)
+            yield b'done'
+
+        def close(self):
+            closed.append(True)
+
+    def slow_app(environ, start_response):
+        start_response('200 OK', [('Content-Type', 'text/plain'), ('Content-Length', '4')])
+        return SlowBody()
+
+    async def requests(client):
+        started = time.monotonic()
+        responses = await asyncio.gather(*[client.get('/') for _ in range(3)])
+        return responses, time.monotonic() - started
+
+    responses, elapsed = run_with_stand_in(start_stand_in_server(), requests,
+                                           asgi_app=RegulaEaseASGI(slow_app, threads=4))
+    assert [response.text for response in responses] == ['done'] * 3
+    assert elapsed < 0.8
+    assert closed == [True] * 3
+    print(f"✅ Flask routes run in parallel ({elapsed:.2f}s for 3 slow requests)")
+
+
+@with_api_key
+def test_chatbot_concurrency_limit():
+    """No more than the configured number of chatbot calls wait on Groq at once"""
+    limited = RegulaEaseASGI(app, max_concurrency=2)
+
+    async def burst(client):
+        started = time.monotonic()
+        replies = await asyncio.gather(*[
+            client.post('/chatbot', json={'message': f'Question {i}', 'cache': False}) for i in range(4)
+        ])
+        return replies, time.monotonic() - started
+
+    replies, elapsed = run_with_stand_in(start_stand_in_server(delay=0.3), burst, asgi_app=limited)
+    assert all(reply.status_code == 200 for reply in replies)
+    assert elapsed >= 0.6
+    print(f"✅ Concurrency limit applied ({elapsed:.2f}s for 4 calls, 2 at a time)")
+
+
+@with_api_key
+def test_streaming_chatbot():
+    """Streaming over ASGI sends the same events as the Flask route"""
+    async def stream(client):
+        return await client.post('/chatbot?stream=1', json={'message': 'When is VAT due?', 'tone': 'casual'})
+
+    response = run_with_stand_in(start_stand_in_server(), stream)
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+
+    events = [frame for frame in response.text.split('\n\n') if frame]
+    tokens = [json.loads(frame[len('data: '):])['token'] for frame in events[:-1]]
+    event_line, data_line = events[-1].split('\n')
+    done = json.loads(data_line[len('data: '):])
+    assert event_line == 'event: done'
+    assert ''.join(tokens) == "Answer to: When is VAT due? "
+    assert done['context'] == {'tone': 'casual', 'business_type': None, 'conversation_length': 0}
+    print("✅ Streaming works over ASGI")
+
+
+@with_api_key
+def test_streaming_chatbot_interrupted():
+    """An upstream failure mid-reply ends the ASGI stream with an error event"""
+    async def stream(client):
+        return await client.post('/chatbot?stream=1', json={'message': 'When is VAT due?'})
+
+    response = run_with_stand_in(start_stand_in_server(fail_mid_stream=True), stream)
+    events = [frame for frame in response.text.split('\n\n') if frame]
+    assert [json.loads(frame[len('data: '):])['token'] for frame in events[:-1]] == ["Answer "]
+    assert events[-1].startswith('event: error\n')
+    print("✅ Interrupted streams end with an error event over ASGI")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase ASGI Test")
+    print("=" * 50)
+
+    test_routes_match_flask()
+    test_chatbot_does_not_block_other_routes()
+    test_wsgi_routes_run_in_parallel()
+    test_chatbot_concurrency_limit()
+    test_streaming_chatbot()
+    test_streaming_chatbot_interrupted()
+
+    print("\n✅ All tests passed!")
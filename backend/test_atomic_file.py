@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test script for atomic file writes (atomic_file.py)
+"""
+
+import os
+import tempfile
+
+from atomic_file import atomic_write
+
+
+def test_replaces_file():
+    """The file is created or replaced in one step and no temporary file is left"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'report.pdf')
+        atomic_write(path, b'%PDF-first')
+        atomic_write(path, b'%PDF-second')
+        with open(path, 'rb') as f:
+            assert f.read() == b'%PDF-second'
+        assert os.listdir(directory) == ['report.pdf']
+    print("✅ File replaced atomically")
+
+
+def test_failed_write_keeps_old_file():
+    """A failed write leaves the old content and removes its temporary file"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'state.json')
+        atomic_write(path, b'{"status": "queued"}')
+        try:
+            atomic_write(path, 'not bytes')
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Writing text should fail")
+        with open(path, 'rb') as f:
+            assert f.read() == b'{"status": "queued"}'
+        assert os.listdir(directory) == ['state.json']
+    print("✅ Failed write keeps the old file")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase Atomic File Write Test")
+    print("=" * 50)
+
+    test_replaces_file()
+    test_failed_write_keeps_old_file()
+
+    print("\n✅ All tests passed!")
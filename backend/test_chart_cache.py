@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for the chart image cache
+"""
+
+import copy
+
+import pdf_generator
+from chart_cache import ChartImageCache, make_chart_key
+from pdf_generator import RegulaEasePDFGenerator, generate_pdf_report
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+
+def test_chart_key():
+    """Keys follow what the chart shows: its panels, labels, profile and format"""
+    generator = RegulaEasePDFGenerator(chart_backend='png')
+    panels = generator.progress_chart_panels(SAMPLE_PROGRESS_DATA)
+    key = make_chart_key('png', 'screen', 'Progress Overview', panels)
+    assert make_chart_key('png', 'screen', 'Progress Overview', copy.deepcopy(panels)) == key
+    assert make_chart_key('svg', 'screen', 'Progress Overview', panels) != key
+    assert make_chart_key('png', 'print', 'Progress Overview', panels) != key
+
+    translated = RegulaEasePDFGenerator(language='zu', chart_backend='png')
+    assert make_chart_key('png', 'screen', translated.t('progress_overview'),
+                          translated.progress_chart_panels(SAMPLE_PROGRESS_DATA)) != key
+    print("✅ Chart keys follow the chart contents")
+
+
+def test_lru_byte_budget():
+    """The least recently used images are evicted to stay within the byte budget"""
+    cache = ChartImageCache(max_bytes=250)
+    cache.put('a', b'a' * 100)
+    cache.put('b', b'b' * 100)
+    assert cache.get('a') == b'a' * 100
+    cache.put('c', b'c' * 100)
+    assert cache.get('b') is None
+    assert cache.get('a') and cache.get('c')
+    cache.put('huge', b'h' * 300)
+    assert cache.get('huge') is None
+
+    stats = cache.stats()
+    assert stats['entries'] == 2 and stats['bytes'] == 200
+    assert stats['evictions'] == 1
+    print("✅ Chart cache stays within its byte budget")
+
+
+def test_reports_share_charts():
+    """Reports that differ only in their text sections reuse the chart image"""
+    saved = pdf_generator.chart_cache
+    pdf_generator.chart_cache = cache = ChartImageCache()
+    try:
+        first = generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend='png')
+        other_text = copy.deepcopy(SAMPLE_PROGRESS_DATA)
+        other_text['quiz']['category'] = 'Tax Basics'
+        other_text['quiz']['completedAt'] = '2025-02-01'
+        second = generate_pdf_report('comprehensive', other_text, 'services', chart_backend='png')
+        assert first.getvalue().startswith(b'%PDF') and second.getvalue().startswith(b'%PDF')
+        assert (cache.stats()['misses'], cache.stats()['hits']) == (1, 1)
+
+        # Native charts are drawn into the page and never touch the cache
+        generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend='native')
+        assert cache.stats()['stores'] == 1 and cache.stats()['misses'] == 1
+    finally:
+        pdf_generator.chart_cache = saved
+    print("✅ Reports share cached chart images")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase Chart Cache Test")
+    print("=" * 50)
+
+    test_chart_key()
+    test_lru_byte_budget()
+    test_reports_share_charts()
+
+    print("\n✅ All tests passed!")
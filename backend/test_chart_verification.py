@@ -43,7 +43,9 @@ def test_chart_verification():
     try:
         # Generate PDF with charts
         print("Generating PDF with charts...")
-        pdf_buffer_with_charts = generate_pdf_report('comprehensive', sample_progress_data, business_type)
+        # The size and image checks below apply to raster (PNG) charts
+        pdf_buffer_with_charts = generate_pdf_report('comprehensive', sample_progress_data, business_type,
+                                                     chart_backend='png')
         
         if pdf_buffer_with_charts:
             with open('test_with_charts.pdf', 'wb') as f:
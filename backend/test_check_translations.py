@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for the PDF translation coverage check (check_translations.py)
+"""
+
+from check_translations import check_catalogs, find_key_usage, main
+from pdf_translations import get_catalog
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+from test_report_plans import render_text
+
+SOURCE = '''
+class Generator:
+    def render(self, plan, name):
+        self.t('report_title')
+        self.t('chart_labels.completed', 'Completed')
+        self.t(f"chart_titles.{name}")
+        self.t(plan['focus'])
+        get_translation('zu', key='generated')
+'''
+
+
+def test_key_usage():
+    """Literal keys, f-string patterns and unreadable keys are told apart"""
+    usage = find_key_usage(SOURCE, 'generator.py')
+    assert usage['keys'] == {
+        'report_title': ['generator.py:4'],
+        'chart_labels.completed': ['generator.py:5'],
+        'generated': ['generator.py:8']
+    }
+    assert [pattern.pattern for pattern in usage['patterns']] == [r'chart_titles\..+']
+    assert usage['dynamic'] == ["generator.py:7: self.t(plan['focus'])"]
+    print("✅ Key usage found in the source")
+
+
+def test_missing_unused_and_placeholders():
+    """A language missing a used key, holding an unused one or changing {fields} is reported"""
+    usage = find_key_usage(SOURCE, 'generator.py')
+    english = {
+        'language_name': 'English', 'report_title': 'Report', 'generated': 'Generated',
+        'chart_labels.completed': 'Completed', 'chart_titles.compliance_tasks': 'Compliance Tasks',
+        'quiz_analysis.review_incorrect': 'Review {count} topics'
+    }
+    zulu = dict(english, report_title='Umbiko', **{'quiz_analysis.review_incorrect': 'Buyekeza izihloko'})
+    del zulu['generated']
+
+    report = check_catalogs(usage, {'en': english, 'zu': zulu})
+    assert report['en'] == {'missing': [], 'unused': ['quiz_analysis.review_incorrect'], 'placeholders': []}
+    assert report['zu'] == {
+        'missing': ['generated'],
+        'unused': ['quiz_analysis.review_incorrect'],
+        'placeholders': ['quiz_analysis.review_incorrect']
+    }
+    print("✅ Missing, unused and placeholder problems reported")
+
+
+def test_catalogs_cover_report_code():
+    """Every language has every key the report code uses, and nothing else (the build runs the same check)"""
+    assert main([]) == 0
+    print("✅ Catalogs cover the report code")
+
+
+def test_analysis_sections_translated():
+    """The analysis and action item sections come from the catalog, not hard-coded English"""
+    content, _ = render_text('comprehensive')
+    assert b'Compliance Analysis' in content and b'Engagement Rate' in content
+    assert b'Review 3 topics where questions were answered incorrectly' in content
+    assert b'Complete the remaining 5 compliance tasks' in content and b'Number of Tasks' in content
+
+    content, _ = render_text('comprehensive', language='af')
+    for key in ('compliance_analysis.title', 'skills_analysis.title', 'quiz_analysis.title', 'action_items.title'):
+        assert get_catalog('af')[key].encode('latin-1') in content
+        assert get_catalog('en')[key].encode('latin-1') not in content
+
+    # No English left in a translated report, including chart axes and missing values
+    progress_data = dict(SAMPLE_PROGRESS_DATA, quiz={'score': 7, 'totalQuestions': 10})
+    content, _ = render_text('comprehensive', progress_data, language='zu')
+    assert b'Number of Tasks' not in content and b'N/A' not in content
+    assert get_catalog('zu')['not_available'].encode('latin-1') in content
+    assert get_catalog('zu')['action_items.continue_compliance'].format(count=5).encode('latin-1') in content
+    print("✅ Analysis sections translated")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase PDF Translation Coverage Test")
+    print("=" * 50)
+
+    test_key_usage()
+    test_missing_unused_and_placeholders()
+    test_catalogs_cover_report_code()
+    test_analysis_sections_translated()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test script for the /checklist and /skills endpoints
+Runs against the Flask test client, so no server needs to be running.
+"""
+
+import gzip
+import json
+
+from app import DATA_CACHE_CONTROL, app, build_cache_control, data_store
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def expected_body(key_name, key, items_name, filename):
+    """The body the endpoint returned before responses were pre-rendered"""
+    with app.app_context():
+        data = data_store.get(filename)
+        return app.json.response({key_name: key, items_name: data[key]}).get_data()
+
+
+def test_prerendered_encodings():
+    """Every encoding decodes to the same body jsonify would have produced"""
+    client = app.test_client()
+    expected = expected_body('business_type', 'retail', 'checklist', 'checklist.json')
+
+    response = client.get('/checklist?type=retail')
+    assert response.status_code == 200
+    assert response.headers.get('Content-Encoding') is None
+    assert response.get_data() == expected
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+    response = client.get('/checklist?type=retail', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()) == expected
+
+    if brotli is not None:
+        response = client.get('/checklist?type=retail', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['Content-Encoding'] == 'br'
+        assert brotli.decompress(response.get_data()) == expected
+
+        response = client.get('/checklist?type=retail', headers={'Accept-Encoding': 'gzip, br;q=0.5'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+    print("✅ Pre-rendered checklist encodings match")
+
+
+def test_skills_response_shape():
+    """Skills responses keep their shape, including the echoed category"""
+    client = app.test_client()
+    expected = expected_body('category', 'finance', 'resources', 'skills.json')
+
+    response = client.get('/skills?category=finance', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert gzip.decompress(response.get_data()) == expected
+
+    # Mixed-case requests are echoed back as sent
+    response = client.get('/skills?category=Finance')
+    assert response.status_code == 200
+    assert response.json['category'] == 'Finance'
+    assert response.json['resources'] == json.loads(expected)['resources']
+    print("✅ Skills responses keep their shape")
+
+
+def test_invalid_parameters():
+    """Missing and unknown parameters still return 400"""
+    client = app.test_client()
+    assert client.get('/checklist').status_code == 400
+    response = client.get('/checklist?type=bakery')
+    assert response.status_code == 400
+    assert 'retail' in response.json['available_types']
+    assert client.get('/skills?category=cooking').status_code == 400
+    print("✅ Invalid parameters are rejected")
+
+
+def test_conditional_requests():
+    """Clients holding the current ETag get an empty 304"""
+    client = app.test_client()
+
+    response = client.get('/checklist?type=services')
+    etag = response.headers['ETag']
+    assert response.headers['Cache-Control'] == DATA_CACHE_CONTROL
+
+    response = client.get('/checklist?type=services', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert response.headers['ETag'] == etag
+    assert 'Cache-Control' in response.headers
+
+    # Each encoding has its own validator
+    gzipped = client.get('/checklist?type=services', headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.headers['ETag'] != etag
+    response = client.get('/checklist?type=services', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': gzipped.headers['ETag']
+    })
+    assert response.status_code == 304
+
+    # Other keys and stale validators get the full body
+    response = client.get('/checklist?type=retail', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+    # Mixed-case requests are validated too
+    response = client.get('/skills?category=Legal')
+    response = client.get('/skills?category=Legal', headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+    print("✅ Conditional requests return 304")
+
+
+def test_cache_control_header():
+    """Cache-Control follows the configured max-age and stale-while-revalidate"""
+    assert build_cache_control(300, 86400) == 'public, max-age=300, stale-while-revalidate=86400'
+    assert build_cache_control(60, 0) == 'public, max-age=60'
+    assert build_cache_control(0, 86400) == 'no-cache'
+    print("✅ Cache-Control header is configurable")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase Data Endpoints Test")
+    print("=" * 50)
+
+    test_prerendered_encodings()
+    test_skills_response_shape()
+    test_invalid_parameters()
+    test_conditional_requests()
+    test_cache_control_header()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the in-memory data store
+Checks that data files are parsed once and reloaded only when they change on disk
+"""
+
+import json
+import os
+import tempfile
+
+from data_store import DataStore
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_data_store_caching():
+    """Data is cached after the first load and reloaded when the file changes"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, 'checklist.json')
+        write_json(path, {'retail': ['register']})
+        store = DataStore(data_dir)
+
+        assert store.get('checklist.json') == {'retail': ['register']}
+        assert store.get('checklist.json') == {'retail': ['register']}
+        stats = store.stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+        assert stats['reloads'] == 0
+        first_version = stats['datasets']['checklist.json']
+
+        # Edit the file in place, as happens on the Fly volume
+        write_json(path, {'retail': ['register', 'tax']})
+        os.utime(path, ns=(0, 10 ** 18))
+
+        assert store.get('checklist.json') == {'retail': ['register', 'tax']}
+        stats = store.stats()
+        assert stats['reloads'] == 1
+        assert stats['datasets']['checklist.json'] != first_version
+        print("✅ Data store caching works")
+
+
+def test_data_store_derived_values():
+    """Derived values are built once per dataset version"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        path = os.path.join(data_dir, 'skills.json')
+        write_json(path, {'finance': [1, 2]})
+        store = DataStore(data_dir)
+        calls = []
+
+        def count_resources(entry):
+            calls.append(entry.version)
+            return len(entry.data['finance'])
+
+        assert store.derive(store.get_entry('skills.json'), 'count', count_resources) == 2
+        assert store.derive(store.get_entry('skills.json'), 'count', count_resources) == 2
+        assert len(calls) == 1
+
+        write_json(path, {'finance': [1, 2, 3]})
+        os.utime(path, ns=(0, 10 ** 18))
+        assert store.derive(store.get_entry('skills.json'), 'count', count_resources) == 3
+        assert len(calls) == 2
+        print("✅ Derived values follow the dataset version")
+
+
+def test_data_store_missing_and_invalid_files():
+    """Missing and invalid files return None instead of raising"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = DataStore(data_dir)
+        assert store.get('missing.json') is None
+
+        with open(os.path.join(data_dir, 'broken.json'), 'w') as f:
+            f.write('{not json')
+        assert store.get('broken.json') is None
+        assert store.stats()['errors'] == 2
+        print("✅ Missing and invalid files are handled")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase Data Store Test")
+    print("=" * 50)
+
+    test_data_store_caching()
+    test_data_store_derived_values()
+    test_data_store_missing_and_invalid_files()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Test script for the Groq client and chatbot integration
+Runs against a local stand-in for the Groq API, so no API key or network access is needed.
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import groq_client
+from bot import StreamInterrupted, ask_compliance_bot, stream_compliance_bot
+from chat_cache import ChatResponseCache, chat_cache, make_cache_key, normalize_question
+from groq_client import GroqClient
+
+
+class StandInGroqHandler(BaseHTTPRequestHandler):
+    """Answers chat completion requests like the OpenAI-compatible Groq endpoint"""
+    protocol_version = "HTTP/1.1"  # Allow keep-alive
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length))
+        self.server.requests.append({
+            'path': self.path,
+            'client_port': self.client_address[1],
+            'authorization': self.headers.get('Authorization'),
+            'payload': payload
+        })
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        question = payload['messages'][-1]['content']
+        if payload.get('stream'):
+            self.stream_reply(f" Answer to: {question} ")
+            return
+
+        body = json.dumps({
+            'choices': [{'message': {'role': 'assistant', 'content': f" Answer to: {question} "}}]
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_reply(self, reply):
+        """Send the reply word by word as server-sent events over chunked encoding"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        words = reply.split(' ')
+        pieces = [word + ' ' for word in words[:-1]] + [words[-1]]
+        for i, piece in enumerate(pieces):
+            chunk = {'choices': [{'index': 0, 'delta': {'content': piece}}]}
+            self.write_chunk(f"data: {json.dumps(chunk)}\n\n")
+            if i == 1 and self.server.stream_pause:
+                time.sleep(self.server.stream_pause)
+            if i == 1 and self.server.fail_mid_stream:
+                # Drop the connection without finishing the chunked body
+                self.close_connection = True
+                return
+        self.write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def write_chunk(self, text):
+        data = text.encode('utf-8')
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stand_in_server(delay=0, stream_pause=0, fail_mid_stream=False):
+    """Start a stand-in Groq server on a free port and return it"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInGroqHandler)
+    server.requests = []
+    server.delay = delay
+    server.stream_pause = stream_pause
+    server.fail_mid_stream = fail_mid_stream
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}/openai/v1"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def with_api_key(test):
+    """Run a test with a dummy GROQ_API_KEY set and an empty chatbot cache"""
+    def wrapper():
+        previous = os.environ.get('GROQ_API_KEY')
+        os.environ['GROQ_API_KEY'] = 'test-key'
+        chat_cache.clear()
+        try:
+            test()
+        finally:
+            if previous is None:
+                del os.environ['GROQ_API_KEY']
+            else:
+                os.environ['GROQ_API_KEY'] = previous
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@with_api_key
+def test_connections_are_reused():
+    """Consecutive chat messages share one keep-alive connection"""
+    server = start_stand_in_server()
+    client = GroqClient(base_url=server.base_url)
+    try:
+        for question in ["How do I register with CIPC?", "When is VAT due?", "Do I need a permit?"]:
+            reply = ask_compliance_bot(question, client=client)
+            assert reply == f"Answer to: {question}"
+
+        assert len(server.requests) == 3
+        assert all(r['path'] == '/openai/v1/chat/completions' for r in server.requests)
+        assert all(r['authorization'] == 'Bearer test-key' for r in server.requests)
+        assert len({r['client_port'] for r in server.requests}) == 1
+        print("✅ Groq connections are reused")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+@with_api_key
+def test_parallel_requests_share_pool():
+    """Threads can share one client without opening more connections than the pool holds"""
+    server = start_stand_in_server(delay=0.05)
+    client = GroqClient(base_url=server.base_url, pool_size=4)
+    replies = []
+    try:
+        def ask(i):
+            replies.append(ask_compliance_bot(f"Question {i}", client=client))
+
+        for _ in range(3):
+            threads = [threading.Thread(target=ask, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert sorted(replies) == sorted(f"Answer to: Question {i}" for i in range(4) for _ in range(3))
+        assert len({r['client_port'] for r in server.requests}) <= 4
+        print("✅ Parallel requests share the pool")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+@with_api_key
+def test_read_timeout():
+    """A slow upstream hits the read timeout and returns the fallback message"""
+    server = start_stand_in_server(delay=1)
+    client = GroqClient(base_url=server.base_url, connect_timeout=1, read_timeout=0.2)
+    try:
+        started = time.monotonic()
+        reply = ask_compliance_bot("How do I register with CIPC?", client=client)
+        assert reply == "Sorry, I couldn't get a response right now."
+        assert time.monotonic() - started < 1
+        print("✅ Read timeout is enforced")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+class StandInClient:
+    """Point the shared Groq client used by the app at a stand-in server"""
+
+    def __init__(self, server):
+        self.client = GroqClient(base_url=server.base_url)
+
+    def __enter__(self):
+        self.previous = groq_client._client
+        groq_client._client = self.client
+        return self.client
+
+    def __exit__(self, *exc):
+        groq_client._client = self.previous
+        self.client.close()
+
+
+@with_api_key
+def test_streamed_tokens_arrive_early():
+    """Tokens are yielded as they arrive instead of after the whole completion"""
+    server = start_stand_in_server(stream_pause=0.5)
+    client = GroqClient(base_url=server.base_url)
+    try:
+        started = time.monotonic()
+        tokens = stream_compliance_bot("How do I register with CIPC?", client=client)
+        first_token = next(tokens)
+        time_to_first_token = time.monotonic() - started
+        rest = list(tokens)
+
+        assert first_token == "Answer "
+        assert time_to_first_token < 0.4
+        assert first_token + ''.join(rest) == "Answer to: How do I register with CIPC? "
+        assert server.requests[0]['payload']['stream'] is True
+        print(f"✅ First token after {time_to_first_token * 1000:.0f}ms")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+@with_api_key
+def test_chatbot_event_stream():
+    """POST /chatbot with stream=true relays tokens as server-sent events"""
+    from app import app
+
+    server = start_stand_in_server()
+    try:
+        with StandInClient(server):
+            response = app.test_client().post('/chatbot', json={
+                'message': 'When is VAT due?',
+                'tone': 'friendly',
+                'business_type': 'retail',
+                'stream': True
+            })
+            body = response.get_data(as_text=True)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+
+        events = [frame for frame in body.split('\n\n') if frame]
+        tokens = [json.loads(frame[len('data: '):])['token'] for frame in events[:-1]]
+        assert ''.join(tokens) == "Answer to: When is VAT due? "
+
+        event_line, data_line = events[-1].split('\n')
+        assert event_line == 'event: done'
+        done = json.loads(data_line[len('data: '):])
+        assert done['user_message'] == 'When is VAT due?'
+        assert done['bot_response'] == ''.join(tokens)
+        assert done['context'] == {'tone': 'friendly', 'business_type': 'retail', 'conversation_length': 0}
+        print("✅ Chatbot streams server-sent events")
+    finally:
+        server.shutdown()
+
+
+@with_api_key
+def test_stream_interrupted_mid_reply():
+    """An upstream failure after the first token ends the stream with an error event, not done"""
+    from app import app
+
+    server = start_stand_in_server(fail_mid_stream=True)
+    client = GroqClient(base_url=server.base_url)
+    try:
+        tokens = []
+        try:
+            for token in stream_compliance_bot("How do I register with CIPC?", client=client):
+                tokens.append(token)
+        except StreamInterrupted:
+            pass
+        else:
+            raise AssertionError("A truncated stream must raise StreamInterrupted")
+        assert tokens == ["Answer "]
+        assert chat_cache.stats()['entries'] == 0  # Partial replies aren't cached
+
+        with StandInClient(server):
+            body = app.test_client().post('/chatbot', json={'message': 'When is VAT due?', 'stream': True}) \
+                .get_data(as_text=True)
+        events = [frame for frame in body.split('\n\n') if frame]
+        assert [json.loads(frame[len('data: '):])['token'] for frame in events[:-1]] == ["Answer "]
+        assert events[-1].startswith('event: error\n')
+        assert 'event: done' not in body
+        print("✅ Interrupted streams end with an error event")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+@with_api_key
+def test_repeated_questions_are_cached():
+    """Repeated questions with the same context are answered without calling Groq"""
+    server = start_stand_in_server()
+    client = GroqClient(base_url=server.base_url)
+    try:
+        first = ask_compliance_bot("How do I register with CIPC?", tone="casual", client=client)
+        again = ask_compliance_bot("  how do I register with  CIPC ", tone="casual", client=client)
+        assert again == first
+        assert len(server.requests) == 1
+
+        # Different tone, history or an explicit opt-out go upstream
+        ask_compliance_bot("How do I register with CIPC?", tone="friendly", client=client)
+        ask_compliance_bot("How do I register with CIPC?", tone="casual", client=client,
+                           conversation_history=[{'type': 'user', 'content': 'I run a spaza shop'}])
+        ask_compliance_bot("How do I register with CIPC?", tone="casual", client=client, use_cache=False)
+        assert len(server.requests) == 4
+
+        # Streamed replies share the cache
+        assert ''.join(stream_compliance_bot("How do I register with CIPC?", tone="casual", client=client)) == first
+        assert len(server.requests) == 4
+        print("✅ Repeated questions are served from the cache")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def test_cache_eviction_and_expiry():
+    """The cache evicts least recently used replies and expires old ones"""
+    cache = ChatResponseCache(max_entries=2, ttl=60)
+    cache.put('a', 'reply a')
+    cache.put('b', 'reply b')
+    cache.get('a')
+    cache.put('c', 'reply c')
+    assert cache.get('b') is None
+    assert cache.get('a') == 'reply a'
+    assert cache.stats()['evictions'] == 1
+
+    cache = ChatResponseCache(max_bytes=1000)
+    for i in range(20):
+        cache.put(f'key {i}', 'x' * 100)
+    assert cache.stats()['bytes'] <= 1000
+    assert cache.get('key 19') is not None
+
+    cache = ChatResponseCache(ttl=0)
+    cache.put('a', 'reply a')
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+    cache = ChatResponseCache(enabled=False)
+    cache.put('a', 'reply a')
+    assert cache.get('a') is None
+    print("✅ Cache eviction and expiry work")
+
+
+def test_cache_key_normalization():
+    """Questions differing only in case, spacing and end punctuation share a key"""
+    assert normalize_question("  How do I register\nwith CIPC? ") == "how do i register with cipc"
+    payload = {'model': 'm', 'temperature': 0.3, 'max_tokens': 10,
+               'messages': [{'role': 'system', 'content': 'prompt'}, {'role': 'user', 'content': 'q'}]}
+    assert make_cache_key(payload, "When is VAT due?") == make_cache_key(payload, "when is vat due")
+    assert make_cache_key(payload, "When is VAT due?") != make_cache_key(payload, "When is PAYE due?")
+    print("✅ Cache keys are normalized")
+
+
+def test_client_configuration():
+    """Timeouts, pool size and base URL can be configured"""
+    client = GroqClient(base_url="http://localhost:9999/v1/", pool_size=3, connect_timeout=2, read_timeout=20)
+    assert client.chat_completions_url == "http://localhost:9999/v1/chat/completions"
+    assert client.timeout == (2.0, 20.0)
+    assert client.session.get_adapter("https://api.groq.com")._pool_maxsize == 3
+    client.close()
+    print("✅ Client configuration is applied")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase Groq Client Test")
+    print("=" * 50)
+
+    test_connections_are_reused()
+    test_parallel_requests_share_pool()
+    test_read_timeout()
+    test_streamed_tokens_arrive_early()
+    test_chatbot_event_stream()
+    test_stream_interrupted_mid_reply()
+    test_repeated_questions_are_cached()
+    test_cache_eviction_and_expiry()
+    test_cache_key_normalization()
+    test_client_configuration()
+
+    print("\n✅ All tests passed!")
@@ -125,7 +125,7 @@ def test_translation_coverage():
     print("🔍 Translation Coverage Test")
     print("=" * 60)
     
-    from pdf_translations import PDF_TRANSLATIONS, get_translation
+    from pdf_translations import get_translation
     
     # Key translations that must exist
     required_keys = [
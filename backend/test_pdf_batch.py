@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Test script for batch PDF export (/export-pdf/batch)
+"""
+
+import io
+import json
+import threading
+import time
+import zipfile
+
+import app as app_module
+import pdf_batch
+from pdf_batch import BATCH_THREADS, BatchRequestError, build_batch_zip, iter_batch_zip, iter_render_batch, parse_batch, render_batch
+from pdf_cache import PDFReportCache
+from render_engine import RenderEngine
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+
+def test_batch_export():
+    """A batch returns a ZIP with one PDF per spec, rendering identical specs once"""
+    client = app_module.app.test_client()
+    saved = app_module.render_engine, app_module.pdf_cache
+    engine = RenderEngine(workers=0)
+    app_module.render_engine = engine
+    app_module.pdf_cache = PDFReportCache()
+    reports = [
+        {'type': 'checklist', 'progressData': SAMPLE_PROGRESS_DATA, 'businessType': 'retail', 'language': 'zu'},
+        {'type': 'skills', 'progressData': SAMPLE_PROGRESS_DATA, 'businessType': 'Spaza Shop', 'language': 'af'},
+        {'type': 'checklist', 'progressData': SAMPLE_PROGRESS_DATA, 'businessType': 'retail', 'language': 'zu'}
+    ]
+    try:
+        response = client.post('/export-pdf/batch', json={'reports': reports, 'chartBackend': 'native'})
+    finally:
+        app_module.render_engine, app_module.pdf_cache = saved
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/zip'
+    assert response.is_streamed
+    archive = zipfile.ZipFile(io.BytesIO(response.data))
+    names = archive.namelist()
+    assert names == ['001-retail-checklist-zu.pdf', '002-Spaza-Shop-skills-af.pdf', '003-retail-checklist-zu.pdf',
+                     'manifest.json']
+    assert all(archive.read(name).startswith(b'%PDF') for name in names[:3])
+    manifest = json.loads(archive.read('manifest.json'))
+    assert [entry['status'] for entry in manifest] == ['done', 'done', 'done']
+    assert engine.stats()['completed'] == 2
+    print("✅ Batch export returns a ZIP of reports")
+
+
+def test_invalid_batches():
+    """Malformed or oversized batches are rejected with 400"""
+    client = app_module.app.test_client()
+    for body in ({}, {'reports': []}, {'reports': 'retail'}, {'reports': ['retail']}):
+        assert client.post('/export-pdf/batch', json=body).status_code == 400
+    try:
+        parse_batch({'reports': [{}] * 3}, max_reports=2)
+        raise AssertionError("Oversized batch accepted")
+    except BatchRequestError:
+        pass
+    print("✅ Invalid batches rejected")
+
+
+def test_batch_runs_in_parallel():
+    """Reports are rendered concurrently, up to the thread limit"""
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def render(*render_args):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return b'%PDF-' + render_args[3].encode()
+
+    batch = parse_batch({'reports': [{'language': str(i)} for i in range(6)]})
+    results = render_batch(batch, render, threads=3)
+    assert [pdf for pdf, _ in results] == [b'%PDF-' + str(i).encode() for i in range(6)]
+    assert peak[0] == 3
+    print("✅ Batch reports render in parallel")
+
+
+def test_batch_endpoint_concurrency():
+    """The batch endpoint keeps PDF_BATCH_THREADS reports in flight, not one per render worker"""
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def render(*render_args):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return b'%PDF-' + render_args[3].encode()
+
+    saved = app_module.render_report_for_job
+    app_module.render_report_for_job = render
+    try:
+        response = app_module.app.test_client().post('/export-pdf/batch', json={
+            'reports': [{'language': str(i)} for i in range(6)]
+        })
+        archive = zipfile.ZipFile(io.BytesIO(response.data))
+    finally:
+        app_module.render_report_for_job = saved
+    assert len(archive.namelist()) == 7
+    assert BATCH_THREADS > 1 and peak[0] == min(BATCH_THREADS, 6)
+    print(f"✅ Batch endpoint renders {peak[0]} reports at once")
+
+
+def test_failed_reports_in_manifest():
+    """A failed report is listed in the manifest and the others are still returned"""
+    def render(*render_args):
+        if render_args[3] == 'bad':
+            raise RuntimeError("render failed")
+        return b'%PDF-ok'
+
+    batch = parse_batch({'reports': [{'language': 'en'}, {'language': 'bad'}]})
+    archive = zipfile.ZipFile(io.BytesIO(build_batch_zip(batch, render_batch(batch, render))))
+    manifest = json.loads(archive.read('manifest.json'))
+    assert manifest[0]['status'] == 'done' and manifest[0]['filename'] in archive.namelist()
+    assert manifest[1] == {'index': 1, 'type': 'comprehensive', 'businessType': 'general', 'language': 'bad',
+                           'status': 'failed', 'error': 'RuntimeError'}
+    print("✅ Failed reports listed in the manifest")
+
+
+def test_zip_streams_as_reports_finish():
+    """Each PDF is sent as soon as it is ready, before later reports have finished"""
+    second_started = threading.Event()
+    release_second = threading.Event()
+
+    def render(*render_args):
+        if render_args[3] == 'second':
+            second_started.set()
+            release_second.wait(5)
+        return b'%PDF-' + render_args[3].encode()
+
+    batch = parse_batch({'reports': [{'language': 'first'}, {'language': 'second'}]})
+    chunks = iter_batch_zip(batch, iter_render_batch(batch, render, threads=2))
+    sent = b''
+    while b'%PDF-first' not in sent:
+        sent += next(chunks)
+    assert second_started.wait(5) and b'%PDF-second' not in sent
+
+    release_second.set()
+    sent += b''.join(chunks)
+    archive = zipfile.ZipFile(io.BytesIO(sent))
+    assert archive.read('002-general-comprehensive-second.pdf') == b'%PDF-second'
+    print("✅ Batch ZIP streams as reports finish")
+
+
+def test_abandoned_stream_stops_rendering():
+    """Reports that haven't started are dropped when the client goes away mid-batch"""
+    rendered = []
+
+    def render(*render_args):
+        time.sleep(0.05)
+        rendered.append(render_args[3])
+        return b'%PDF-'
+
+    batch = parse_batch({'reports': [{'language': str(i)} for i in range(5)]})
+    results = iter_render_batch(batch, render, threads=1)
+    next(results)
+    results.close()
+    time.sleep(0.2)
+    assert len(rendered) <= 2
+    print("✅ Abandoned batch stops rendering")
+
+
+def test_client_disconnect_stops_rendering():
+    """Closing the batch response mid-stream cancels the reports that haven't started"""
+    rendered = []
+
+    def render(*render_args):
+        time.sleep(0.05)
+        rendered.append(render_args[3])
+        return b'%PDF-' + render_args[3].encode()
+
+    # Hold on to the render generator, as a traceback or the server might, so only an explicit close stops it
+    generators = []
+
+    def keep_render_generator(*args, **kwargs):
+        generators.append(iter_render_batch(*args, **kwargs))
+        return generators[-1]
+
+    saved = app_module.render_report_for_job, app_module.BATCH_THREADS, pdf_batch.iter_render_batch
+    app_module.render_report_for_job, app_module.BATCH_THREADS = render, 1
+    pdf_batch.iter_render_batch = keep_render_generator
+    try:
+        response = app_module.app.test_client().post('/export-pdf/batch', buffered=False, json={
+            'reports': [{'language': str(i)} for i in range(10)]
+        })
+        next(iter(response.response))
+        response.close()  # What the server does when the client goes away
+    finally:
+        app_module.render_report_for_job, app_module.BATCH_THREADS, pdf_batch.iter_render_batch = saved
+    time.sleep(0.3)
+    assert len(rendered) <= 2, rendered
+    print("✅ Client disconnect stops the batch")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase PDF Batch Test")
+    print("=" * 50)
+
+    test_batch_export()
+    test_invalid_batches()
+    test_batch_runs_in_parallel()
+    test_batch_endpoint_concurrency()
+    test_failed_reports_in_manifest()
+    test_zip_streams_as_reports_finish()
+    test_abandoned_stream_stops_rendering()
+    test_client_disconnect_stops_rendering()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for the PDF report cache
+"""
+
+import os
+import tempfile
+import time
+
+import app as app_module
+from pdf_cache import PDFReportCache, make_report_key
+from render_engine import RenderEngine
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+
+def test_report_key():
+    """Keys are canonical over the inputs and change with anything that changes the report"""
+    key = make_report_key('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', 'en')
+    reordered = dict(reversed(list(SAMPLE_PROGRESS_DATA.items())))
+    assert make_report_key('comprehensive', reordered, 'retail', 'en') == key
+    assert make_report_key('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', 'zu') != key
+    assert make_report_key('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', 'en', chart_backend='png') != key
+    assert make_report_key('checklist', SAMPLE_PROGRESS_DATA, 'retail', 'en') != key
+    print("✅ Report keys are canonical")
+
+
+def test_memory_and_disk_tiers():
+    """Reports are served from memory, and from disk by another process or after a restart"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PDFReportCache(directory)
+        assert cache.get('a' * 64) is None
+        cache.put('a' * 64, b'%PDF-report')
+        assert cache.get('a' * 64) == b'%PDF-report'
+
+        other_worker = PDFReportCache(directory)
+        assert other_worker.get('a' * 64) == b'%PDF-report'
+        assert other_worker.get('a' * 64) == b'%PDF-report'
+
+        stats = cache.stats()
+        assert (stats['memory_hits'], stats['misses'], stats['stores']) == (1, 1, 1)
+        assert stats['hit_rate'] == 0.5
+        assert stats['disk_entries'] == 1 and stats['disk_bytes'] == len(b'%PDF-report')
+        other_stats = other_worker.stats()
+        assert (other_stats['disk_hits'], other_stats['memory_hits']) == (1, 1)
+    print("✅ Memory and disk tiers serve cached reports")
+
+
+def test_max_age():
+    """Reports aren't served once their generation time is older than max_age"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PDFReportCache(directory, max_age=0.1)
+        cache.put('b' * 64, b'%PDF-old')
+        time.sleep(0.2)
+        assert cache.get('b' * 64) is None
+        assert PDFReportCache(directory, max_age=0.1).get('b' * 64) is None
+        assert not os.listdir(directory)
+    print("✅ Cached reports expire")
+
+
+def test_size_eviction():
+    """The least recently used reports are evicted to stay within each tier's budget"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PDFReportCache(directory, max_memory_bytes=250, max_disk_bytes=250)
+        for name in 'abc':
+            cache.put(name * 64, name.encode() * 100)
+            time.sleep(0.01)
+        stats = cache.stats()
+        assert stats['memory_entries'] == 2 and stats['memory_bytes'] == 200
+        assert stats['disk_entries'] == 2 and stats['disk_bytes'] == 200
+        assert stats['evictions'] == 2
+
+        assert cache.get('a' * 64) is None
+        assert cache.get('c' * 64) == b'c' * 100
+    print("✅ Tiers stay within their size budgets")
+
+
+def test_export_served_from_cache():
+    """A repeat /export-pdf request is answered without rendering the report again"""
+    client = app_module.app.test_client()
+    saved = app_module.render_engine, app_module.pdf_cache
+    engine = RenderEngine(workers=0)
+    app_module.render_engine = engine
+    app_module.pdf_cache = PDFReportCache()
+    request_body = {'type': 'comprehensive', 'progressData': SAMPLE_PROGRESS_DATA, 'businessType': 'retail',
+                    'language': 'xh'}
+    try:
+        first = client.post('/export-pdf', json=request_body)
+        second = client.post('/export-pdf', json=request_body)
+        assert first.status_code == second.status_code == 200
+        assert second.data == first.data
+        assert int(first.headers['Content-Length']) == len(first.data)
+        assert engine.stats()['completed'] == 1
+        assert app_module.pdf_cache.stats()['memory_hits'] == 1
+    finally:
+        app_module.render_engine, app_module.pdf_cache = saved
+    print("✅ Repeat exports are served from the cache")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase PDF Cache Test")
+    print("=" * 50)
+
+    test_report_key()
+    test_memory_and_disk_tiers()
+    test_max_age()
+    test_size_eviction()
+    test_export_served_from_cache()
+
+    print("\n✅ All tests passed!")
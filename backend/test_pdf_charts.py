@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Test script for the progress charts embedded in PDF reports
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from fpdf import FPDF
+
+import pdf_generator
+from pdf_charts import ChartDrawer
+from pdf_generator import DEFAULT_CHART_PROFILE, RegulaEasePDFGenerator, generate_pdf_report
+
+SAMPLE_PROGRESS_DATA = {
+    'checklist': {
+        'total': 15,
+        'completed': 10,
+        'percentage': 67,
+        'priorityDistribution': {'high': 2, 'medium': 5, 'low': 3}
+    },
+    'skills': {
+        'totalResources': 25,
+        'bookmarked': 8,
+        'categories': ['Finance', 'Digital', 'Management', 'Legal'],
+        'categoryBookmarks': [3, 2, 2, 1]
+    },
+    'quiz': {
+        'score': 7,
+        'totalQuestions': 10,
+        'category': 'Business Compliance',
+        'completedAt': '2025-01-04'
+    }
+}
+
+
+def test_chart_rendered_in_memory():
+    """Charts are rendered into an in-memory PNG and embedded without temp files"""
+    original = tempfile.NamedTemporaryFile
+
+    def no_temp_files(*args, **kwargs):
+        raise AssertionError("Charts should not be written to temporary files")
+
+    tempfile.NamedTemporaryFile = no_temp_files
+    try:
+        chart = RegulaEasePDFGenerator().create_progress_chart(SAMPLE_PROGRESS_DATA)
+        assert isinstance(chart, io.BytesIO)
+        assert chart.getvalue().startswith(b'\x89PNG')
+
+        pdf_buffer = generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend='png')
+    finally:
+        tempfile.NamedTemporaryFile = original
+
+    assert b'/Image' in pdf_buffer.getvalue()
+    print("✅ Charts are rendered in memory")
+
+
+def test_chart_profiles():
+    """Lighter profiles render smaller charts, and unknown profiles fall back to the default"""
+    sizes = {}
+    for profile in ('screen', 'print', 'archive'):
+        sizes[profile] = len(generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail',
+                                                 chart_profile=profile, chart_backend='png').getvalue())
+    assert sizes['screen'] < sizes['print'] < sizes['archive']
+
+    assert RegulaEasePDFGenerator(chart_profile='poster').chart_profile == DEFAULT_CHART_PROFILE
+    print(f"✅ Chart profiles: {', '.join(f'{name} {size // 1024}KB' for name, size in sizes.items())}")
+
+
+def test_vector_chart_backend():
+    """The svg backend embeds the charts as vector paths instead of an image"""
+    chart = RegulaEasePDFGenerator(chart_backend='svg').create_progress_chart(SAMPLE_PROGRESS_DATA)
+    assert b'<svg' in chart.getvalue()
+
+    raster = generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend='png').getvalue()
+    vector = generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend='svg').getvalue()
+    assert b'/Subtype /Image' in raster
+    assert b'/Subtype /Image' not in vector
+    assert len(vector) < len(raster)
+    print(f"✅ Vector charts: {len(vector) // 1024}KB vs {len(raster) // 1024}KB as PNG")
+
+
+def test_native_charts_skip_matplotlib():
+    """The default native backend draws the charts without importing matplotlib"""
+    script = (
+        "import sys\n"
+        "from pdf_generator import generate_pdf_report\n"
+        "from test_pdf_charts import SAMPLE_PROGRESS_DATA\n"
+        "pdf = generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail').getvalue()\n"
+        "assert pdf.startswith(b'%PDF')\n"
+        "assert b'/Subtype /Image' not in pdf\n"
+        "assert 'matplotlib' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', script], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    native = generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend='native').getvalue()
+    raster = generate_pdf_report('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', chart_backend='png').getvalue()
+    assert len(native) < len(raster)
+    print(f"✅ Native charts: {len(native) // 1024}KB without matplotlib")
+
+
+def test_native_pie_draws_every_wedge():
+    """Pies with more slices than colours draw every slice, reusing the colours in turn"""
+    pdf = FPDF()
+    pdf.add_page()
+    arcs = []
+    fills = []
+    pdf.solid_arc = lambda x, y, size, start, end, **kwargs: arcs.append(end - start)
+    pdf.set_fill_color = lambda *rgb: fills.append(rgb)
+
+    panel = {'title': 'Priority Distribution', 'labels': ['high', 'medium', 'low', 'urgent', 'someday'],
+             'values': [2, 5, 3, 1, 1], 'colors': ['#F44336', '#FF9800', '#4CAF50']}
+    ChartDrawer(pdf).pie(panel, 10, 10, 90, 60)
+
+    assert len(arcs) == 5
+    assert abs(sum(arcs) - 360) < 1e-6
+    assert fills[3] == fills[0] and fills[4] == fills[1]
+    print("✅ Native pies draw every wedge")
+
+
+def test_matplotlib_backends_fall_back_to_native():
+    """Requests for matplotlib charts are drawn natively when matplotlib isn't installed"""
+    pdf_generator.MATPLOTLIB_AVAILABLE = False
+    try:
+        assert RegulaEasePDFGenerator(chart_backend='png').chart_backend == 'native'
+        assert RegulaEasePDFGenerator(chart_backend='svg').chart_backend == 'native'
+    finally:
+        pdf_generator.MATPLOTLIB_AVAILABLE = True
+    print("✅ Native charts are the fallback without matplotlib")
+
+
+def progress_data_variant(index):
+    """Sample data with different numbers and labels for each index"""
+    return {
+        'checklist': {
+            'total': 10 + index,
+            'completed': index,
+            'percentage': index * 9,
+            'priorityDistribution': {'high': index + 1, 'medium': 2, 'low': 5 - index % 5}
+        },
+        'skills': {
+            'totalResources': 20,
+            'bookmarked': index + 2,
+            'categories': [f'Category {index}-{n}' for n in range(index % 3 + 2)],
+            'categoryBookmarks': [n + index for n in range(index % 3 + 2)]
+        },
+        'quiz': {'score': index % 10, 'totalQuestions': 10}
+    }
+
+
+def test_concurrent_chart_rendering():
+    """Charts rendered on parallel threads are identical to charts rendered one at a time"""
+    languages = ['en', 'af', 'zu', 'xh']
+    jobs = [(progress_data_variant(i), languages[i % len(languages)]) for i in range(8)]
+
+    def render(job):
+        progress_data, language = job
+        generator = RegulaEasePDFGenerator(language=language, chart_backend='png')
+        return generator.create_progress_chart(progress_data).getvalue()
+
+    expected = [render(job) for job in jobs]
+    assert len(set(expected)) == len(jobs)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(2):
+            assert list(pool.map(render, jobs)) == expected
+
+        reports = list(pool.map(
+            lambda job: generate_pdf_report('comprehensive', job[0], 'retail', job[1], chart_backend='png'),
+            jobs
+        ))
+    for report in reports:
+        assert report.getvalue().startswith(b'%PDF')
+        assert b'/Subtype /Image' in report.getvalue()
+    print(f"✅ {len(jobs)} charts rendered in parallel match sequential renders")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase PDF Chart Test")
+    print("=" * 50)
+
+    test_chart_rendered_in_memory()
+    test_chart_profiles()
+    test_vector_chart_backend()
+    test_native_charts_skip_matplotlib()
+    test_native_pie_draws_every_wedge()
+    test_matplotlib_backends_fall_back_to_native()
+    test_concurrent_chart_rendering()
+
+    print("\n✅ All tests passed!")
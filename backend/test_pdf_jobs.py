@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Test script for background PDF export jobs (/export-pdf?async=1)
+"""
+
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import app as app_module
+from pdf_jobs import PDFJobRunner, PDFJobStore
+from render_engine import RenderEngine
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+REQUEST_BODY = {'type': 'comprehensive', 'progressData': SAMPLE_PROGRESS_DATA, 'businessType': 'retail',
+                'language': 'zu'}
+
+
+class JobsApp:
+    """Point the app at a temporary job store and an in-thread render engine"""
+
+    def __init__(self, **runner_options):
+        self.directory = tempfile.TemporaryDirectory()
+        self.runner = PDFJobRunner(PDFJobStore(self.directory.name), **runner_options)
+
+    def __enter__(self):
+        self.saved = app_module.pdf_jobs, app_module.render_engine
+        app_module.pdf_jobs = self.runner
+        app_module.render_engine = RenderEngine(workers=0)
+        return app_module.app.test_client()
+
+    def __exit__(self, *exc_info):
+        app_module.pdf_jobs, app_module.render_engine = self.saved
+        self.runner.shutdown()
+        self.directory.cleanup()
+
+
+def wait_for_job(client, status_url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        body = client.get(status_url).get_json()
+        if body['status'] in ('done', 'failed'):
+            return body
+        time.sleep(0.05)
+    raise AssertionError("Job didn't finish")
+
+
+def test_async_export():
+    """An async export returns a job to poll, then serves the finished PDF"""
+    with JobsApp() as client:
+        response = client.post('/export-pdf?async=1', json=REQUEST_BODY)
+        assert response.status_code == 202
+        job = response.get_json()
+        assert job['status'] in ('queued', 'running')
+        assert response.headers['Location'] == job['status_url'] == f"/export-pdf/jobs/{job['job_id']}"
+
+        finished = wait_for_job(client, job['status_url'])
+        assert finished['status'] == 'done'
+
+        download = client.get(finished['download_url'])
+        assert download.status_code == 200
+        assert download.mimetype == 'application/pdf'
+        assert download.data.startswith(b'%PDF')
+        assert len(download.data) == finished['size']
+        assert 'regula-ease-report-comprehensive-zu.pdf' in download.headers['Content-Disposition']
+    print("✅ Async export job completes and downloads")
+
+
+def test_unknown_and_unfinished_jobs():
+    """Unknown jobs are 404s and downloading an unfinished job is a 409"""
+    with JobsApp() as client:
+        assert client.get('/export-pdf/jobs/missing').status_code == 404
+        assert client.get('/export-pdf/jobs/missing/download').status_code == 404
+        assert client.get('/export-pdf/jobs/..%2Fsecret').status_code == 404
+
+        release = threading.Event()
+        job = app_module.pdf_jobs.submit('slow.pdf', lambda: release.wait(5) and b'%PDF-slow')
+        response = client.get(f"/export-pdf/jobs/{job['job_id']}/download")
+        assert response.status_code == 409
+        release.set()
+    print("✅ Unknown and unfinished jobs handled")
+
+
+def test_job_limit():
+    """New async exports are refused with 503 once too many are waiting"""
+    with JobsApp(max_pending=1) as client:
+        release = threading.Event()
+        app_module.pdf_jobs.submit('slow.pdf', lambda: release.wait(5) and b'%PDF-slow')
+        response = client.post('/export-pdf?async=1', json=REQUEST_BODY)
+        assert response.status_code == 503
+        assert 'Retry-After' in response.headers
+        release.set()
+    print("✅ Async job limit applied")
+
+
+def test_failed_submit_frees_its_slot():
+    """A job that can't be recorded (e.g. a full disk) doesn't keep its place in the queue"""
+    with tempfile.TemporaryDirectory() as directory:
+        runner = PDFJobRunner(PDFJobStore(directory), max_pending=2)
+
+        def disk_full(filename):
+            raise OSError(28, 'No space left on device')
+
+        runner.store.create = disk_full
+        for _ in range(3):
+            try:
+                runner.submit('report.pdf', lambda: b'%PDF')
+            except OSError:
+                pass
+            else:
+                raise AssertionError("submit() should pass the store error on")
+        assert runner.stats()['pending_here'] == 0
+
+        del runner.store.create
+        job = runner.submit('report.pdf', lambda: b'%PDF-ok')
+        runner.shutdown()
+        assert runner.store.get(job['job_id'])['status'] == 'done'
+    print("✅ Failed submits free their slot")
+
+
+def test_jobs_of_dead_workers_fail():
+    """A job left queued or running by a web worker that died is marked failed"""
+    worker = subprocess.Popen([sys.executable, '-c', 'pass'])
+    worker.wait()
+    with tempfile.TemporaryDirectory() as directory:
+        store = PDFJobStore(directory)
+        orphan = store.update(store.create('orphan.pdf'), status='running', pid=worker.pid)
+        live = store.update(store.create('live.pdf'), status='running')
+
+        job = store.get(orphan['job_id'])
+        assert job['status'] == 'failed' and job['error'] == 'PDF job was interrupted'
+        assert store.get(live['job_id'])['status'] == 'running'
+
+        queued = store.update(store.create('queued.pdf'), pid=worker.pid)
+        store.sweep()
+        assert store.stats()['queued'] == 0 and store.stats()['failed'] == 2
+        assert store.get(queued['job_id'])['error'] == 'PDF job was interrupted'
+    print("✅ Jobs of dead web workers fail")
+
+
+def test_result_store_eviction():
+    """Results expire after the TTL and the oldest are evicted beyond the budget"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = PDFJobStore(directory, ttl=60, max_results=2)
+        jobs = []
+        for i in range(3):
+            job = store.create(f'report-{i}.pdf')
+            store.save_result(job, b'%PDF-' + bytes([i]))
+            jobs.append(job)
+            time.sleep(0.01)
+        store.sweep()
+        assert store.get(jobs[0]['job_id']) is None
+        assert store.get(jobs[2]['job_id'])['status'] == 'done'
+        assert store.stats()['done'] == 2
+
+        expiring = PDFJobStore(directory, ttl=0.1)
+        time.sleep(0.2)
+        assert expiring.get(jobs[2]['job_id']) is None
+        expiring.sweep()
+        assert expiring.stats()['done'] == 0
+    print("✅ Result store evicts by count and TTL")
+
+
+def test_jobs_from_other_machines_replayed():
+    """On Fly.io, polls for a job started on another machine are replayed there"""
+    with tempfile.TemporaryDirectory() as directory:
+        here = PDFJobStore(directory, instance='machine1')
+        job = here.create('report.pdf')
+        assert job['job_id'].startswith('machine1-')
+        assert here.owner(job['job_id']) is None
+        assert PDFJobStore(directory, instance='machine2').owner(job['job_id']) == 'machine1'
+
+        with JobsApp() as client:
+            app_module.pdf_jobs.store.instance = 'machine2'
+            response = client.get(f"/export-pdf/jobs/{job['job_id']}")
+            assert response.headers['fly-replay'] == 'instance=machine1'
+
+            # Ids that create() can't have made are unknown, not replayed
+            for job_id in ('anything-x', f"Machine1-{job['job_id'].split('-', 1)[1]}", 'machine1-short',
+                           job['job_id'].split('-', 1)[1]):
+                response = client.get(f"/export-pdf/jobs/{job_id}")
+                assert response.status_code == 404 and 'fly-replay' not in response.headers
+    print("✅ Jobs on other machines are replayed")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase PDF Job Test")
+    print("=" * 50)
+
+    test_async_export()
+    test_unknown_and_unfinished_jobs()
+    test_job_limit()
+    test_failed_submit_frees_its_slot()
+    test_jobs_of_dead_workers_fail()
+    test_result_store_eviction()
+    test_jobs_from_other_machines_replayed()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for the PDF translation catalogs (locales/ loading, compiling and frontend sync)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pdf_translations
+from bench_translations import nested_lookup
+from pdf_generator import RegulaEasePDFGenerator
+from pdf_translations import (
+    compile_catalogs,
+    flatten_catalog,
+    get_catalog,
+    get_language_name,
+    get_supported_languages,
+    get_translation,
+    load_catalog,
+)
+from sync_locales import extract_catalogs, out_of_date, write_catalogs
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class TemporaryLocales:
+    """Point pdf_translations at a temporary locales directory"""
+
+    def __init__(self, catalogs):
+        self.catalogs = catalogs
+
+    def __enter__(self):
+        self.directory = tempfile.TemporaryDirectory()
+        for language, catalog in self.catalogs.items():
+            with open(os.path.join(self.directory.name, f"{language}.json"), 'w', encoding='utf-8') as f:
+                json.dump(catalog, f)
+        self.saved = {name: getattr(pdf_translations, name)
+                      for name in ('LOCALES_DIR', 'COMPILED_DIR', 'SUPPORTED_LANGUAGES', '_catalogs')}
+        pdf_translations.LOCALES_DIR = self.directory.name
+        pdf_translations.COMPILED_DIR = os.path.join(self.directory.name, 'compiled')
+        pdf_translations.SUPPORTED_LANGUAGES = pdf_translations.find_languages()
+        pdf_translations._catalogs = {}
+        return self.directory.name
+
+    def __exit__(self, *exc_info):
+        for name, value in self.saved.items():
+            setattr(pdf_translations, name, value)
+        self.directory.cleanup()
+
+
+def test_compiled_matches_nested():
+    """Every nested key resolves to the same text through the compiled tables"""
+    for language in ('en', 'zu'):
+        for key in flatten_catalog(load_catalog(language)):
+            assert get_translation(language, key) == nested_lookup(language, key), (language, key)
+    assert get_translation('zu', 'chart_titles.progress_by_category') == \
+        load_catalog('zu')['chart_titles']['progress_by_category']
+    print("✅ Compiled catalogs match the nested ones")
+
+
+def test_english_fallback():
+    """Missing keys fall back to English, unknown keys to the default or the key itself"""
+    catalogs = compile_catalogs({
+        'en': {'title': 'Report', 'labels': {'done': 'Done', 'left': 'Left'}},
+        'zu': {'title': 'Umbiko', 'labels': {'done': 'Kuqediwe'}}
+    })
+    assert catalogs['zu'] == {'title': 'Umbiko', 'labels.done': 'Kuqediwe', 'labels.left': 'Left'}
+
+    assert get_translation('fr', 'report_title') == load_catalog('en')['report_title']
+    assert get_translation('af', 'no_such_key') == 'no_such_key'
+    assert get_translation('af', 'no_such_key', 'Fallback') == 'Fallback'
+    assert get_supported_languages()[0] == 'en' and set(get_supported_languages()) == {'en', 'af', 'zu', 'xh'}
+    assert get_language_name('zu') == 'isiZulu' and get_language_name('fr') == 'English'
+    print("✅ English fallback baked into the catalogs")
+
+
+def test_generator_lookup():
+    """The generator's t() reads its language's compiled table"""
+    generator = RegulaEasePDFGenerator(language='xh')
+    assert generator.translations is get_catalog('xh')
+    assert generator.t('chart_labels.completed') == get_translation('xh', 'chart_labels.completed')
+    assert generator.t('missing', 'Default') == 'Default'
+    assert RegulaEasePDFGenerator(language='fr').translations is get_catalog('en')
+    print("✅ Generator uses the compiled tables")
+
+
+def test_languages_loaded_on_first_use():
+    """Importing the module loads no catalog; a report loads only its own language (plus English)"""
+    script = (
+        "import pdf_translations as p\n"
+        "assert p._catalogs == {}\n"
+        "p.get_translation('zu', 'report_title')\n"
+        "print(sorted(p._catalogs))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=BACKEND_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "['zu']"
+    print("✅ Languages loaded on first use")
+
+
+def test_compiled_pickle_reused_until_stale():
+    """The pickled table is reused, and recompiled when its JSON changes"""
+    with TemporaryLocales({'en': {'title': 'Report', 'language_name': 'English'},
+                           'st': {'title': 'Tlaleho', 'language_name': 'Sesotho'}}) as directory:
+        assert get_supported_languages() == ['en', 'st']
+        assert get_translation('st', 'title') == 'Tlaleho'
+        compiled = os.path.join(directory, 'compiled', 'st.pickle')
+        assert os.path.exists(compiled)
+
+        # A new process (empty in-memory cache) loads the pickle rather than the JSON
+        pdf_translations._catalogs = {}
+        os.utime(os.path.join(directory, 'st.json'), (time.time() - 60, time.time() - 60))
+        os.utime(os.path.join(directory, 'en.json'), (time.time() - 60, time.time() - 60))
+        with open(compiled, 'wb') as f:
+            import pickle
+            pickle.dump({'title': 'From pickle'}, f)
+        assert get_translation('st', 'title') == 'From pickle'
+
+        # Editing the catalog makes the pickle stale
+        pdf_translations._catalogs = {}
+        with open(os.path.join(directory, 'st.json'), 'w', encoding='utf-8') as f:
+            json.dump({'title': 'Tlaleho e ncha'}, f)
+        assert get_translation('st', 'title') == 'Tlaleho e ncha'
+        assert get_language_name('st') == 'English'  # Missing key filled from English
+    print("✅ Compiled pickles reused until stale")
+
+
+def test_backend_catalogs_match_frontend():
+    """locales/ matches the `pdf` namespace of the frontend locales (run sync_locales.py if this fails)"""
+    catalogs = extract_catalogs()
+    assert set(catalogs) == set(get_supported_languages())
+    assert out_of_date(catalogs) == []
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_catalogs({'en': {'title': 'Report'}}, directory)
+        assert out_of_date({'en': {'title': 'Report'}}, directory) == []
+        assert out_of_date({'en': {'title': 'Changed'}, 'af': {}}, directory) == ['en', 'af']
+        write_catalogs({'af': {'title': 'Verslag'}}, directory)
+        assert os.listdir(directory) == ['af.json']
+    print("✅ Backend catalogs match the frontend locales")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase PDF Translation Test")
+    print("=" * 50)
+
+    test_compiled_matches_nested()
+    test_english_fallback()
+    test_generator_lookup()
+    test_languages_loaded_on_first_use()
+    test_compiled_pickle_reused_until_stale()
+    test_backend_catalogs_match_frontend()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test script for the PDF render engine (worker process pool)
+"""
+
+import os
+import threading
+import time
+
+import app as app_module
+from render_engine import RenderEngine, RenderQueueFull, RenderTimeout
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+
+def occupy(engine, seconds, count):
+    """Start `count` background jobs that keep the engine busy, returning their threads"""
+    threads = [threading.Thread(target=engine.run, args=(time.sleep, seconds)) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    return threads
+
+
+def test_render_in_worker_process():
+    """Reports are rendered in a separate worker process"""
+    engine = RenderEngine(workers=1, max_queue=2)
+    try:
+        engine.start()
+        assert engine.run(os.getpid) != os.getpid()
+
+        pdf = engine.render('comprehensive', SAMPLE_PROGRESS_DATA, 'retail', 'af')
+        assert pdf.startswith(b'%PDF')
+        assert engine.stats()['completed'] == 2
+    finally:
+        engine.shutdown()
+    print("✅ Reports render in a worker process")
+
+
+def test_queue_limit():
+    """Jobs beyond the running and queued limit are rejected straight away"""
+    engine = RenderEngine(workers=1, max_queue=1)
+    try:
+        engine.start()
+        threads = occupy(engine, 1.0, 2)
+
+        started = time.monotonic()
+        try:
+            engine.run(os.getpid)
+            assert False, "Expected RenderQueueFull"
+        except RenderQueueFull:
+            pass
+        assert time.monotonic() - started < 0.1
+
+        for thread in threads:
+            thread.join()
+        assert engine.stats()['rejected'] == 1
+        assert engine.stats()['pending'] == 0
+    finally:
+        engine.shutdown()
+    print("✅ Queue limit applied")
+
+
+def test_queue_wait():
+    """Callers that ask to wait get a slot once one frees up, or RenderQueueFull after the wait"""
+    engine = RenderEngine(workers=1, max_queue=0)
+    try:
+        engine.start()
+        threads = occupy(engine, 0.5, 1)
+        assert engine.run(os.getpid, wait=5)
+        for thread in threads:
+            thread.join()
+
+        threads = occupy(engine, 1.0, 1)
+        started = time.monotonic()
+        try:
+            engine.run(os.getpid, wait=0.2)
+            assert False, "Expected RenderQueueFull"
+        except RenderQueueFull:
+            pass
+        assert 0.2 <= time.monotonic() - started < 0.7
+        for thread in threads:
+            thread.join()
+    finally:
+        engine.shutdown()
+    print("✅ Bounded wait for a free slot")
+
+
+def test_job_timeout():
+    """A slow job times out, and its worker is killed so the slot frees straight away"""
+    engine = RenderEngine(workers=1, max_queue=0, timeout=0.3)
+    try:
+        engine.start()
+        first_pid = engine.run(os.getpid)
+        started = time.time()
+        try:
+            engine.run(time.sleep, 30)
+            assert False, "Expected RenderTimeout"
+        except RenderTimeout:
+            pass
+        assert time.time() - started < 5
+        stats = engine.stats()
+        assert (stats['timeouts'], stats['pending'], stats['failures']) == (1, 0, 0)
+
+        # The next job gets a fresh worker (started here, as its warm-up takes longer than the test timeout)
+        engine.start()
+        assert engine.run(os.getpid) != first_pid
+    finally:
+        engine.shutdown()
+    print("✅ Per-job timeout frees the worker")
+
+
+def test_workers_recycled():
+    """Workers are replaced after the configured number of jobs"""
+    engine = RenderEngine(workers=1, max_jobs_per_worker=2)
+    try:
+        pids = [engine.run(os.getpid) for _ in range(6)]
+    finally:
+        engine.shutdown()
+    assert len(set(pids)) == 3
+    print("✅ Workers recycled after 2 jobs")
+
+
+def test_export_pdf_backpressure():
+    """/export-pdf answers 503 with Retry-After when busy, and 504 when a job times out"""
+    client = app_module.app.test_client()
+    original = app_module.render_engine
+    request_body = {'type': 'comprehensive', 'progressData': SAMPLE_PROGRESS_DATA, 'businessType': 'retail'}
+
+    busy = RenderEngine(workers=1, max_queue=0, retry_after=7)
+    app_module.render_engine = busy
+    try:
+        busy.start()
+        threads = occupy(busy, 1.0, 1)
+        response = client.post('/export-pdf', json=request_body)
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '7'
+        for thread in threads:
+            thread.join()
+
+        response = client.post('/export-pdf', json=request_body)
+        assert response.status_code == 200
+        assert response.data.startswith(b'%PDF')
+    finally:
+        busy.shutdown()
+
+    slow = RenderEngine(workers=1, max_queue=0, timeout=0.001)
+    app_module.render_engine = slow
+    app_module.pdf_cache.clear()  # The same report was just cached
+    try:
+        response = client.post('/export-pdf', json=request_body)
+        assert response.status_code == 504
+    finally:
+        slow.shutdown()
+        app_module.render_engine = original
+
+    # An oversized body is refused before it reaches a worker
+    huge = dict(request_body, progressData={'skills': {'categories': ['x' * 1000] * 2000}})
+    for path in ('/export-pdf', '/export-pdf/batch'):
+        response = client.post(path, json=huge if path == '/export-pdf' else {'reports': [huge]})
+        assert response.status_code == 413
+    print("✅ /export-pdf applies backpressure")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase PDF Render Engine Test")
+    print("=" * 50)
+
+    test_render_in_worker_process()
+    test_queue_limit()
+    test_queue_wait()
+    test_job_timeout()
+    test_workers_recycled()
+    test_export_pdf_backpressure()
+
+    print("\n✅ All tests passed!")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-type report plans (comprehensive, checklist, skills, quiz)
+"""
+
+from pdf_generator import PROGRESS_CHARTS, REPORT_PLANS, RegulaEasePDFGenerator, generate_pdf_report
+from pdf_translations import get_catalog
+from test_pdf_charts import SAMPLE_PROGRESS_DATA
+
+SECTIONS = ('executive_summary', 'progress_charts', 'compliance', 'skills', 'quiz', 'action_items')
+
+
+def render_text(report_type, progress_data=SAMPLE_PROGRESS_DATA, language='en'):
+    """Render a report uncompressed, returning (content, chart panels drawn)"""
+    drawn = []
+
+    class RecordingGenerator(RegulaEasePDFGenerator):
+        def add_progress_charts(self, progress_data, panels=None):
+            drawn.extend(panel['title'] for panel in panels if panel)
+            return super().add_progress_charts(progress_data, panels)
+
+    generator = RecordingGenerator(language=language, chart_backend='native')
+    generator.pdf.set_compression(False)
+    return bytes(generator.generate_report(report_type, progress_data, 'retail')), drawn
+
+
+def test_plans_are_valid():
+    """Every plan only names known sections, charts and progress data"""
+    assert set(REPORT_PLANS) == {'comprehensive', 'checklist', 'skills', 'quiz'}
+    for plan in REPORT_PLANS.values():
+        assert set(plan['sections']) <= set(SECTIONS)
+        assert set(plan['charts']) <= set(PROGRESS_CHARTS)
+        assert set(plan['data']) <= {'checklist', 'skills', 'quiz'}
+        # check_translations.py can't follow the focus key into t()
+        assert plan['focus'] is None or plan['focus'] in get_catalog('en')
+    print("✅ Report plans are valid")
+
+
+def test_focused_reports_draw_their_own_charts():
+    """Each report type draws only the charts and sections relevant to it"""
+    content, drawn = render_text('comprehensive')
+    assert drawn == ['Progress by Category', 'Compliance Tasks', 'Skills by Category', 'Priority Distribution']
+    assert b'Compliance Analysis' in content and b'Skills Analysis' in content
+
+    content, drawn = render_text('checklist')
+    assert drawn == ['Compliance Tasks', 'Priority Distribution']
+    assert b'Compliance Analysis' in content
+    assert b'Skills Analysis' not in content and b'Quiz Analysis' not in content
+    assert b'Executive Summary' not in content
+
+    content, drawn = render_text('skills')
+    assert drawn == ['Skills by Category']
+    assert b'Skills Analysis' in content and b'Compliance Analysis' not in content
+    assert b'compliance tasks' not in content  # Action items only cover skills
+
+    content, drawn = render_text('quiz')
+    assert drawn == []
+    assert b'Quiz Analysis' in content and b'Progress Overview' not in content
+    print("✅ Focused reports draw their own charts and sections")
+
+
+def test_focused_reports_are_smaller():
+    """Focused reports are smaller than the comprehensive report, and unknown types fall back to it"""
+    sizes = {report_type: len(generate_pdf_report(report_type, SAMPLE_PROGRESS_DATA, 'retail',
+                                                  chart_backend='png').getvalue())
+             for report_type in REPORT_PLANS}
+    for report_type in ('checklist', 'skills', 'quiz'):
+        assert sizes[report_type] < sizes['comprehensive'] * 0.6, sizes
+
+    content, drawn = render_text('unknown')
+    assert len(drawn) == 4 and b'Executive Summary' in content
+    print("✅ Focused reports are smaller")
+
+
+def test_focused_report_without_chart_data():
+    """A focused report without data for its charts skips the chart section"""
+    content, drawn = render_text('skills', {'skills': {'totalResources': 5, 'bookmarked': 0}})
+    assert drawn == []
+    assert b'Progress Overview' not in content and b'Skills Analysis' in content
+    print("✅ Chart section skipped without chart data")
+
+
+def test_progress_data_not_a_dict():
+    """Progress data that isn't an object still gives a report without data sections"""
+    for report_type in REPORT_PLANS:
+        for progress_data in ([], ['checklist'], 'checklist', None):
+            content, drawn = render_text(report_type, progress_data)
+            assert content.startswith(b'%PDF') and drawn == []
+    print("✅ Non-object progress data rendered")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase Report Plan Test")
+    print("=" * 50)
+
+    test_plans_are_valid()
+    test_focused_reports_draw_their_own_charts()
+    test_focused_reports_are_smaller()
+    test_focused_report_without_chart_data()
+    test_progress_data_not_a_dict()
+
+    print("\n✅ All tests passed!")
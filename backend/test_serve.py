@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for the production launcher settings
+"""
+
+import os
+
+from serve import DEFAULTS, build_options, parse_args
+
+
+def test_default_options():
+    """Defaults target the shared-cpu-1x VM with threaded Flask workers"""
+    saved = {name: os.environ.pop(name) for name in list(os.environ) if name.startswith('WEB_') or name == 'SERVER_MODE'}
+    try:
+        options = build_options(parse_args([]))
+    finally:
+        os.environ.update(saved)
+
+    assert options['worker_class'] == 'gthread'
+    assert options['workers'] == DEFAULTS['workers']
+    assert options['threads'] == DEFAULTS['threads']
+    assert options['keepalive'] == DEFAULTS['keepalive']
+    assert options['graceful_timeout'] == DEFAULTS['graceful_timeout']
+    print("✅ Default launcher options")
+
+
+def test_environment_and_flag_overrides():
+    """Environment variables override defaults and flags override both"""
+    os.environ['WEB_WORKERS'] = '3'
+    os.environ['WEB_TIMEOUT'] = '60'
+    try:
+        options = build_options(parse_args(['--threads', '4', '--bind', '127.0.0.1:9000']))
+        assert options['workers'] == 3
+        assert options['timeout'] == 60
+        assert options['threads'] == 4
+        assert options['bind'] == '127.0.0.1:9000'
+
+        options = build_options(parse_args(['--workers', '1']))
+        assert options['workers'] == 1
+    finally:
+        del os.environ['WEB_WORKERS']
+        del os.environ['WEB_TIMEOUT']
+    print("✅ Launcher overrides are applied")
+
+
+def test_asgi_mode():
+    """ASGI mode runs uvicorn workers, which don't take a thread count"""
+    options = build_options(parse_args(['--mode', 'asgi']))
+    assert options['worker_class'].endswith('UvicornWorker')
+    assert 'threads' not in options
+    print("✅ ASGI mode uses uvicorn workers")
+
+
+if __name__ == "__main__":
+    test_default_options()
+    test_environment_and_flag_overrides()
+    test_asgi_mode()
+    print("\n✅ All tests passed!")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for fast cold starts
+Checks that the PDF stack is loaded lazily (or prewarmed in the background),
+that startup timings are reported by /stats, and the startup profiler.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from startup_profiler import check_budget, main as profile_startup, parse_importtime
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_script(script, **env):
+    """Run a snippet in a fresh interpreter, so module imports start from scratch"""
+    subprocess.run([sys.executable, '-c', script], check=True, cwd=BACKEND_DIR, env={**os.environ, **env})
+
+
+def test_pdf_stack_loaded_on_first_use():
+    """Importing the app doesn't import fpdf (or httpx, used only in async mode); the first PDF export does"""
+    run_script(
+        "import sys\n"
+        "from app import app\n"
+        "assert 'pdf_generator' not in sys.modules and 'fpdf' not in sys.modules\n"
+        "assert 'httpx' not in sys.modules\n"
+        "client = app.test_client()\n"
+        "assert client.get('/health').status_code == 200\n"
+        "assert 'fpdf' not in sys.modules\n"
+        "response = client.post('/export-pdf', json={'reportType': 'checklist', 'progressData': {}, 'businessType': 'retail'})\n"
+        "assert response.status_code == 200 and response.data.startswith(b'%PDF')\n"
+        "assert 'fpdf' in sys.modules and 'matplotlib' not in sys.modules\n",
+        PDF_RENDER_WORKERS='0'  # Render in-process, so the import shows up here
+    )
+    print("✅ PDF stack is imported on first use")
+
+
+def test_pdf_prewarm():
+    """The prewarm thread loads the PDF stack and records how long it took"""
+    run_script(
+        "import sys\n"
+        "from app import app, start_pdf_prewarm, startup_metrics\n"
+        "thread = start_pdf_prewarm()\n"
+        "assert start_pdf_prewarm() is thread\n"
+        "thread.join(30)\n"
+        "assert 'pdf_generator' in sys.modules\n"
+        "assert startup_metrics['pdf_prewarm'] > 0\n",
+        PDF_PREWARM='true', PDF_RENDER_WORKERS='0'
+    )
+    run_script(
+        "from app import start_pdf_prewarm\n"
+        "assert start_pdf_prewarm() is None\n",
+        PDF_PREWARM='false'
+    )
+    print("✅ PDF prewarm runs in the background and can be disabled")
+
+
+def test_startup_metrics_reported():
+    """/stats reports the app import time and when the first request arrived"""
+    from app import app
+
+    stats = app.test_client().get('/stats').get_json()
+    startup = stats['startup']
+    assert startup['app_import'] > 0
+    assert startup['first_request'] >= startup['app_import']
+    print(f"✅ Startup timings reported (app import {startup['app_import'] * 1000:.0f}ms)")
+
+
+def test_parse_importtime():
+    """Per-module timings are read from `python -X importtime` output"""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     _json\n"
+        "import time:       850 |        970 |   json\n"
+        "import time:      4000 |       9000 | app\n"
+    )
+    modules = parse_importtime(output)
+    assert modules['json'] == {'self_us': 850, 'cumulative_us': 970}
+    assert modules['app']['cumulative_us'] == 9000
+    assert len(modules) == 3
+    print("✅ Import times parsed")
+
+
+def test_startup_budget():
+    """The budget check reports timings and module imports that are over budget"""
+    report = {'process_ready_ms': 420.0, 'app_import_ms': 300.0,
+              'modules': {'app': {'self_ms': 10.0, 'cumulative_ms': 300.0}}}
+    assert check_budget(report, {'process_ready_ms': 500, 'modules': {'app': 400}}) == []
+    failures = check_budget(report, {'process_ready_ms': 400, 'app_import_ms': 500, 'modules': {'app': 250}})
+    assert failures == ["process_ready_ms: 420.0ms > 400ms", "import app: 300.0ms > 250ms"]
+    print("✅ Startup budget check")
+
+
+def test_startup_profiler_report():
+    """A profile run writes a JSON report and fails when startup is over budget"""
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, 'startup.json')
+        budget = os.path.join(directory, 'budget.json')
+        with open(budget, 'w') as f:
+            json.dump({'process_ready_ms': 0.001}, f)
+
+        assert profile_startup(['--runs', '1', '--output', output, '--budget', budget]) == 1
+        with open(output) as f:
+            report = json.load(f)
+
+    assert report['process_ready_ms'] > report['app_import_ms'] > 0
+    assert report['modules']['app']['cumulative_ms'] > 0
+    assert 'pdf_generator' in report['modules']
+    assert report['budget']['passed'] is False
+    print(f"✅ Startup profile: ready in {report['process_ready_ms']:.0f}ms")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("RegulaEase Startup Test")
+    print("=" * 50)
+
+    test_pdf_stack_loaded_on_first_use()
+    test_pdf_prewarm()
+    test_startup_metrics_reported()
+    test_parse_importtime()
+    test_startup_budget()
+    test_startup_profiler_report()
+
+    print("\n✅ All tests passed!")